@@ -0,0 +1,54 @@
+import { NextResponse } from 'next/server'
+import { loadFeaturesPayload } from '@/lib/featuresPayload'
+import { servePrebuilt } from '@/lib/prebuiltPayloads'
+
+/**
+ * GET /api/bdd/features/<featureId>
+ *
+ * One feature with its scenarios and steps (ids as in /api/bdd/features).
+ * Served from the payloads prebuilt by scripts/build_api_snapshots.py while
+ * they are fresh, otherwise picked from the features route's in-process
+ * payload.
+ */
+export async function GET(
+  request: Request,
+  { params }: { params: Promise<{ featureId: string }> }
+) {
+  const { featureId } = await params
+
+  const prebuilt = servePrebuilt(request, `feature/${featureId}`)
+  if (prebuilt) {
+    return prebuilt
+  }
+
+  try {
+    const { etag, payload } = loadFeaturesPayload()
+    const feature = payload.features.find(f => f.id === featureId)
+    if (!feature) {
+      return NextResponse.json({
+        error: `Feature "${featureId}" not found`
+      }, { status: 404 })
+    }
+
+    const headers = {
+      // The whole payload's ETag: any change to it may change this feature
+      ETag: etag,
+      'Cache-Control': 'no-cache'
+    }
+    const ifNoneMatch = request.headers.get('if-none-match')
+    if (ifNoneMatch && ifNoneMatch.split(',').some(tag => tag.trim() === etag)) {
+      return new NextResponse(null, { status: 304, headers })
+    }
+
+    return NextResponse.json({ feature, generated_at: payload.generated_at }, { headers })
+
+  } catch (error) {
+    console.error(`Error getting BDD feature ${featureId}:`, error)
+
+    return NextResponse.json({
+      error: "Failed to load BDD features data",
+      message: error instanceof Error ? error.message : "Unknown error",
+      generated_at: new Date().toISOString()
+    }, { status: 500 })
+  }
+}
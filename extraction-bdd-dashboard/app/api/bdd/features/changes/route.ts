@@ -0,0 +1,50 @@
+import { NextResponse } from 'next/server'
+import { changesSince, readRevisionHead } from '@/lib/behaveRevisions'
+
+/**
+ * GET /api/bdd/features/changes?since=<rev>[&feature=<featureId>]
+ *
+ * Features, scenarios and steps that changed in behave results after
+ * revision `since` (ids as in /api/bdd/features), from the revision log
+ * written by scripts/watch_behave_revisions.py. Without `since` only the
+ * current revision is returned, to start polling from.
+ */
+export async function GET(request: Request) {
+  const head = readRevisionHead()
+  if (!head) {
+    return NextResponse.json({
+      error: "Revision log not found",
+      message: "Run scripts/watch_behave_revisions.py (or poll /api/bdd/features)"
+    }, { status: 503 })
+  }
+
+  const params = new URL(request.url).searchParams
+  const sinceParam = params.get('since')
+  if (sinceParam === null) {
+    return NextResponse.json({ rev: head.rev, oldest: head.oldest, generated_at: head.generated_at },
+      { headers: { 'Cache-Control': 'no-cache' } })
+  }
+
+  const since = Number(sinceParam)
+  if (!Number.isInteger(since) || since < 0) {
+    return NextResponse.json({ error: `Invalid since "${sinceParam}"` }, { status: 400 })
+  }
+
+  // The response for a given URL only changes when a new revision lands
+  const etag = `W/"rev-${head.rev}"`
+  const headers = { ETag: etag, 'Cache-Control': 'no-cache' }
+  const ifNoneMatch = request.headers.get('if-none-match')
+  if (ifNoneMatch && ifNoneMatch.split(',').some(tag => tag.trim() === etag)) {
+    return new NextResponse(null, { status: 304, headers })
+  }
+
+  try {
+    return NextResponse.json(changesSince(head, since, params.get('feature')), { headers })
+  } catch (error) {
+    console.error('Error reading revision log:', error)
+    return NextResponse.json({
+      error: "Failed to read revision log",
+      message: error instanceof Error ? error.message : 'Unknown error'
+    }, { status: 500 })
+  }
+}
@@ -1,7 +1,14 @@
 import { NextResponse } from 'next/server'
+import { servePrebuilt } from '@/lib/prebuiltPayloads'
 
-export async function GET() {
+export async function GET(request: Request) {
   try {
+    // bdd_progress computed from behave results by scripts/build_api_snapshots.py
+    const prebuilt = servePrebuilt(request, 'progress')
+    if (prebuilt) {
+      return prebuilt
+    }
+
     // Mock data matching the expected BDDProgressData interface
     return NextResponse.json({
       bdd_progress: {
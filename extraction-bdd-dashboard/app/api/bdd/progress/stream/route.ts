@@ -0,0 +1,63 @@
+import { subscribeStepStream } from '@/lib/stepStream'
+
+export const dynamic = 'force-dynamic'
+
+// Comment lines keep proxies from closing an idle connection between steps
+const KEEPALIVE_MS = 15000
+
+/**
+ * GET /api/bdd/progress/stream
+ *
+ * Server-sent events of the live behave run: one `data:` JSON event per line
+ * of the step stream written by features/step_stream.py, starting with the
+ * latest state of the current run. Reconnecting clients (Last-Event-ID) only
+ * receive what changed since their last event.
+ */
+export async function GET(request: Request) {
+  const encoder = new TextEncoder()
+  let cleanup = () => {}
+
+  const body = new ReadableStream<Uint8Array>({
+    start(controller) {
+      const send = (chunk: string) => {
+        try {
+          controller.enqueue(encoder.encode(chunk))
+        } catch {
+          cleanup()
+        }
+      }
+
+      send('retry: 5000\n\n')
+      const unsubscribe = subscribeStepStream(
+        message => send(`id: ${message.id}\ndata: ${message.data}\n\n`),
+        request.headers.get('last-event-id')
+      )
+      const keepalive = setInterval(() => send(': keepalive\n\n'), KEEPALIVE_MS)
+
+      cleanup = () => {
+        unsubscribe()
+        clearInterval(keepalive)
+      }
+      request.signal.addEventListener('abort', () => {
+        cleanup()
+        try {
+          controller.close()
+        } catch {
+          // Already closed by the client
+        }
+      })
+    },
+    cancel() {
+      cleanup()
+    }
+  })
+
+  return new Response(body, {
+    headers: {
+      'Content-Type': 'text/event-stream; charset=utf-8',
+      'Cache-Control': 'no-cache, no-transform',
+      Connection: 'keep-alive',
+      'X-Accel-Buffering': 'no'
+    }
+  })
+}
@@ -9,10 +9,17 @@
 
 import { NextResponse } from 'next/server';
 import { getCachedDashboardData } from '@/lib/skateboard-filesystem-parser';
+import { servePrebuilt } from '@/lib/prebuiltPayloads';
 import path from 'path';
 
-export async function GET() {
+export async function GET(request: Request) {
   try {
+    // Payload prebuilt by scripts/build_api_snapshots.py, when one exists
+    const prebuilt = servePrebuilt(request, 'skateboard');
+    if (prebuilt) {
+      return prebuilt;
+    }
+
     // Root directory = repo root (2 levels up from app/api/skateboard/dashboard)
     const rootDir = path.resolve(process.cwd(), '../..');
 
@@ -2,7 +2,8 @@
 
 import { DashboardHeader, DashboardMetrics } from "../../components/DashboardHeader"
 import { UniversalCard, CardProps } from "../../components/UniversalCard"
-import { useState, useEffect } from "react"
+import { useState, useEffect, useRef } from "react"
+import { applyStreamEvent, createLiveRun, expireSilentWorkers, overlayLiveRun } from "../lib/liveSteps"
 
 interface BDDProgressData {
   bdd_progress: {
@@ -256,6 +257,28 @@ export default function BDDProgressPage() {
   const [bddFeatures, setBddFeatures] = useState<RealBDDFeature[] | null>(null)
   const [expandedCardId, setExpandedCardId] = useState<string | null>(null)
 
+  // Live behave run from the step stream, laid over the last full results
+  const liveRun = useRef(createLiveRun())
+  const [, setLiveVersion] = useState(0)
+
+  useEffect(() => {
+    const source = new EventSource('/api/bdd/progress/stream')
+    let pending: ReturnType<typeof setTimeout> | null = null
+    source.onmessage = (message) => {
+      if (applyStreamEvent(liveRun.current, JSON.parse(message.data)) && !pending) {
+        // Batch bursts (e.g. catching up on connect) into one render
+        pending = setTimeout(() => {
+          pending = null
+          setLiveVersion(version => version + 1)
+        }, 250)
+      }
+    }
+    return () => {
+      source.close()
+      if (pending) clearTimeout(pending)
+    }
+  }, [])
+
   useEffect(() => {
     const fetchProgressData = async () => {
       try {
@@ -305,8 +328,17 @@ export default function BDDProgressPage() {
     }
 
     fetchProgressData()
-    // Refresh every 30 seconds for real-time updates
-    const interval = setInterval(fetchProgressData, 30000)
+    // Refresh every 30 seconds; while a run is streaming live, the results
+    // file only changes when it ends, so reloads wait until then (or until
+    // its workers have gone silent, e.g. killed before reporting the end)
+    const interval = setInterval(() => {
+      if (expireSilentWorkers(liveRun.current)) {
+        setLiveVersion(version => version + 1)
+      }
+      if (!liveRun.current.activeWorkers.size) {
+        fetchProgressData()
+      }
+    }, 30000)
     return () => clearInterval(interval)
   }, [])
 
@@ -351,7 +383,7 @@ export default function BDDProgressPage() {
   // Don't block rendering on API errors - show dashboard with mock data
 
   // Calculate real metrics from bddFeatures (Wink data)
-  const realFeatures = bddFeatures || mockBDDFeatures
+  const realFeatures = overlayLiveRun(bddFeatures || mockBDDFeatures, liveRun.current)
   const totalFeatures = realFeatures.length
   const completedFeatures = realFeatures.filter(f => f.status === 'completed').length
   const totalScenarios = realFeatures.reduce((sum, f) => sum + f.scenarios.length, 0)
@@ -411,6 +443,7 @@ export default function BDDProgressPage() {
       return {
         id: `BDD-${String(idx + 1).padStart(2, '0')}`,
         title: feature.name.replace(/_/g, ' ').toUpperCase(),
+        name: feature.name,
         type: 'feature' as const,
         status: feature.status === 'completed' ? 'PASSING' :
                 feature.status === 'in_progress' ? 'IN PROGRESS' :
@@ -428,10 +461,10 @@ export default function BDDProgressPage() {
     });
   };
 
-  const featureCards = convertToCardProps(bddFeatures || mockBDDFeatures);
+  const featureCards = convertToCardProps(realFeatures);
 
   return (
-    <div className="min-h-screen bg-gray-900 text-green-400 font-mono">
+    <div className="min-h-screen bg-gray-900 text-green-400 font-mono" data-testid="bdd-progress-dashboard">
       {/* API Error Warning (if any) */}
       {error && (
         <div className="mb-4 border border-red-500 p-3 bg-red-900/20 text-red-300 text-sm">
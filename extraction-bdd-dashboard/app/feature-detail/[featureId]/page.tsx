@@ -4,6 +4,7 @@ import { DashboardHeader, DashboardMetrics } from "../../../components/Dashboard
 import { UniversalCard, CardProps } from "../../../components/UniversalCard"
 import { useState, useEffect } from "react"
 import { useRouter } from "next/navigation"
+import { applyFeatureChanges, FeatureChanges } from "../../lib/featureChanges"
 
 interface BDDFeature {
   id: string
@@ -37,15 +38,31 @@ export default function FeatureDetailPage({ params }: FeatureDetailPageProps) {
 
   useEffect(() => {
     if (!featureId) return
+    let cancelled = false
+    // Revision of the change feed the loaded data is current to (null when
+    // the feed is not running; the page then loads once as before)
+    let rev: number | null = null
 
-    async function fetchFeatureData() {
+    async function fetchRevision(): Promise<number | null> {
       try {
-        setLoading(true)
+        const response = await fetch('/api/bdd/features/changes')
+        return response.ok ? (await response.json()).rev : null
+      } catch {
+        return null
+      }
+    }
+
+    async function fetchFeatureData(showLoading = true) {
+      try {
+        if (showLoading) setLoading(true)
+        // Take the revision first: changes landing in between are re-applied
+        rev = await fetchRevision()
         const response = await fetch('/api/bdd/features')
         if (!response.ok) {
           throw new Error(`API error: ${response.status}`)
         }
         const data = await response.json()
+        if (cancelled) return
 
         // Store all features for navigation
         setAllFeatures(data.features)
@@ -66,7 +83,34 @@ export default function FeatureDetailPage({ params }: FeatureDetailPageProps) {
       }
     }
 
+    // Poll only what changed for this feature since the last revision
+    async function fetchFeatureChanges() {
+      if (rev === null) return
+      try {
+        const response = await fetch(
+          `/api/bdd/features/changes?since=${rev}&feature=${encodeURIComponent(featureId!)}`
+        )
+        if (!response.ok) return
+        const changes: FeatureChanges = await response.json()
+        if (cancelled) return
+        if (changes.reset) {
+          await fetchFeatureData(false)
+          return
+        }
+        rev = changes.rev
+        setFeature(current => current && applyFeatureChanges(current, changes))
+        setAllFeatures(current => current.map(f => f.id === featureId ? applyFeatureChanges(f, changes) : f))
+      } catch (err) {
+        console.warn('Change feed poll failed:', err)
+      }
+    }
+
     fetchFeatureData()
+    const interval = setInterval(fetchFeatureChanges, 5000)
+    return () => {
+      cancelled = true
+      clearInterval(interval)
+    }
   }, [featureId])
 
   // Navigation helpers
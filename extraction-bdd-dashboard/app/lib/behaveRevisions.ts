@@ -0,0 +1,170 @@
+import { closeSync, openSync, readFileSync, readSync, statSync } from 'fs'
+import { join } from 'path'
+import type { FeatureChanges, FeatureRecord, RemovedRecords, ScenarioRecord, StepRecord } from './featureChanges'
+
+/**
+ * Revision log written by scripts/watch_behave_revisions.py
+ *
+ * head.json names the newest revision and the oldest one still in
+ * revisions.jsonl. The log is only appended to (or atomically replaced when
+ * compacted), so it is read incrementally: only bytes past the last complete
+ * line already parsed.
+ */
+
+// Must match REVISIONS_SCHEMA in scripts/watch_behave_revisions.py
+const REVISIONS_SCHEMA = 1
+
+const REVISIONS_DIR = join(process.cwd(), 'public', 'bdd-data', 'revisions')
+const HEAD_PATH = join(REVISIONS_DIR, 'head.json')
+
+export interface RevisionHead {
+  schema: number
+  rev: number
+  oldest: number
+  generated_at: string
+  log: string
+}
+
+interface Revision {
+  rev: number
+  generated_at: string
+  features: FeatureRecord[]
+  scenarios: ScenarioRecord[]
+  steps: StepRecord[]
+  removed: RemovedRecords
+}
+
+let headCache: { mtimeMs: number; head: RevisionHead | null } | null = null
+let logCache: { path: string; ino: number; offset: number; revisions: Revision[] } | null = null
+
+/**
+ * Current head, re-read only when head.json changes
+ */
+export function readRevisionHead(): RevisionHead | null {
+  let mtimeMs: number
+  try {
+    mtimeMs = statSync(HEAD_PATH).mtimeMs
+  } catch {
+    return null
+  }
+
+  if (!headCache || headCache.mtimeMs !== mtimeMs) {
+    let head: RevisionHead | null = null
+    try {
+      const parsed = JSON.parse(readFileSync(HEAD_PATH, 'utf-8')) as RevisionHead
+      head = parsed.schema === REVISIONS_SCHEMA ? parsed : null
+    } catch (error) {
+      console.error('Error reading revision head:', error)
+    }
+    headCache = { mtimeMs, head }
+  }
+  return headCache.head
+}
+
+function readRevisions(head: RevisionHead): Revision[] {
+  const logPath = join(REVISIONS_DIR, head.log)
+  const { ino, size } = statSync(logPath)
+
+  // Compaction replaces the file (new inode); otherwise only new bytes are read
+  if (!logCache || logCache.path !== logPath || logCache.ino !== ino || size < logCache.offset) {
+    logCache = { path: logPath, ino, offset: 0, revisions: [] }
+  }
+  if (size > logCache.offset) {
+    const buffer = Buffer.alloc(size - logCache.offset)
+    const fd = openSync(logPath, 'r')
+    try {
+      readSync(fd, buffer, 0, buffer.length, logCache.offset)
+    } finally {
+      closeSync(fd)
+    }
+    // A line still being written is picked up on the next read
+    const end = buffer.lastIndexOf(0x0a) + 1
+    for (const line of buffer.subarray(0, end).toString('utf-8').split('\n')) {
+      if (line) {
+        logCache.revisions.push(JSON.parse(line) as Revision)
+      }
+    }
+    logCache.offset += end
+  }
+  return logCache.revisions
+}
+
+/**
+ * Everything that changed after revision `since`, merged so each record
+ * appears once in its latest state, optionally for one feature only.
+ * Returns a reset when the revisions after `since` are no longer in the log.
+ */
+export function changesSince(head: RevisionHead, since: number, featureId?: string | null): FeatureChanges {
+  const changes: FeatureChanges = {
+    rev: head.rev,
+    since,
+    reset: false,
+    features: [],
+    scenarios: [],
+    steps: [],
+    removed: { features: [], scenarios: [], steps: [] }
+  }
+  if (since > head.rev || since < head.oldest - 1) {
+    return { ...changes, reset: true }
+  }
+
+  const features = new Map<string, FeatureRecord>()
+  const scenarios = new Map<string, ScenarioRecord>()
+  const steps = new Map<string, StepRecord>()
+  const removedFeatures = new Set<string>()
+  const removedScenarios = new Map<string, RemovedRecords['scenarios'][number]>()
+  const removedSteps = new Map<string, RemovedRecords['steps'][number]>()
+  const wanted = (id: string) => !featureId || id === featureId
+
+  for (const revision of readRevisions(head)) {
+    if (revision.rev <= since || revision.rev > head.rev) {
+      continue
+    }
+    for (const id of revision.removed.features) {
+      if (wanted(id)) {
+        features.delete(id)
+        removedFeatures.add(id)
+      }
+    }
+    for (const removed of revision.removed.scenarios) {
+      if (wanted(removed.feature_id)) {
+        scenarios.delete(removed.id)
+        removedScenarios.set(removed.id, removed)
+      }
+    }
+    for (const removed of revision.removed.steps) {
+      if (wanted(removed.feature_id)) {
+        steps.delete(removed.id)
+        removedSteps.set(removed.id, removed)
+      }
+    }
+    for (const feature of revision.features) {
+      if (wanted(feature.id)) {
+        removedFeatures.delete(feature.id)
+        features.set(feature.id, feature)
+      }
+    }
+    for (const scenario of revision.scenarios) {
+      if (wanted(scenario.feature_id)) {
+        removedScenarios.delete(scenario.id)
+        scenarios.set(scenario.id, scenario)
+      }
+    }
+    for (const step of revision.steps) {
+      if (wanted(step.feature_id)) {
+        removedSteps.delete(step.id)
+        steps.set(step.id, step)
+      }
+    }
+  }
+
+  changes.features = Array.from(features.values())
+  changes.scenarios = Array.from(scenarios.values())
+  changes.steps = Array.from(steps.values())
+  changes.removed = {
+    features: Array.from(removedFeatures),
+    scenarios: Array.from(removedScenarios.values()),
+    steps: Array.from(removedSteps.values())
+  }
+  return changes
+}
@@ -0,0 +1,105 @@
+/**
+ * Change feed of behave results (GET /api/bdd/features/changes)
+ *
+ * Records are the features/scenarios/steps of /api/bdd/features with their
+ * children lifted out: features without `scenarios`, scenarios without
+ * `steps`, and steps carrying their scenario_id and feature_id. Safe to
+ * import from client components.
+ */
+
+export type FeatureRecord = { id: string } & Record<string, any>
+export type ScenarioRecord = { id: string; feature_id: string } & Record<string, any>
+export type StepRecord = { id: string; scenario_id: string; feature_id: string } & Record<string, any>
+
+export interface RemovedRecords {
+  features: string[]
+  scenarios: { id: string; feature_id: string }[]
+  steps: { id: string; scenario_id: string; feature_id: string }[]
+}
+
+export interface FeatureChanges {
+  // Newest revision; pass it back as ?since= on the next poll
+  rev: number
+  since: number | null
+  // The client is too far behind (or the log restarted): refetch
+  // /api/bdd/features and continue from `rev`
+  reset: boolean
+  features: FeatureRecord[]
+  scenarios: ScenarioRecord[]
+  steps: StepRecord[]
+  removed: RemovedRecords
+}
+
+interface FeatureLike {
+  id: string
+  scenarios: any[]
+}
+
+function stepIndex(id: string): number {
+  // step_<feature>_<scenario>_<step>
+  return parseInt(id.slice(id.lastIndexOf('_') + 1), 10)
+}
+
+function scenarioIndex(id: string): number {
+  // <feature id>_s<n>
+  return parseInt(id.slice(id.lastIndexOf('_s') + 2), 10)
+}
+
+/**
+ * A copy of `feature` with the changes for it applied (other features'
+ * records are ignored). Unchanged scenarios keep their identity.
+ */
+export function applyFeatureChanges<T extends FeatureLike>(feature: T, changes: FeatureChanges): T {
+  const own = <R extends { feature_id: string }>(records: R[]) => records.filter(r => r.feature_id === feature.id)
+
+  const featureRecord = changes.features.find(f => f.id === feature.id)
+  const scenarioRecords = own(changes.scenarios)
+  const stepRecords = own(changes.steps)
+  const removedScenarios = new Set(own(changes.removed.scenarios).map(s => s.id))
+  const removedSteps = new Set(own(changes.removed.steps).map(s => s.id))
+  if (!featureRecord && !scenarioRecords.length && !stepRecords.length &&
+      !removedScenarios.size && !removedSteps.size) {
+    return feature
+  }
+
+  const scenarios = new Map<string, any>()
+  for (const scenario of feature.scenarios) {
+    if (!removedScenarios.has(scenario.id)) {
+      scenarios.set(scenario.id, scenario)
+    }
+  }
+  for (const record of scenarioRecords) {
+    scenarios.set(record.id, { ...record, steps: scenarios.get(record.id)?.steps || [] })
+  }
+
+  const stepsByScenario = new Map<string, StepRecord[]>()
+  for (const step of stepRecords) {
+    const list = stepsByScenario.get(step.scenario_id) || []
+    list.push(step)
+    stepsByScenario.set(step.scenario_id, list)
+  }
+
+  const updated = Array.from(scenarios.values()).map(scenario => {
+    const changedSteps = stepsByScenario.get(scenario.id) || []
+    const dropsSteps = scenario.steps.some((s: any) => removedSteps.has(s.id))
+    if (!changedSteps.length && !dropsSteps) {
+      return scenario
+    }
+    const steps = new Map<string, any>()
+    for (const step of scenario.steps) {
+      if (!removedSteps.has(step.id)) {
+        steps.set(step.id, step)
+      }
+    }
+    for (const { scenario_id, feature_id, ...step } of changedSteps) {
+      steps.set(step.id, step)
+    }
+    return {
+      ...scenario,
+      steps: Array.from(steps.values()).sort((a, b) => stepIndex(a.id) - stepIndex(b.id))
+    }
+  })
+  updated.sort((a, b) => scenarioIndex(a.id) - scenarioIndex(b.id))
+
+  return { ...feature, ...(featureRecord || {}), scenarios: updated }
+}
@@ -0,0 +1,178 @@
+/**
+ * Live behave run state from GET /api/bdd/progress/stream, laid over the
+ * features of /api/bdd/features. Safe to import from client components.
+ *
+ * Scenarios are matched by feature id and scenario name, steps by their
+ * index in the scenario (Background steps first, as in behave's JSON), so
+ * a run sharded across workers lands on the same cards.
+ *
+ * A worker counts as active from its `run` event until `worker_end`, or
+ * until it has been silent for WORKER_SILENCE_MS: a worker killed before
+ * its formatter closed never sends `worker_end`, and its last `run` event
+ * stays in the stream's replay.
+ */
+
+// Longer than any single step is expected to take
+export const WORKER_SILENCE_MS = 2 * 60 * 1000
+
+export interface LiveStep {
+  status: string
+  duration?: number
+  error_message?: string
+}
+
+export interface LiveScenario {
+  // 'in_progress' until the scenario ends, then behave's status
+  status: string
+  worker: number
+  steps: Map<number, LiveStep>
+}
+
+export interface LiveRun {
+  runId: string | null
+  activeWorkers: Set<number>
+  // Epoch ms of each active worker's latest event (the event's own ts)
+  workerSeenAt: Map<number, number>
+  scenarios: Map<string, LiveScenario>
+}
+
+export function createLiveRun(): LiveRun {
+  return { runId: null, activeWorkers: new Set(), workerSeenAt: new Map(), scenarios: new Map() }
+}
+
+function clearRun(run: LiveRun) {
+  run.activeWorkers.clear()
+  run.workerSeenAt.clear()
+  run.scenarios.clear()
+}
+
+function scenarioKey(featureId: string, scenario: string): string {
+  return `${featureId}\u0000${scenario}`
+}
+
+function liveScenario(run: LiveRun, event: any): LiveScenario {
+  const key = scenarioKey(event.feature_id, event.scenario)
+  let scenario = run.scenarios.get(key)
+  if (!scenario) {
+    scenario = { status: 'in_progress', worker: event.worker, steps: new Map() }
+    run.scenarios.set(key, scenario)
+  }
+  scenario.worker = event.worker
+  return scenario
+}
+
+/**
+ * Apply one stream event; returns whether anything visible changed
+ */
+export function applyStreamEvent(run: LiveRun, event: any): boolean {
+  if (event.type === 'run' && event.run_id !== run.runId) {
+    run.runId = event.run_id
+    clearRun(run)
+  }
+  if (typeof event.ts === 'number' && (event.type === 'run' || run.activeWorkers.has(event.worker))) {
+    const seenAt = event.ts * 1000
+    if (seenAt > (run.workerSeenAt.get(event.worker) || 0)) {
+      run.workerSeenAt.set(event.worker, seenAt)
+    }
+  }
+
+  switch (event.type) {
+    case 'reset':
+      run.runId = null
+      clearRun(run)
+      return true
+    case 'run':
+      run.activeWorkers.add(event.worker)
+      return true
+    case 'worker_end':
+      run.activeWorkers.delete(event.worker)
+      run.workerSeenAt.delete(event.worker)
+      return true
+    case 'scenario': {
+      const scenario = liveScenario(run, event)
+      scenario.status = 'in_progress'
+      scenario.steps.clear()
+      return true
+    }
+    case 'scenario_end':
+      liveScenario(run, event).status = event.status
+      return true
+    case 'step': {
+      if (event.index === null || event.index === undefined) {
+        return false
+      }
+      const step: LiveStep = { status: event.status, duration: event.duration }
+      if (event.error_message) {
+        step.error_message = event.error_message
+      }
+      liveScenario(run, event).steps.set(event.index, step)
+      return true
+    }
+    default:
+      return false
+  }
+}
+
+/**
+ * Drop workers silent for longer than WORKER_SILENCE_MS, with the scenarios
+ * they left in progress; returns whether any was dropped
+ */
+export function expireSilentWorkers(run: LiveRun, now: number = Date.now()): boolean {
+  const silent = Array.from(run.activeWorkers).filter(worker =>
+    now - (run.workerSeenAt.get(worker) || 0) > WORKER_SILENCE_MS)
+  if (!silent.length) {
+    return false
+  }
+
+  silent.forEach(worker => {
+    run.activeWorkers.delete(worker)
+    run.workerSeenAt.delete(worker)
+  })
+  run.scenarios.forEach((scenario, key) => {
+    if (scenario.status === 'in_progress' && silent.includes(scenario.worker)) {
+      run.scenarios.delete(key)
+    }
+  })
+  return true
+}
+
+/**
+ * Features with the live run's scenario and step statuses applied; features
+ * the run has not touched are returned as they are
+ */
+export function overlayLiveRun<T extends { id: string; scenarios: any[] }>(features: T[], run: LiveRun): T[] {
+  if (!run.scenarios.size) {
+    return features
+  }
+  return features.map(feature => {
+    let touched = false
+    const scenarios = feature.scenarios.map(scenario => {
+      const live = run.scenarios.get(scenarioKey(feature.id, scenario.name))
+      if (!live) {
+        return scenario
+      }
+      touched = true
+      return {
+        ...scenario,
+        status: live.status,
+        passed: live.status === 'passed',
+        steps: scenario.steps.map((step: any, index: number) => {
+          const liveStep = live.steps.get(index)
+          return liveStep ? { ...step, ...liveStep } : step
+        })
+      }
+    })
+    if (!touched) {
+      return feature
+    }
+
+    const passed = scenarios.filter(s => s.status === 'passed').length
+    return {
+      ...feature,
+      status: scenarios.some(s => s.status === 'in_progress') ? 'in_progress' : (feature as any).status,
+      overall_progress: scenarios.length ? Math.round((passed / scenarios.length) * 100) : 0,
+      passedScenarios: passed,
+      scenarios
+    }
+  })
+}
@@ -0,0 +1,211 @@
+import { stat, readFile } from 'fs/promises';
+import { existsSync } from 'fs';
+import { join } from 'path';
+
+/**
+ * Mockup option files from specs/mockups, shared by /api/bdd/mockups
+ *
+ * The mockups directory is resolved once (MOCKUP_DIR, then ../specs/mockups,
+ * then ../../specs/mockups from the dashboard; features/mockups.py uses the
+ * same order). Parsed files are cached and re-read only when their mtime or
+ * size changes; concurrent requests for a file share one read.
+ */
+
+// TypeScript types for mockup data structures
+export interface MockupJTBD {
+  statement: string;
+  target_time: string;
+  current_time: string;
+  success_rate: string;
+  bdd_features_complete: string;
+  evidence_signals: string;
+  target_outcome?: string;
+}
+
+export interface Enablement {
+  id?: string;
+  name: string;
+  scenario?: string;
+  journey_phase?: string;
+  steps_file: string | null;
+  steps_implemented?: string;
+  status: string;
+  icon: string;
+  value_delivered?: string;
+  value?: string;
+  step_details?: string[];
+  enables?: string;
+  implementation_file?: string;
+}
+
+export interface SharedStep {
+  step_definition?: string;
+  definition?: string;
+  status: string;
+  icon: string;
+  used_by_scenarios?: string[];
+  reused_by?: string;
+  features_blocked?: string[];
+  blocker_impact?: {
+    total_features_blocked: number;
+    total_scenarios_blocked: number;
+    percentage_of_suite: string;
+    roi_if_implemented?: string;
+    roi_if_completed?: string;
+  };
+  enables?: string;
+  implemented?: string;
+  missing?: string;
+  features_waiting?: string[];
+}
+
+export interface PMEMInsight {
+  available: boolean;
+  score?: number;
+  reason?: string;
+  pm_question?: string;
+  answer?: string;
+  time_to_answer?: string;
+  time_to_insight?: string;
+  message?: string;
+  clarity?: string;
+  dashboard_shows?: any;
+  if_implemented?: any;
+  fast_track_options?: any;
+  current_coverage?: string;
+  missing_steps?: string[];
+  sprint_projection?: string;
+  can_ship_now?: string;
+  roi_ranking?: any[];
+  message_technical?: string;
+  message_business?: string;
+  clarity_score?: number;
+  completeness_score?: number;
+}
+
+export interface MockupData {
+  option: string;
+  name: string;
+  description: string;
+  jtbd: MockupJTBD;
+  features: any[];
+  pm_em_insights: {
+    blocker_identification: PMEMInsight;
+    impact_projection?: PMEMInsight;
+    fast_track_analysis: PMEMInsight;
+    delivery_readiness: PMEMInsight;
+    roi_guidance?: PMEMInsight;
+    stakeholder_reporting: PMEMInsight;
+    progress_projection?: PMEMInsight;
+  };
+  scoring_summary?: {
+    blocker_visibility: number;
+    impact_projection: number;
+    fast_track_analysis: number;
+    delivery_readiness: number;
+    roi_guidance: number;
+    stakeholder_reporting: number;
+    total_score: string;
+    average_score: number;
+    passing_threshold: string;
+    verdict: string;
+  };
+  strengths?: string[];
+  weaknesses?: string[];
+}
+
+export const MOCKUP_FILES: Record<string, string> = {
+  'option_a': 'option_a_enablements.json',
+  'option_b': 'option_b_shared_steps.json',
+  'option_hybrid': 'option_hybrid.json'
+};
+
+export const MOCKUP_MODES = Object.keys(MOCKUP_FILES);
+
+export class MockupLoadError extends Error {
+  constructor(message: string, public attemptedPaths: string[]) {
+    super(message);
+    this.name = 'MockupLoadError';
+  }
+}
+
+interface CachedMockup {
+  mtimeMs: number;
+  size: number;
+  data: MockupData;
+}
+
+let mockupDir: string | null = null;
+const cache = new Map<string, CachedMockup>();
+const inFlight = new Map<string, Promise<MockupData>>();
+
+function candidateDirs(): string[] {
+  const candidates = [
+    join(process.cwd(), '..', 'specs', 'mockups'),
+    join(process.cwd(), '..', '..', 'specs', 'mockups')
+  ];
+  if (process.env.MOCKUP_DIR) {
+    candidates.unshift(process.env.MOCKUP_DIR);
+  }
+  return candidates;
+}
+
+/**
+ * Directory holding the mockup files; remembered once found
+ */
+export function resolveMockupDir(): string | null {
+  if (!mockupDir) {
+    mockupDir = candidateDirs().find(dir => existsSync(dir)) || null;
+  }
+  return mockupDir;
+}
+
+async function readMockup(mode: string, filePath: string): Promise<MockupData> {
+  const stats = await stat(filePath);
+  const cached = cache.get(mode);
+  if (cached && cached.mtimeMs === stats.mtimeMs && cached.size === stats.size) {
+    return cached.data;
+  }
+  const data: MockupData = JSON.parse(await readFile(filePath, 'utf-8'));
+  cache.set(mode, { mtimeMs: stats.mtimeMs, size: stats.size, data });
+  return data;
+}
+
+/**
+ * Parsed mockup for one mode (option_a, option_b, option_hybrid). The
+ * result is shared between requests and must not be modified.
+ */
+export async function loadMockup(mode: string): Promise<MockupData> {
+  const filename = MOCKUP_FILES[mode];
+  if (!filename) {
+    throw new Error(`Invalid mode: ${mode}. Valid modes are: ${MOCKUP_MODES.join(', ')}`);
+  }
+  const dir = resolveMockupDir();
+  if (!dir) {
+    throw new MockupLoadError('Mockup directory not found', candidateDirs().map(d => join(d, filename)));
+  }
+
+  let pending = inFlight.get(mode);
+  if (!pending) {
+    const filePath = join(dir, filename);
+    pending = readMockup(mode, filePath)
+      .catch(error => {
+        throw new MockupLoadError(error instanceof Error ? error.message : 'Unknown error', [filePath]);
+      })
+      .finally(() => inFlight.delete(mode));
+    inFlight.set(mode, pending);
+  }
+  return pending;
+}
+
+/**
+ * Several modes at once, read in parallel
+ */
+export async function loadMockups(modes: string[]): Promise<Record<string, MockupData>> {
+  const data = await Promise.all(modes.map(mode => loadMockup(mode)));
+  const byMode: Record<string, MockupData> = {};
+  modes.forEach((mode, index) => {
+    byMode[mode] = data[index];
+  });
+  return byMode;
+}
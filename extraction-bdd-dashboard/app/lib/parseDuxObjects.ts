@@ -107,49 +107,129 @@ export function loadAllResults(duxGovPath: string): DuxResult[] {
 }
 
 /**
- * Match feature/scenario to DUX Behavior object
- * Returns evidence count from linked Behavior
+ * Feature keyword -> Behavior keyword pairs used to link features to
+ * Behavior objects. This is experimental - will need refinement
  */
-export function getEvidenceCountForFeature(
-  featureName: string,
-  behaviors: DuxBehavior[]
-): number {
-  // Simple matching: Look for behavior where user_enablement relates to feature name
-  // This is experimental - will need refinement
+const FEATURE_BEHAVIOR_KEYWORDS: [string, string][] = [
+  ['ownership', 'owner'],
+  ['connect', 'connect'],
+  ['signal', 'signal'],
+  ['interest', 'interest'],
+  ['health', 'health'],
+  ['privacy', 'privacy'],
+  ['reputation', 'reputation'],
+]
 
-  const normalizedFeature = featureName.toLowerCase()
-
-  // Try to find matching behavior
-  const matchedBehavior = behaviors.find(b => {
-    const behaviorText = `${b.user_enablement} ${b.id}`.toLowerCase()
+/**
+ * Token -> Behavior inverted index, built once when behaviors are loaded.
+ *
+ * Matching is substring-based on `${user_enablement} ${id}` (lowercased), as
+ * before. Since the fragments we look up never contain whitespace, a
+ * Behavior text contains a fragment exactly when one of its whitespace
+ * tokens does, so a lookup scans the (small, shared) token vocabulary
+ * instead of every Behavior, and its result is memoized per fragment.
+ * Keyword rules for evidence counts are resolved up front.
+ */
+export class EvidenceIndex {
+  // token -> position of the first Behavior whose text has that token
+  private readonly firstByToken = new Map<string, number>()
+  private readonly firstByFragment = new Map<string, number>()
+  // FEATURE_BEHAVIOR_KEYWORDS[i] -> first matching Behavior position (or -1)
+  private readonly keywordMatches: number[]
+
+  constructor(private readonly behaviors: DuxBehavior[]) {
+    behaviors.forEach((b, position) => {
+      for (const token of `${b.user_enablement} ${b.id}`.toLowerCase().split(/\s+/)) {
+        if (!this.firstByToken.has(token)) {
+          this.firstByToken.set(token, position)
+        }
+      }
+    })
+    this.keywordMatches = FEATURE_BEHAVIOR_KEYWORDS.map(([, behaviorKeyword]) =>
+      this.firstContaining(behaviorKeyword))
+  }
 
-    // Match keywords from feature name
-    if (normalizedFeature.includes('ownership') && behaviorText.includes('owner')) {
-      return true
+  /**
+   * Position of the first Behavior whose text contains fragment, or -1
+   */
+  private firstContaining(fragment: string): number {
+    const cached = this.firstByFragment.get(fragment)
+    if (cached !== undefined) {
+      return cached
     }
-    if (normalizedFeature.includes('connect') && behaviorText.includes('connect')) {
-      return true
-    }
-    if (normalizedFeature.includes('signal') && behaviorText.includes('signal')) {
-      return true
-    }
-    if (normalizedFeature.includes('interest') && behaviorText.includes('interest')) {
-      return true
-    }
-    if (normalizedFeature.includes('health') && behaviorText.includes('health')) {
-      return true
-    }
-    if (normalizedFeature.includes('privacy') && behaviorText.includes('privacy')) {
-      return true
+
+    let first = -1
+    for (const [token, position] of this.firstByToken) {
+      if ((first === -1 || position < first) && token.includes(fragment)) {
+        first = position
+      }
     }
-    if (normalizedFeature.includes('reputation') && behaviorText.includes('reputation')) {
-      return true
+    this.firstByFragment.set(fragment, first)
+    return first
+  }
+
+  /**
+   * Evidence count from the Behavior linked to a feature by keyword
+   */
+  countForFeature(featureName: string): number {
+    const normalizedFeature = featureName.toLowerCase()
+
+    // The earliest Behavior matching any keyword the feature name has
+    let first = -1
+    FEATURE_BEHAVIOR_KEYWORDS.forEach(([featureKeyword], rule) => {
+      const position = this.keywordMatches[rule]
+      if (position !== -1 && normalizedFeature.includes(featureKeyword) && (first === -1 || position < first)) {
+        first = position
+      }
+    })
+
+    return first === -1 ? 0 : this.behaviors[first].evidence.length || 0
+  }
+
+  /**
+   * Evidence IDs from the first Behavior mentioning the feature's first word
+   */
+  idsForFeature(featureName: string): string[] {
+    const firstWord = featureName.toLowerCase().split(' ')[0]
+    if (/\s/.test(firstWord)) {
+      // Tabs/newlines in the name: not a single token, fall back to a scan
+      const match = this.behaviors.find(b => `${b.user_enablement} ${b.id}`.toLowerCase().includes(firstWord))
+      return match?.evidence || []
     }
 
-    return false
-  })
+    const position = this.firstContaining(firstWord)
+    return position === -1 ? [] : this.behaviors[position].evidence || []
+  }
+}
 
-  return matchedBehavior?.evidence.length || 0
+/**
+ * Build the evidence index for a set of loaded Behavior objects
+ */
+export function buildEvidenceIndex(behaviors: DuxBehavior[]): EvidenceIndex {
+  return new EvidenceIndex(behaviors)
+}
+
+// Indexes for callers that still pass the behaviors array
+const indexCache = new WeakMap<DuxBehavior[], EvidenceIndex>()
+
+function indexFor(behaviors: DuxBehavior[]): EvidenceIndex {
+  let index = indexCache.get(behaviors)
+  if (!index) {
+    index = buildEvidenceIndex(behaviors)
+    indexCache.set(behaviors, index)
+  }
+  return index
+}
+
+/**
+ * Match feature/scenario to DUX Behavior object
+ * Returns evidence count from linked Behavior
+ */
+export function getEvidenceCountForFeature(
+  featureName: string,
+  behaviors: DuxBehavior[]
+): number {
+  return indexFor(behaviors).countForFeature(featureName)
 }
 
 /**
@@ -159,12 +239,5 @@ export function getEvidenceIdsForFeature(
   featureName: string,
   behaviors: DuxBehavior[]
 ): string[] {
-  const normalizedFeature = featureName.toLowerCase()
-
-  const matchedBehavior = behaviors.find(b => {
-    const behaviorText = `${b.user_enablement} ${b.id}`.toLowerCase()
-    return behaviorText.includes(normalizedFeature.split(' ')[0])
-  })
-
-  return matchedBehavior?.evidence || []
+  return indexFor(behaviors).idsForFeature(featureName)
 }
@@ -0,0 +1,168 @@
+import { createReadStream, readFileSync, statSync } from 'fs'
+import { join } from 'path'
+import { Readable } from 'stream'
+import { NextResponse } from 'next/server'
+
+/**
+ * Prebuilt API payloads written by scripts/build_api_snapshots.py
+ *
+ * The builder writes each build to public/bdd-data/prebuilt/<version>/ and
+ * then atomically swaps manifest.json to point at it. Routes call
+ * servePrebuilt() first and only compute the payload themselves when no
+ * build exists, it lacks that payload, or one of the payload's inputs
+ * (behave-results.json, behaviors, .feature files, the project registry)
+ * changed after the build - e.g. because the builder is not running.
+ */
+
+// Must match MANIFEST_SCHEMA in scripts/build_api_snapshots.py
+const MANIFEST_SCHEMA = 2
+
+export interface PrebuiltPayload {
+  file: string
+  etag: string
+  size: number
+  encodings: Partial<Record<'gzip' | 'br', string>>
+  // Key of PrebuiltManifest.inputs the payload was computed from
+  inputs: string
+}
+
+export interface PrebuiltInput {
+  path: string
+  // Nanoseconds as a decimal string; null when the input did not exist
+  mtime_ns: string | null
+  size: number | null
+}
+
+export interface PrebuiltManifest {
+  schema: number
+  version: string
+  generated_at: string
+  payloads: Record<string, PrebuiltPayload>
+  inputs: Record<string, PrebuiltInput[]>
+}
+
+const PREBUILT_DIR = join(process.cwd(), 'public', 'bdd-data', 'prebuilt')
+const MANIFEST_PATH = join(PREBUILT_DIR, 'manifest.json')
+
+// Preferred first
+const ENCODINGS: ('br' | 'gzip')[] = ['br', 'gzip']
+
+// Inputs are re-stat'ed at most this often per group
+const FRESHNESS_CHECK_MS = 1000
+
+let manifestCache: { mtimeMs: number; manifest: PrebuiltManifest | null } | null = null
+const freshnessCache = new Map<string, { checkedAt: number; fresh: boolean }>()
+
+/**
+ * Current manifest, re-read only when manifest.json changes
+ */
+export function readPrebuiltManifest(): PrebuiltManifest | null {
+  let mtimeMs: number
+  try {
+    mtimeMs = statSync(MANIFEST_PATH).mtimeMs
+  } catch {
+    return null
+  }
+
+  if (!manifestCache || manifestCache.mtimeMs !== mtimeMs) {
+    let manifest: PrebuiltManifest | null = null
+    try {
+      const parsed = JSON.parse(readFileSync(MANIFEST_PATH, 'utf-8')) as PrebuiltManifest
+      manifest = parsed.schema === MANIFEST_SCHEMA ? parsed : null
+    } catch (error) {
+      console.error('Error reading prebuilt manifest:', error)
+    }
+    manifestCache = { mtimeMs, manifest }
+  }
+  return manifestCache.manifest
+}
+
+function inputUnchanged(input: PrebuiltInput): boolean {
+  try {
+    const stats = statSync(input.path, { bigint: true })
+    return input.mtime_ns === stats.mtimeNs.toString() && input.size === Number(stats.size)
+  } catch {
+    return input.mtime_ns === null
+  }
+}
+
+/**
+ * Whether every input of `payload` is as it was when the build was made
+ */
+function isPrebuiltFresh(manifest: PrebuiltManifest, payload: PrebuiltPayload): boolean {
+  const inputs = manifest.inputs?.[payload.inputs]
+  if (!inputs) {
+    return false
+  }
+
+  const key = `${manifest.version}\u0000${payload.inputs}`
+  const now = Date.now()
+  const cached = freshnessCache.get(key)
+  if (cached && now - cached.checkedAt < FRESHNESS_CHECK_MS) {
+    return cached.fresh
+  }
+
+  const fresh = inputs.every(inputUnchanged)
+  if (!cached) {
+    // Only the live build's entries are worth keeping
+    freshnessCache.forEach((_, k) => {
+      if (!k.startsWith(`${manifest.version}\u0000`)) freshnessCache.delete(k)
+    })
+  }
+  freshnessCache.set(key, { checkedAt: now, fresh })
+  return fresh
+}
+
+function acceptsEncoding(acceptEncoding: string, encoding: string): boolean {
+  return acceptEncoding.split(',').some(part => {
+    const [name, ...params] = part.trim().split(';')
+    const q = params.map(p => p.trim()).find(p => p.startsWith('q='))
+    return name.trim().toLowerCase() === encoding && (!q || parseFloat(q.slice(2)) > 0)
+  })
+}
+
+/**
+ * Stream the prebuilt payload `name` (e.g. 'features', 'feature/<id>'),
+ * honouring If-None-Match and Accept-Encoding. Returns null when there is
+ * no prebuilt file for it or its inputs changed since the build, so the
+ * caller can compute the payload instead.
+ */
+export function servePrebuilt(request: Request, name: string): NextResponse | null {
+  const manifest = readPrebuiltManifest()
+  const payload = manifest?.payloads[name]
+  if (!manifest || !payload || !isPrebuiltFresh(manifest, payload)) {
+    return null
+  }
+
+  const headers: Record<string, string> = {
+    ETag: payload.etag,
+    'Cache-Control': 'no-cache',
+    'Content-Type': 'application/json',
+    Vary: 'Accept-Encoding',
+    'X-Prebuilt-Version': manifest.version
+  }
+
+  const ifNoneMatch = request.headers.get('if-none-match')
+  if (ifNoneMatch && ifNoneMatch.split(',').some(tag => tag.trim() === payload.etag)) {
+    return new NextResponse(null, { status: 304, headers })
+  }
+
+  const acceptEncoding = request.headers.get('accept-encoding') || ''
+  let file = payload.file
+  const encoding = ENCODINGS.find(e => payload.encodings[e] && acceptsEncoding(acceptEncoding, e))
+  if (encoding) {
+    file = payload.encodings[encoding]!
+    headers['Content-Encoding'] = encoding
+  }
+
+  const filePath = join(PREBUILT_DIR, file)
+  try {
+    headers['Content-Length'] = String(statSync(filePath).size)
+  } catch {
+    // Build pruned between reading the manifest and now
+    return null
+  }
+
+  const body = Readable.toWeb(createReadStream(filePath)) as ReadableStream<Uint8Array>
+  return new NextResponse(body, { headers })
+}
@@ -0,0 +1,151 @@
+import { closeSync, openSync, readSync, statSync } from 'fs'
+import { join } from 'path'
+
+/**
+ * Tail of the live step stream written by features/step_stream.py
+ *
+ * One tailer per server process polls the stream for appended bytes and
+ * fans new lines out to every subscriber (SSE connections). It also keeps
+ * the latest event per step/scenario/feature/worker, so a new subscriber is
+ * caught up with the current run without re-reading the file. A new run
+ * replaces the file (new inode); subscribers then get a `reset` event.
+ */
+
+const STREAM_PATH = join(process.cwd(), 'public', 'bdd-data', 'live', 'step-stream.jsonl')
+const POLL_INTERVAL_MS = 500
+const READ_CHUNK_BYTES = 1 << 20
+
+export interface StreamMessage {
+  // "<inode>-<offset>" after this line; sent as the SSE id for Last-Event-ID
+  id: string
+  data: string
+}
+
+type Listener = (message: StreamMessage) => void
+
+interface LatestEvent {
+  offset: number
+  data: string
+}
+
+const listeners = new Set<Listener>()
+let timer: ReturnType<typeof setInterval> | null = null
+let ino: number | null = null
+let offset = 0
+// Insertion order is event order; a key is re-inserted when it changes
+let latest = new Map<string, LatestEvent>()
+
+function eventKey(event: any): string | null {
+  switch (event.type) {
+    case 'step':
+      return `step\u0000${event.feature_id}\u0000${event.scenario}\u0000${event.index}`
+    case 'scenario':
+    case 'scenario_end':
+      return `scenario\u0000${event.feature_id}\u0000${event.scenario}`
+    case 'feature':
+    case 'feature_end':
+      return `feature\u0000${event.worker}\u0000${event.feature_id}`
+    case 'run':
+    case 'worker_end':
+      return `worker\u0000${event.worker}`
+    default:
+      return null
+  }
+}
+
+function broadcast(message: StreamMessage) {
+  Array.from(listeners).forEach(listener => listener(message))
+}
+
+/**
+ * Read whatever was appended since the last poll
+ */
+function poll() {
+  let stats: { ino: number; size: number }
+  try {
+    stats = statSync(STREAM_PATH)
+  } catch {
+    return
+  }
+
+  if (ino !== stats.ino || stats.size < offset) {
+    const rotated = ino !== null
+    ino = stats.ino
+    offset = 0
+    latest = new Map()
+    if (rotated) {
+      broadcast({ id: `${ino}-0`, data: JSON.stringify({ type: 'reset' }) })
+    }
+  }
+  if (stats.size <= offset) {
+    return
+  }
+
+  const fd = openSync(STREAM_PATH, 'r')
+  try {
+    while (offset < stats.size) {
+      const buffer = Buffer.alloc(Math.min(READ_CHUNK_BYTES, stats.size - offset))
+      const read = readSync(fd, buffer, 0, buffer.length, offset)
+      // A line still being written is picked up on the next poll
+      const end = buffer.subarray(0, read).lastIndexOf(0x0a) + 1
+      if (end === 0) {
+        break
+      }
+      let position = offset
+      for (const line of buffer.subarray(0, end - 1).toString('utf-8').split('\n')) {
+        position += Buffer.byteLength(line) + 1
+        if (!line) continue
+        let key: string | null = null
+        try {
+          key = eventKey(JSON.parse(line))
+        } catch {
+          continue
+        }
+        if (key) {
+          latest.delete(key)
+          latest.set(key, { offset: position, data: line })
+        }
+        broadcast({ id: `${ino}-${position}`, data: line })
+      }
+      offset += end
+    }
+  } finally {
+    closeSync(fd)
+  }
+}
+
+/**
+ * Subscribe to the stream. The listener first receives the latest state of
+ * the current run (only what changed after `lastEventId`, when it names a
+ * position in the current file), then every new event.
+ * Returns the unsubscribe function.
+ */
+export function subscribeStepStream(listener: Listener, lastEventId?: string | null): () => void {
+  poll()
+
+  let since = 0
+  const [lastIno, lastOffset] = (lastEventId || '').split('-').map(Number)
+  if (ino !== null && lastIno === ino && lastOffset <= offset) {
+    since = lastOffset
+  } else if (lastEventId && ino !== null) {
+    listener({ id: `${ino}-0`, data: JSON.stringify({ type: 'reset' }) })
+  }
+  latest.forEach(event => {
+    if (event.offset > since) {
+      listener({ id: `${ino}-${event.offset}`, data: event.data })
+    }
+  })
+
+  listeners.add(listener)
+  if (!timer) {
+    timer = setInterval(poll, POLL_INTERVAL_MS)
+  }
+
+  return () => {
+    listeners.delete(listener)
+    if (!listeners.size && timer) {
+      clearInterval(timer)
+      timer = null
+    }
+  }
+}
@@ -57,7 +57,7 @@ export function DashboardHeader({ jtbd, metrics }: DashboardHeaderProps) {
       <div className="border border-green-400/30 bg-green-900/5 rounded-lg p-5 mb-6">
         <div className="grid grid-cols-2 md:grid-cols-5 gap-5">
           <div className="text-center">
-            <div className="text-green-400 text-xl font-bold mb-1 font-mono">
+            <div className="text-green-400 text-xl font-bold mb-1 font-mono" data-field="total_features">
               {metrics.totalFeatures}
             </div>
             <div className="text-green-400/60 text-xs uppercase tracking-wide font-mono">
@@ -81,7 +81,11 @@ export function DashboardHeader({ jtbd, metrics }: DashboardHeaderProps) {
             </div>
           </div>
           <div className="text-center">
-            <div className="text-green-400 text-xl font-bold mb-1 font-mono">
+            <div
+              className="text-green-400 text-xl font-bold mb-1 font-mono"
+              data-field="overall_progress"
+              data-value={metrics.journeyProgress}
+            >
               {metrics.journeyProgress}%
             </div>
             <div className="text-green-400/60 text-xs uppercase tracking-wide font-mono">
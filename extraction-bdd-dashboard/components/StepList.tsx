@@ -46,18 +46,21 @@ export function StepList({ steps, title = '[OBSERVABLE SIGNALS]' }: StepListProp
           <div
             key={`step-${index}`}
             className="flex items-start gap-3 text-sm font-mono leading-relaxed"
+            data-testid="step-card"
           >
             {/* Status Icon */}
             <span
               className={`${
                 stepStatusColors[stepItem.status]
               } font-bold shrink-0`}
+              data-field="status"
+              data-value={stepItem.status}
             >
               {stepStatusIcons[stepItem.status]}
             </span>
 
             {/* Step Text */}
-            <span className="text-card-monospace-text-primary flex-1">
+            <span className="text-card-monospace-text-primary flex-1" data-field="definition">
               {stepItem.step}
             </span>
           </div>
@@ -19,6 +19,8 @@ export interface CardMetrics {
 export interface CardProps {
   id: string;
   title: string;
+  // Source name behind the display title (tests compare it with the API data)
+  name?: string;
   type: 'feature' | 'scenario';
   status: 'NOT STARTED' | 'IN PROGRESS' | 'PASSING' | 'FAILING';
   metrics: CardMetrics;
@@ -32,6 +34,7 @@ export interface CardProps {
 export function UniversalCard({
   id,
   title,
+  name,
   type,
   status,
   metrics,
@@ -81,13 +84,20 @@ export function UniversalCard({
   // Indentation based on nesting level
   const indentClass = level === 0 ? '' : 'ml-6';
 
+  // data-testid/data-card-id/data-field/data-value are the DOM contract of
+  // features/json_mapping.py and features/render_timing.py: a feature card
+  // is an "enablement" card, each step row a "step" card
   return (
-    <div className={`
+    <div
+      className={`
       ${indentClass}
       w-full
       transition-all duration-300
       mb-4
-    `}>
+    `}
+      data-testid={type === 'feature' ? 'enablement-card' : 'scenario-card'}
+      data-card-id={id}
+    >
       {/* Card */}
       <div
         className="border border-gray-600/30 bg-gray-800/10 p-4 transition-all hover:border-opacity-60 cursor-pointer rounded-lg"
@@ -98,13 +108,21 @@ export function UniversalCard({
           <span className="bg-cyan-400/20 text-cyan-400 text-xs font-bold px-2 py-0.5 rounded-full font-mono">
             {id}
           </span>
-          <span className="text-xs uppercase tracking-wide font-mono text-gray-500">
+          <span
+            className="text-xs uppercase tracking-wide font-mono text-gray-500"
+            data-field="status"
+            data-value={status}
+          >
             {status.toLowerCase().replace(/_/g, ' ')}
           </span>
         </div>
 
         {/* Title */}
-        <div className="text-cyan-300 text-sm font-bold mb-3 leading-tight font-mono">
+        <div
+          className="text-cyan-300 text-sm font-bold mb-3 leading-tight font-mono"
+          data-field="name"
+          data-value={name ?? title}
+        >
           {title}
         </div>
 
@@ -124,7 +142,9 @@ export function UniversalCard({
 
         {/* Bottom Row: Percentage + Arrow */}
         <div className="flex justify-between items-center">
-          <span className="text-xs text-gray-500 font-mono">{metrics.percentage}% complete</span>
+          <span className="text-xs text-gray-500 font-mono" data-field="progress" data-value={metrics.percentage}>
+            {metrics.percentage}% complete
+          </span>
           <svg
             xmlns="http://www.w3.org/2000/svg"
             width="24"
@@ -172,18 +192,22 @@ export function UniversalCard({
                   <div
                     key={`step-${index}`}
                     className="flex items-start gap-3 text-xs font-mono"
+                    data-testid="step-card"
+                    data-card-id={`${id}-${index + 1}`}
                   >
                     {/* Status Icon */}
                     <span
                       className={`${
                         stepStatusColors[stepItem.status]
                       }`}
+                      data-field="status"
+                      data-value={stepItem.status}
                     >
                       {stepStatusIcons[stepItem.status]}
                     </span>
 
                     {/* Step Text */}
-                    <span className="text-gray-400 flex-1">
+                    <span className="text-gray-400 flex-1" data-field="definition">
                       {stepItem.step}
                     </span>
                   </div>
@@ -0,0 +1,29 @@
+# Excluded by default (behave.ini); run with `behave --tags=@load`
+@load
+Feature: Dashboard API Routes Hold Up Under Concurrent Load
+  # RESULT: Teams keep the dashboard open all day WHEN API responses stay fast with many viewers polling at once
+  # OUTCOME: 20 concurrent viewers polling every route see p95 <500ms and no failed requests
+  # JTBD: "When my whole team has the dashboard open, I want it to stay as fast as when I'm alone, so nobody reloads or gives up on it"
+  # TECHNICAL BENCHMARKS: /api/bdd/features p95 <500ms @ 20 clients, /api/skateboard/dashboard p95 <200ms @ 20 clients, <1% errors
+
+  Scenario: Feature list stays responsive while it re-reads behave results
+    When 20 clients send 1000 requests to "/api/bdd/features"
+    Then the error rate should be below 1 percent
+    And the p95 latency should be under 500 milliseconds
+    And the p99 latency should be under 1000 milliseconds
+
+  Scenario: Skateboard dashboard serves from cache under sustained load
+    When 20 clients load "/api/skateboard/dashboard" for 30 seconds
+    Then the error rate should be below 1 percent
+    And the p95 latency should be under 200 milliseconds
+    And throughput should be at least 100 requests per second
+
+  Scenario: Progress route survives a burst
+    When 50 clients send 500 requests to "/api/bdd/progress"
+    Then the error rate should be below 1 percent
+
+  # Skipped when the specs/mockups checkout is missing (the route then answers 500)
+  @mockups
+  Scenario: Mockup route survives a burst
+    When 50 clients send 500 requests to "/api/bdd/mockups"
+    Then the error rate should be below 1 percent
@@ -0,0 +1,273 @@
+"""
+Browser Session Pool for Dashboard Validation Tests
+Purpose: One Playwright browser per behave process, reusable pre-warmed contexts
+Infrastructure: Real browser (Playwright), real dashboard server (NO MOCKS)
+
+Launching a browser per scenario dominates suite time. The pool launches a
+single browser in before_all, opens `size` contexts up front (each with a page
+already pointed at the dashboard), and hands them out per scenario. Contexts
+are reset, not recreated, between scenarios; one whose reset fails is
+replaced by a fresh context so the pool never shrinks. Tracing runs for the lifetime
+of each context and is cut into one chunk (one trace file) per scenario.
+"""
+
+import os
+import queue
+import re
+import signal
+import subprocess
+import time
+import urllib.error
+import urllib.request
+
+import render_timing
+
+
+# Trace retention: keep every scenario's trace, only failures', or none
+TRACE_MODES = ("on", "retain-on-failure", "off")
+
+
+class DashboardServer:
+    """
+    Start `next start` for the dashboard unless one is already answering.
+    """
+
+    def __init__(self, url, project_dir, start_timeout=60.0):
+        self.url = url
+        self.project_dir = project_dir
+        self.start_timeout = start_timeout
+        self.process = None
+        self.startup_seconds = 0.0
+
+    def is_ready(self):
+        try:
+            with urllib.request.urlopen(self.url, timeout=2) as response:
+                return response.status < 500
+        except (urllib.error.URLError, OSError):
+            return False
+
+    def start(self):
+        """Start the server if needed and block until it answers"""
+        if self.is_ready():
+            return
+
+        port = str(urllib.request.urlparse(self.url).port or 3000)
+        started = time.perf_counter()
+        self.process = subprocess.Popen(
+            ["npx", "next", "start", "-p", port],
+            cwd=self.project_dir,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+        deadline = started + self.start_timeout
+        while time.perf_counter() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"next start exited with code {self.process.returncode} "
+                                   f"(run `npm run build` first?)")
+            if self.is_ready():
+                self.startup_seconds = time.perf_counter() - started
+                return
+            time.sleep(0.25)
+
+        self.stop()
+        raise RuntimeError(f"Dashboard did not answer at {self.url} within {self.start_timeout:.0f}s")
+
+    def stop(self):
+        if self.process and self.process.poll() is None:
+            os.killpg(self.process.pid, signal.SIGTERM)
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                os.killpg(self.process.pid, signal.SIGKILL)
+        self.process = None
+
+
+class BrowserSession:
+    """A pooled browser context plus its main page"""
+
+    def __init__(self, context, page):
+        self.context = context
+        self.page = page
+        self.scenarios = 0
+
+
+class BrowserPool:
+    """
+    Pool of pre-warmed Playwright browser contexts sharing one browser.
+
+    Usage (environment.py):
+        pool = BrowserPool(size=1, base_url=url).start()
+        session = pool.acquire(scenario.name)
+        ...
+        pool.release(session, failed=scenario.status == 'failed')
+        pool.close()
+    """
+
+    def __init__(self, size=1, base_url=None, browser_name="chromium", headless=True,
+                 trace_mode="retain-on-failure", trace_dir="reports/traces", acquire_timeout=300.0):
+        if trace_mode not in TRACE_MODES:
+            raise ValueError(f"Unknown trace mode: {trace_mode}. Valid modes are: {', '.join(TRACE_MODES)}")
+        self.size = size
+        self.base_url = base_url
+        self.browser_name = browser_name
+        self.headless = headless
+        self.trace_mode = trace_mode
+        self.trace_dir = trace_dir
+        self.acquire_timeout = acquire_timeout
+
+        self._playwright = None
+        self._browser = None
+        self._sessions = []
+        self._available = queue.Queue()
+        self.timings = {
+            "playwright_start": 0.0,
+            "browser_launch": 0.0,
+            "context_warm": 0.0,
+            "acquire_wait": 0.0,
+            "reset": 0.0,
+            "trace_save": 0.0,
+            "navigation": 0.0,
+            "navigations": 0,
+            "scenarios": 0,
+        }
+
+    def start(self):
+        """Launch the browser and warm `size` contexts"""
+        from playwright.sync_api import sync_playwright
+
+        started = time.perf_counter()
+        self._playwright = sync_playwright().start()
+        self.timings["playwright_start"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        self._browser = getattr(self._playwright, self.browser_name).launch(headless=self.headless)
+        self.timings["browser_launch"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for _ in range(self.size):
+            session = self._new_session()
+            self._sessions.append(session)
+            self._available.put(session)
+        self.timings["context_warm"] = time.perf_counter() - started
+
+        return self
+
+    def _new_session(self):
+        context = self._browser.new_context(base_url=self.base_url)
+        if self.trace_mode != "off":
+            context.tracing.start(screenshots=True, snapshots=True)
+        render_timing.install(context)
+        page = context.new_page()
+        if self.base_url:
+            # First hit compiles/caches the route server-side and fills the
+            # HTTP cache, so the first scenario doesn't pay for it
+            page.goto(self.base_url, wait_until="domcontentloaded")
+        return BrowserSession(context, page)
+
+    def acquire(self, title):
+        """Check out a warm session for one scenario and open its trace chunk"""
+        started = time.perf_counter()
+        try:
+            session = self._available.get(timeout=self.acquire_timeout)
+        except queue.Empty:
+            raise RuntimeError(f"No browser session free after {self.acquire_timeout:.0f}s "
+                               f"(pool size {self.size}; was a session never released?)") from None
+        self.timings["acquire_wait"] += time.perf_counter() - started
+
+        if self.trace_mode != "off":
+            session.context.tracing.start_chunk(title=title)
+        session.scenarios += 1
+        self.timings["scenarios"] += 1
+        return session
+
+    def goto(self, session, url, wait_until="load"):
+        """Navigate the session's page and record the navigation time"""
+        started = time.perf_counter()
+        response = session.page.goto(url, wait_until=wait_until)
+        self.timings["navigation"] += time.perf_counter() - started
+        self.timings["navigations"] += 1
+        return response
+
+    def release(self, session, failed=False, trace_name=None):
+        """
+        Save/discard the scenario's trace, reset state and return the session.
+
+        The session always goes back to the pool, even if saving the trace
+        fails; a session that cannot be reset is replaced by a new one.
+        """
+        try:
+            if self.trace_mode != "off":
+                started = time.perf_counter()
+                keep = self.trace_mode == "on" or (failed and self.trace_mode == "retain-on-failure")
+                if keep:
+                    os.makedirs(self.trace_dir, exist_ok=True)
+                    file_name = re.sub(r"[^\w.-]+", "_", trace_name or f"scenario-{self.timings['scenarios']}")
+                    session.context.tracing.stop_chunk(path=os.path.join(self.trace_dir, f"{file_name}.zip"))
+                else:
+                    session.context.tracing.stop_chunk()
+                self.timings["trace_save"] += time.perf_counter() - started
+        finally:
+            started = time.perf_counter()
+            try:
+                self._reset(session)
+            except Exception as error:
+                print(f"⚠️  Browser session reset failed ({error}); replacing it")
+                session = self._replace(session)
+            self.timings["reset"] += time.perf_counter() - started
+            self._available.put(session)
+
+    def _replace(self, session):
+        """Close a broken session and open a fresh one in its place"""
+        try:
+            session.context.close()
+        except Exception:
+            # A crashed context may already be gone
+            pass
+        replacement = self._new_session()
+        self._sessions[self._sessions.index(session)] = replacement
+        return replacement
+
+    def _reset(self, session):
+        """Drop scenario state without paying for a new context"""
+        for page in session.context.pages:
+            if page is not session.page:
+                page.close()
+        if session.page.is_closed():
+            session.page = session.context.new_page()
+        try:
+            session.page.evaluate("() => { localStorage.clear(); sessionStorage.clear() }")
+        except Exception:
+            # about:blank or a crashed page has no storage to clear
+            pass
+        session.context.clear_cookies()
+        session.page.goto("about:blank")
+
+    def close(self):
+        for session in self._sessions:
+            if self.trace_mode != "off":
+                session.context.tracing.stop()
+            session.context.close()
+        self._sessions = []
+        if self._browser:
+            self._browser.close()
+        if self._playwright:
+            self._playwright.stop()
+        self._browser = None
+        self._playwright = None
+
+    def report_lines(self):
+        """Timing summary lines for after_all"""
+        t = self.timings
+        startup = t["playwright_start"] + t["browser_launch"] + t["context_warm"]
+        overhead = t["acquire_wait"] + t["reset"] + t["trace_save"]
+        per_navigation = t["navigation"] / t["navigations"] if t["navigations"] else 0.0
+        return [
+            f"Browser Startup: {startup:.2f}s (launch {t['browser_launch']:.2f}s, "
+            f"{self.size} context(s) warmed in {t['context_warm']:.2f}s)",
+            f"Navigation: {t['navigation']:.2f}s over {t['navigations']} navigations "
+            f"({per_navigation * 1000:.0f}ms avg)",
+            f"Pool Overhead: {overhead:.2f}s across {t['scenarios']} scenarios "
+            f"(wait {t['acquire_wait']:.2f}s, reset {t['reset']:.2f}s, traces {t['trace_save']:.2f}s)",
+        ]
@@ -1,40 +1,127 @@
 """
 Behave Environment Setup for Dashboard Validation Tests
 Purpose: Configure Playwright browser automation for dashboard UI testing
-Infrastructure: Real browser (Playwright MCP), real dashboard server
+Infrastructure: Real browser (Playwright), real dashboard server
+
+Environment variables:
+    DASHBOARD_URL           Dashboard base URL (default http://localhost:3000)
+    TEST_RUN_ID             Shared run ID (set by scripts/run_behave_parallel.py)
+    BEHAVE_WORKER           Worker index within a parallel run
+    DASHBOARD_START_SERVER  "1" to run `next start` when nothing answers at DASHBOARD_URL
+    BROWSER_POOL            "0" to run without a browser (step stubs only)
+    BROWSER_POOL_SIZE       Pre-warmed browser contexts (default 1)
+    BROWSER_POOL_TIMEOUT    Seconds a scenario waits for a free context before failing (default 300)
+    BROWSER                 chromium | firefox | webkit (default chromium)
+    HEADED                  "1" to show the browser window
+    TRACE_MODE              on | retain-on-failure | off (default retain-on-failure)
+    TRACE_DIR               Where trace zips are written (default reports/traces)
+    TIMELINE                "0" to skip the span timeline
+    TIMELINE_DIR            Where timeline traces/CSVs are written (default reports/timeline)
+    METRICS_STORE           "0" to skip persisting timings
+    METRICS_DB              SQLite metrics store (default reports/metrics.sqlite3)
+    TIMEOUT_STRATEGY        Calibrated budgets (default timeout-strategy.yaml); "0" for literal SLAs only
+    MOCKUP_DIR              Mockup option JSON files (default ../specs/mockups, then ../../specs/mockups);
+                            @mockups scenarios are skipped when none exists
 """
 
 import os
 import time
 from datetime import datetime
 
+from browser_pool import BrowserPool, DashboardServer
+from metrics_store import MetricsStore, detect_environment, scenario_measurements
+from mockups import MockupCache
+from render_timing import load_budgets
+from timeline import TimelineRecorder
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 
 def before_all(context):
     """
     Setup before all tests run
-    Configure Playwright MCP integration
+    Start the dashboard (if asked) and launch one pooled browser for the run
     """
-    context.test_run_id = f"dashboard-validation-{int(time.time())}"
+    context.test_run_id = os.getenv('TEST_RUN_ID') or f"dashboard-validation-{int(time.time())}"
+    context.worker = os.getenv('BEHAVE_WORKER')
     context.start_time = datetime.now()
     context.dashboard_url = os.getenv('DASHBOARD_URL', 'http://localhost:3000')
 
     print(f"\n{'='*60}")
     print(f"Dashboard Validation Test Run: {context.test_run_id}")
+    if context.worker is not None:
+        print(f"Worker: {context.worker}")
     print(f"Dashboard URL: {context.dashboard_url}")
     print(f"Started at: {context.start_time}")
     print(f"{'='*60}\n")
 
-    # Verify dashboard is accessible
-    # This will be checked when browser opens
+    context.timeline = None
+    if os.getenv('TIMELINE', '1') != '0':
+        context.timeline = TimelineRecorder(context.test_run_id, context.worker)
+        context.timeline.begin("run", "run", test_run_id=context.test_run_id)
+        context.timeline.begin("setup", "setup")
+
+    # Calibrated timing budgets (scripts/calibrate_timeouts.py) for this environment
+    context.environment_profile = detect_environment()
+    strategy_path = os.getenv('TIMEOUT_STRATEGY', os.path.join(PROJECT_DIR, 'timeout-strategy.yaml'))
+    context.timeout_budgets = load_budgets(strategy_path, context.environment_profile) if strategy_path != '0' else {}
+
+    context.metrics_store = None
+    if os.getenv('METRICS_STORE', '1') != '0':
+        context.metrics_store = MetricsStore(
+            os.getenv('METRICS_DB', os.path.join(PROJECT_DIR, 'reports', 'metrics.sqlite3')),
+            context.test_run_id, context.worker, context.dashboard_url,
+        )
+
+    # Mockup option files for the JSON mapping steps, parsed once per run
+    context.mockups = MockupCache()
+    if os.path.isdir(context.mockups.mockup_dir):
+        for filename, error in context.mockups.preload().items():
+            print(f"⚠️  Mockup {filename} not loaded: {error}")
+
+    context.dashboard_server = None
+    if os.getenv('DASHBOARD_START_SERVER') == '1':
+        context.dashboard_server = DashboardServer(context.dashboard_url, PROJECT_DIR)
+        context.dashboard_server.start()
+
+    context.browser_pool = None
+    if os.getenv('BROWSER_POOL', '1') != '0':
+        context.browser_pool = BrowserPool(
+            size=int(os.getenv('BROWSER_POOL_SIZE', '1')),
+            acquire_timeout=float(os.getenv('BROWSER_POOL_TIMEOUT', '300')),
+            base_url=context.dashboard_url,
+            browser_name=os.getenv('BROWSER', 'chromium'),
+            headless=os.getenv('HEADED') != '1',
+            trace_mode=os.getenv('TRACE_MODE', 'retain-on-failure'),
+            trace_dir=os.getenv('TRACE_DIR', os.path.join(PROJECT_DIR, 'reports', 'traces')),
+        ).start()
+
+    if context.timeline:
+        context.timeline.end()
+
+
+def before_feature(context, feature):
+    """Open the feature's timeline span"""
+    if context.timeline:
+        context.timeline.begin(feature.name, "feature", location=str(feature.location))
+
+
+def after_feature(context, feature):
+    """Close the feature's timeline span"""
+    if context.timeline:
+        context.timeline.end(status=feature.status.name)
 
 
 def before_scenario(context, scenario):
     """
     Setup before each scenario
-    Initialize browser state tracking
+    Check out a warm browser context and initialize state tracking
     """
     context.scenario_start_time = time.time()
-    context.browser_open = False
+    if 'mockups' in scenario.effective_tags and not os.path.isdir(context.mockups.mockup_dir):
+        scenario.skip(f"no mockups at {context.mockups.mockup_dir}")
+    if context.timeline:
+        context.timeline.begin(scenario.name, "scenario", location=str(scenario.location))
     context.current_url = None
     context.current_mode = None
     context.timer_start = None
@@ -42,14 +129,21 @@ def before_scenario(context, scenario):
     # Track resources for cleanup
     context.test_resources = []
 
-    # Playwright MCP will handle browser lifecycle
-    # Browser opens on first navigation
+    # Batched "... should match JSON field" results (see json_mapping)
+    context.json_field_results = None
+
+    context.browser_session = None
+    context.page = None
+    if context.browser_pool:
+        context.browser_session = context.browser_pool.acquire(scenario.name)
+        context.page = context.browser_session.page
+    context.browser_open = context.page is not None
 
 
 def after_scenario(context, scenario):
     """
     Cleanup after each scenario
-    Record timing and results
+    Record timing and results, return the browser context to the pool
     """
     elapsed = time.time() - context.scenario_start_time
 
@@ -64,17 +158,65 @@ def after_scenario(context, scenario):
 
     print(f"{status_icon} {scenario.name} ({elapsed:.2f}s)")
 
-    # Cleanup resources if needed
-    for resource in context.test_resources:
-        # Dashboard tests don't create resources, but hook is here for consistency
-        pass
+    # Release first and unconditionally: a session that never returns to the
+    # pool would block the next scenario's acquire
+    try:
+        if context.browser_session:
+            context.browser_pool.release(
+                context.browser_session,
+                failed=scenario.status == 'failed',
+                trace_name=f"{context.test_run_id}-{context.worker or 0}-{scenario.feature.name}-{scenario.name}",
+            )
+    finally:
+        context.browser_session = None
+
+        if context.metrics_store:
+            context.metrics_store.record_scenario(
+                scenario, context.scenario_start_time, elapsed * 1000,
+                scenario_measurements(context), context._runner.step_registry,
+            )
+
+        # Cleanup resources if needed
+        for resource in context.test_resources:
+            # Dashboard tests don't create resources, but hook is here for consistency
+            pass
+
+        if context.timeline:
+            context.timeline.end(status=scenario.status.name)
+
+
+def before_step(context, step):
+    """Remember the running step and open its timeline span"""
+    context.current_step = step
+    if context.timeline:
+        context.timeline.begin(f"{step.keyword} {step.name}", "step", location=str(step.location))
+
+
+def after_step(context, step):
+    """Close the step's timeline span and attribute it to its step definition"""
+    if context.timeline:
+        context.timeline.end_step(step, context._runner.step_registry)
 
 
 def after_all(context):
     """
     Cleanup after all tests
-    Generate summary report
+    Close the browser pool, stop the server and generate summary report
     """
+    if context.browser_pool:
+        context.browser_pool.close()
+    if context.dashboard_server:
+        context.dashboard_server.stop()
+
+    if context.metrics_store:
+        context.metrics_store.close()
+
+    timeline_paths = None
+    if context.timeline:
+        context.timeline.end()
+        timeline_paths = context.timeline.write(
+            os.getenv('TIMELINE_DIR', os.path.join(PROJECT_DIR, 'reports', 'timeline')))
+
     total_time = (datetime.now() - context.start_time).total_seconds()
 
     print(f"\n{'='*60}")
@@ -82,8 +224,18 @@ def after_all(context):
     print(f"{'='*60}")
     print(f"Test Run ID: {context.test_run_id}")
     print(f"Total Duration: {total_time:.2f}s")
+    if context.dashboard_server and context.dashboard_server.startup_seconds:
+        print(f"Server Startup: {context.dashboard_server.startup_seconds:.2f}s")
+    if context.browser_pool:
+        for line in context.browser_pool.report_lines():
+            print(line)
+    if timeline_paths:
+        slowest = context.timeline.summary_rows()[:3]
+        for row in slowest:
+            print(f"Slow Step: {row['step_definition']} ({row['total_ms']:.0f}ms over {row['calls']} calls)")
+        print(f"Timeline: {timeline_paths[0]}")
+        print(f"Step Summary: {timeline_paths[1]}")
+    if context.metrics_store:
+        print(f"Metrics Store: {context.metrics_store.path}")
     print(f"Completed at: {datetime.now()}")
     print(f"{'='*60}\n")
-
-    # Close browser (Playwright MCP handles cleanup)
-    # No explicit browser.close() needed - MCP manages lifecycle
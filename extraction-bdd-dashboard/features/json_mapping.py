@@ -0,0 +1,198 @@
+"""
+DOM-vs-JSON Field Comparison for Dashboard Validation Tests
+Purpose: Check "... should match JSON field" steps in one browser round trip
+Infrastructure: Real browser (Playwright), mockup JSON (features/mockups.py)
+
+A scenario usually lists many field checks in a row. The first of them
+collects the whole run of consecutive checks from the scenario, pulls every
+card's fields out of the page in a single evaluate() call, resolves each
+distinct JSON path once, and diffs everything in Python. Each step then only
+looks up its own result, and the first failing one reports every mismatch
+in the run.
+
+DOM contract (components/UniversalCard.tsx, StepList.tsx, DashboardHeader.tsx):
+    cards    the data-testid selectors in CARD_SELECTORS, numbered from 1 in
+             document order per kind: a feature card is an enablement card,
+             a scenario's step row a step card (rendered once expanded)
+    fields   elements with data-field="<name>"; a field belongs to the
+             nearest enclosing card of any kind (CARD_ROOT), so a feature
+             card does not pick up its nested scenario or step fields.
+             Fields outside every card are page-level (overall_progress).
+    values   an element's data-value attribute if present, else its text;
+             a field rendered more than once in a card is a list
+
+Rendered today: enablement name/status/progress, step definition/status,
+overall_progress, total_features. Other fields report "field not rendered".
+"""
+
+import re
+from collections import namedtuple
+
+from render_timing import SECTION_SELECTORS
+
+CARD_SELECTORS = {
+    "enablement": SECTION_SELECTORS["enablement_cards"],
+    "step": SECTION_SELECTORS["step_cards"],
+}
+
+# Every card root (enablement-card, scenario-card, step-card)
+CARD_ROOT = '[data-testid$="-card"]'
+
+# Must mirror the step patterns in steps/dashboard_validation_steps.py
+FIELD_STEPS = (
+    re.compile(r'^(?P<kind>enablement) (?P<index>\d+) (?P<field>name|status|steps|progress) '
+               r'should match JSON field "(?P<path>[^"]+)"$'),
+    re.compile(r'^(?P<kind>step) (?P<index>\d+) (?P<field>definition) should match JSON field "(?P<path>[^"]+)"$'),
+    re.compile(r'^(?P<field>overall progress|blocker impact|ROI) should match JSON field "(?P<path>[^"]+)"$'),
+)
+
+NUMBER = re.compile(r"-?\d+(?:\.\d+)?")
+
+EXTRACT_SCRIPT = """
+([cardSelectors, cardRoot]) => {
+  const valueOf = el => el.hasAttribute('data-value') ? el.getAttribute('data-value') : (el.textContent || '').trim()
+  const readFields = (root, owned) => {
+    const fields = {}
+    root.querySelectorAll('[data-field]').forEach(el => {
+      if (!owned(el)) return
+      const name = el.getAttribute('data-field')
+      fields[name] = name in fields ? [].concat(fields[name], valueOf(el)) : valueOf(el)
+    })
+    return fields
+  }
+  const cards = {}
+  for (const [kind, selector] of Object.entries(cardSelectors)) {
+    cards[kind] = Array.from(document.querySelectorAll(selector)).map(card => ({
+      label: card.getAttribute('data-card-id') || card.id || '',
+      fields: readFields(card, el => el.closest(cardRoot) === card)
+    }))
+  }
+  return { cards, page: readFields(document, el => !el.closest(cardRoot)) }
+}
+"""
+
+# kind/index are None for page-level fields; location is the step's
+FieldCheck = namedtuple("FieldCheck", "kind index field json_path location")
+
+
+def field_check(step):
+    """FieldCheck for a "... should match JSON field" step, None for any other step"""
+    for pattern in FIELD_STEPS:
+        match = pattern.match(step.name)
+        if match:
+            groups = match.groupdict()
+            return FieldCheck(
+                kind=groups.get("kind"),
+                index=int(groups["index"]) if groups.get("index") else None,
+                field=groups["field"].lower().replace(" ", "_"),
+                json_path=groups["path"],
+                location=str(step.location),
+            )
+    return None
+
+
+def pending_checks(scenario, step):
+    """The consecutive field check steps starting at step (background steps included)"""
+    steps = list(scenario.all_steps)
+    start = next(index for index, candidate in enumerate(steps) if candidate is step)
+    checks = []
+    for candidate in steps[start:]:
+        check = field_check(candidate)
+        if check is None:
+            break
+        checks.append((candidate, check))
+    return checks
+
+
+def extract_page(page):
+    """{"cards": {kind: [{"label", "fields"}]}, "page": {field: value}} in one evaluation"""
+    return page.evaluate(EXTRACT_SCRIPT, [CARD_SELECTORS, CARD_ROOT])
+
+
+def _text(value):
+    return " ".join(str(value).split())
+
+
+def values_match(expected, actual):
+    """JSON value vs rendered text, allowing for units and formatting around numbers"""
+    if isinstance(expected, list):
+        actual = actual if isinstance(actual, list) else [actual]
+        return len(expected) == len(actual) and all(values_match(e, a) for e, a in zip(expected, actual))
+    if isinstance(actual, list):
+        return len(actual) == 1 and values_match(expected, actual[0])
+    if isinstance(expected, bool):
+        return _text(actual).lower() == str(expected).lower()
+    if isinstance(expected, (int, float)):
+        numbers = NUMBER.findall(_text(actual).replace(",", ""))
+        return len(numbers) == 1 and float(numbers[0]) == float(expected)
+    if expected is None:
+        return _text(actual) in ("", "null")
+    if isinstance(expected, dict):
+        return False
+    return _text(expected) == _text(actual)
+
+
+def dom_location(check, label=""):
+    if check.kind is None:
+        return f"page.{check.field}"
+    return f"{check.kind} card {check.index}{f' [{label}]' if label else ''}.{check.field}"
+
+
+def compare(checks, snapshot, resolve):
+    """
+    Diff every check against the page snapshot.
+
+    resolve(json_path) returns the JSON value; each distinct path is
+    resolved once. Returns a list of mismatch dicts (location, dom, json_path,
+    expected, actual, reason), one per failing check, in check order.
+    """
+    resolved = {}
+    for check in checks:
+        if check.json_path not in resolved:
+            try:
+                resolved[check.json_path] = (True, resolve(check.json_path))
+            except (KeyError, IndexError, TypeError):
+                resolved[check.json_path] = (False, None)
+
+    mismatches = []
+    for check in checks:
+        found, expected = resolved[check.json_path]
+        label = ""
+        if check.kind is None:
+            fields = snapshot["page"]
+        else:
+            cards = snapshot["cards"].get(check.kind, [])
+            if check.index > len(cards):
+                fields = None
+            else:
+                label = cards[check.index - 1]["label"]
+                fields = cards[check.index - 1]["fields"]
+
+        actual = None if fields is None else fields.get(check.field)
+        if not found:
+            reason = "JSON path not found"
+        elif fields is None:
+            reason = f"only {len(snapshot['cards'].get(check.kind, []))} {check.kind} cards on the page"
+        elif actual is None:
+            reason = "field not rendered"
+        elif not values_match(expected, actual):
+            reason = "value differs"
+        else:
+            continue
+        mismatches.append({
+            "location": check.location,
+            "dom": dom_location(check, label),
+            "json_path": check.json_path,
+            "expected": expected,
+            "actual": actual,
+            "reason": reason,
+        })
+    return mismatches
+
+
+def format_mismatches(mismatches, total):
+    lines = [f"{len(mismatches)} of {total} JSON field checks failed:"]
+    for mismatch in mismatches:
+        lines.append(f"  {mismatch['location']}  {mismatch['dom']} vs {mismatch['json_path']}: "
+                     f"{mismatch['reason']} (expected {mismatch['expected']!r}, found {mismatch['actual']!r})")
+    return "\n".join(lines)
@@ -0,0 +1,283 @@
+"""
+Load Generator for the Dashboard API Routes
+Purpose: Drive the Next.js API routes at fixed concurrency and measure them
+Infrastructure: Real dashboard server, real HTTP (NO MOCKS), stdlib asyncio only
+
+Each virtual client holds one keep-alive HTTP/1.1 connection and cycles
+through the routes under test, so the numbers reflect the server rather
+than connection setup. Latency is measured to the last byte of the body.
+
+Used by the load steps in dashboard_validation_steps.py and as a CLI:
+    python load_generator.py --concurrency 20 --duration 30
+    python load_generator.py --route /api/bdd/features --requests 500 --start-server
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import urllib.parse
+
+DEFAULT_ROUTES = ("/api/bdd/features", "/api/skateboard/dashboard")
+
+# Latency histogram bucket upper bounds, in milliseconds (last bucket is open-ended)
+HISTOGRAM_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class RouteStats:
+    """Latencies and outcomes for one route (or the total across routes)"""
+
+    def __init__(self, route):
+        self.route = route
+        self.latencies_ms = []
+        self.errors = 0
+        self.status_counts = {}
+        self.bytes = 0
+        self.seconds = 0.0
+
+    @property
+    def requests(self):
+        return len(self.latencies_ms) + self.errors
+
+    def add(self, status, latency_ms, size):
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        if status is None or status >= 400:
+            self.errors += 1
+        else:
+            self.latencies_ms.append(latency_ms)
+            self.bytes += size
+
+    def merge(self, other):
+        self.latencies_ms.extend(other.latencies_ms)
+        self.errors += other.errors
+        self.bytes += other.bytes
+        for status, count in other.status_counts.items():
+            self.status_counts[status] = self.status_counts.get(status, 0) + count
+
+    def percentile(self, pct):
+        """Linear-interpolated latency percentile (ms) of successful requests; None if none succeeded"""
+        ordered = sorted(self.latencies_ms)
+        if not ordered:
+            return None
+        position = (len(ordered) - 1) * pct / 100
+        lower = int(position)
+        upper = min(lower + 1, len(ordered) - 1)
+        return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+    @property
+    def error_rate(self):
+        return self.errors / self.requests * 100 if self.requests else 0.0
+
+    @property
+    def throughput(self):
+        """Successful requests per second (failures are in error_rate/error_throughput)"""
+        return len(self.latencies_ms) / self.seconds if self.seconds else 0.0
+
+    @property
+    def error_throughput(self):
+        return self.errors / self.seconds if self.seconds else 0.0
+
+    def histogram(self):
+        """[(bucket upper bound in ms or None for overflow, count)]"""
+        counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        for latency in self.latencies_ms:
+            for index, bound in enumerate(HISTOGRAM_BUCKETS_MS):
+                if latency <= bound:
+                    counts[index] += 1
+                    break
+            else:
+                counts[-1] += 1
+        return list(zip(HISTOGRAM_BUCKETS_MS + (None,), counts))
+
+    def to_dict(self):
+        def rounded(value):
+            return None if value is None else round(value, 2)
+
+        return {
+            "route": self.route,
+            "requests": self.requests,
+            "errors": self.errors,
+            "error_rate": round(self.error_rate, 3),
+            "throughput": round(self.throughput, 2),
+            "error_throughput": round(self.error_throughput, 2),
+            "p50_ms": rounded(self.percentile(50)),
+            "p95_ms": rounded(self.percentile(95)),
+            "p99_ms": rounded(self.percentile(99)),
+            "max_ms": round(max(self.latencies_ms, default=0.0), 2),
+            "status_counts": {str(status): count for status, count in self.status_counts.items()},
+            "histogram": [{"le_ms": bound, "count": count} for bound, count in self.histogram()],
+        }
+
+
+async def _read_response(reader):
+    """(status, body size, keep_alive) for one HTTP/1.1 response"""
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ", 2)[1])
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+
+    size = 0
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        while True:
+            chunk_size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+            if chunk_size == 0:
+                # Trailers, then the blank line ending the message
+                while await reader.readuntil(b"\r\n") != b"\r\n":
+                    pass
+                break
+            await reader.readexactly(chunk_size + 2)
+            size += chunk_size
+    elif "content-length" in headers:
+        size = int(headers["content-length"])
+        await reader.readexactly(size)
+    elif status not in (204, 304):
+        # No framing: body runs until the server closes the connection
+        size = len(await reader.read())
+        return status, size, False
+
+    return status, size, headers.get("connection", "").lower() != "close"
+
+
+async def _client(base, routes, stats, budget, deadline, timeout):
+    """One virtual client: a keep-alive connection cycling through routes"""
+    host, port = base.hostname, base.port or 80
+    connection = None
+    index = 0
+
+    while time.perf_counter() < deadline:
+        if budget is not None:
+            if budget[0] <= 0:
+                break
+            budget[0] -= 1
+
+        route = routes[index % len(routes)]
+        index += 1
+        request = (f"GET {route} HTTP/1.1\r\nHost: {base.netloc}\r\n"
+                   f"Accept: application/json\r\nConnection: keep-alive\r\n\r\n").encode()
+        started = time.perf_counter()
+        try:
+            if connection is None:
+                connection = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+            reader, writer = connection
+            writer.write(request)
+            await writer.drain()
+            status, size, keep_alive = await asyncio.wait_for(_read_response(reader), timeout)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError):
+            stats[route].add(None, 0.0, 0)
+            if connection:
+                connection[1].close()
+            connection = None
+            continue
+
+        stats[route].add(status, (time.perf_counter() - started) * 1000, size)
+        if not keep_alive:
+            writer.close()
+            connection = None
+
+    if connection:
+        connection[1].close()
+
+
+async def run_load(base_url, routes=DEFAULT_ROUTES, concurrency=10, duration=None, requests=None, timeout=10.0):
+    """
+    Drive routes with `concurrency` clients until `requests` have been sent
+    or `duration` seconds have passed (whichever is set; both may be).
+    Returns {route: RouteStats} plus a "total" entry.
+    """
+    if duration is None and requests is None:
+        raise ValueError("Set duration, requests or both")
+
+    base = urllib.parse.urlsplit(base_url)
+    stats = {route: RouteStats(route) for route in routes}
+    budget = [requests] if requests is not None else None
+    deadline = time.perf_counter() + (duration if duration is not None else float("inf"))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_client(base, list(routes), stats, budget, deadline, timeout)
+                           for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    total = RouteStats("total")
+    for route_stats in stats.values():
+        route_stats.seconds = elapsed
+        total.merge(route_stats)
+    total.seconds = elapsed
+    stats["total"] = total
+    return stats
+
+
+def load_test(base_url, routes=DEFAULT_ROUTES, concurrency=10, duration=None, requests=None, timeout=10.0):
+    """Synchronous wrapper around run_load for behave steps"""
+    return asyncio.run(run_load(base_url, routes, concurrency, duration, requests, timeout))
+
+
+def report_lines(stats):
+    """Human-readable summary, one block per route"""
+    lines = []
+    for route, route_stats in stats.items():
+        lines.append(f"{route}: {route_stats.requests} requests, {route_stats.throughput:.1f} req/s ok, "
+                     f"{route_stats.errors} failed ({route_stats.error_rate:.2f}%, "
+                     f"{route_stats.error_throughput:.1f} req/s)")
+        if route_stats.latencies_ms:
+            lines.append(f"   p50 {route_stats.percentile(50):.1f}ms  p95 {route_stats.percentile(95):.1f}ms  "
+                         f"p99 {route_stats.percentile(99):.1f}ms")
+        else:
+            lines.append("   no successful requests; latency percentiles unavailable")
+        peak = max((count for _, count in route_stats.histogram()), default=0) or 1
+        for bound, count in route_stats.histogram():
+            label = f"<={bound}ms" if bound is not None else f">{HISTOGRAM_BUCKETS_MS[-1]}ms"
+            lines.append(f"   {label:>9} {'#' * round(count / peak * 40):<40} {count}")
+    return lines
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the dashboard API routes")
+    parser.add_argument("--url", default=os.getenv("DASHBOARD_URL", "http://localhost:3000"),
+                        help="Dashboard base URL")
+    parser.add_argument("--route", action="append", dest="routes",
+                        help=f"Route to drive (repeatable, default: {', '.join(DEFAULT_ROUTES)})")
+    parser.add_argument("--concurrency", type=int, default=10, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=None, help="Seconds to run")
+    parser.add_argument("--requests", type=int, default=None, help="Total requests to send")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Per-request timeout in seconds")
+    parser.add_argument("--start-server", action="store_true",
+                        help="Run `next start` if nothing answers at --url")
+    parser.add_argument("--json", default=None, help="Also write results as JSON to this path")
+    args = parser.parse_args(argv)
+    if args.duration is None and args.requests is None:
+        args.duration = 10.0
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    routes = tuple(args.routes or DEFAULT_ROUTES)
+
+    server = None
+    if args.start_server:
+        from browser_pool import DashboardServer
+
+        server = DashboardServer(args.url, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        server.start()
+
+    try:
+        print(f"⏱️  {args.concurrency} clients against {args.url} ({', '.join(routes)})")
+        stats = load_test(args.url, routes, args.concurrency, args.duration, args.requests, args.timeout)
+    finally:
+        if server:
+            server.stop()
+
+    for line in report_lines(stats):
+        print(line)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({route: route_stats.to_dict() for route, route_stats in stats.items()}, f, indent=2)
+        print(f"📁 Output: {args.json}")
+
+    sys.exit(1 if stats["total"].errors else 0)
@@ -0,0 +1,198 @@
+"""
+Historical Test-Run Metrics Store for Dashboard Validation Tests
+Purpose: Persist scenario/step timings and in-page measurements per test_run_id
+Storage: Local SQLite file (WAL mode, safe for parallel behave workers)
+
+Tables:
+    runs          one row per (test_run_id, worker)
+    scenarios     one row per executed scenario
+    steps         one row per executed step, with its step definition
+    measurements  render/navigation/web-vital/load values recorded by the steps
+
+Queried by scripts/metrics_report.py for p50/p95 trends and regressions.
+"""
+
+import os
+import sqlite3
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    test_run_id TEXT NOT NULL,
+    worker INTEGER NOT NULL DEFAULT 0,
+    started_at REAL NOT NULL,
+    finished_at REAL,
+    dashboard_url TEXT,
+    environment TEXT,
+    PRIMARY KEY (test_run_id, worker)
+);
+CREATE TABLE IF NOT EXISTS scenarios (
+    id INTEGER PRIMARY KEY,
+    test_run_id TEXT NOT NULL,
+    worker INTEGER NOT NULL DEFAULT 0,
+    feature TEXT NOT NULL,
+    scenario TEXT NOT NULL,
+    location TEXT,
+    status TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    duration_ms REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS steps (
+    scenario_id INTEGER NOT NULL REFERENCES scenarios(id),
+    position INTEGER NOT NULL,
+    step_type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    step_definition TEXT,
+    status TEXT NOT NULL,
+    duration_ms REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS measurements (
+    scenario_id INTEGER NOT NULL REFERENCES scenarios(id),
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scenarios_name ON scenarios (scenario, started_at);
+CREATE INDEX IF NOT EXISTS idx_scenarios_started ON scenarios (started_at);
+CREATE INDEX IF NOT EXISTS idx_scenarios_run ON scenarios (test_run_id);
+CREATE INDEX IF NOT EXISTS idx_steps_scenario ON steps (scenario_id);
+CREATE INDEX IF NOT EXISTS idx_steps_definition ON steps (step_definition);
+CREATE INDEX IF NOT EXISTS idx_measurements_scenario ON measurements (scenario_id);
+CREATE INDEX IF NOT EXISTS idx_measurements_name ON measurements (kind, name);
+"""
+
+# Load measurements that are not latencies: metric suffix -> (unit, higher is better)
+MEASUREMENT_METRICS = {
+    "throughput": ("req/s", True),
+    "error_rate": ("%", False),
+}
+
+# Columns added after the first release of the schema: (table, column, type)
+MIGRATIONS = (
+    ("runs", "environment", "TEXT"),
+)
+
+
+def detect_environment():
+    """Environment profile name, detected the same way as TimeoutManager.detectEnvironment"""
+    if os.getenv('CI'):
+        return 'ci_cd'
+    if os.getenv('NODE_ENV') == 'production':
+        return 'production'
+    return 'development'
+
+
+def connect(path):
+    """Open (creating if needed) the metrics database at path"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    connection = sqlite3.connect(path, timeout=30)
+    connection.row_factory = sqlite3.Row
+    # WAL lets parallel workers append while a report reads
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.executescript(SCHEMA)
+    for table, column, column_type in MIGRATIONS:
+        columns = {row["name"] for row in connection.execute(f"PRAGMA table_info({table})")}
+        if column not in columns:
+            connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+    return connection
+
+
+class MetricsStore:
+    """
+    Writer used by environment.py; one instance per behave process.
+
+    Usage:
+        store = MetricsStore(path, run_id, worker, dashboard_url)
+        store.record_scenario(scenario, duration_ms, measurements, step_registry)
+        store.close()
+    """
+
+    def __init__(self, path, test_run_id, worker=None, dashboard_url=None):
+        self.path = path
+        self.test_run_id = test_run_id
+        self.worker = int(worker or 0)
+        self.connection = connect(path)
+        self._definitions = {}
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO runs (test_run_id, worker, started_at, dashboard_url, environment) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (test_run_id, self.worker, time.time(), dashboard_url, detect_environment()),
+            )
+
+    def _definition(self, step, step_registry):
+        key = (step.step_type, step.name)
+        if key not in self._definitions:
+            matcher = step_registry.find_step_definition(step) if step_registry else None
+            self._definitions[key] = matcher.pattern if matcher else None
+        return self._definitions[key]
+
+    def record_scenario(self, scenario, started_at, duration_ms, measurements=(), step_registry=None):
+        """
+        Store one scenario with its steps (background included) and
+        measurements, an iterable of (kind, name, value) tuples.
+        """
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO scenarios (test_run_id, worker, feature, scenario, location, status, started_at, "
+                "duration_ms) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.test_run_id, self.worker, scenario.feature.name, scenario.name, str(scenario.location),
+                 scenario.status.name, started_at, duration_ms),
+            )
+            scenario_id = cursor.lastrowid
+            self.connection.executemany(
+                "INSERT INTO steps (scenario_id, position, step_type, name, step_definition, status, duration_ms) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(scenario_id, position, step.step_type, step.name, self._definition(step, step_registry),
+                  step.status.name, (step.duration or 0.0) * 1000)
+                 for position, step in enumerate(scenario.all_steps)],
+            )
+            self.connection.executemany(
+                "INSERT INTO measurements (scenario_id, kind, name, value) VALUES (?, ?, ?, ?)",
+                [(scenario_id, kind, name, value) for kind, name, value in measurements if value is not None],
+            )
+
+    def close(self):
+        with self.connection:
+            self.connection.execute(
+                "UPDATE runs SET finished_at = ? WHERE test_run_id = ? AND worker = ?",
+                (time.time(), self.test_run_id, self.worker),
+            )
+        self.connection.close()
+
+
+def measurement_unit(kind, name):
+    """Unit a measurement is recorded in (timings are milliseconds)"""
+    metric = name.rsplit(':', 1)[-1]
+    if kind == 'load' and metric in MEASUREMENT_METRICS:
+        return MEASUREMENT_METRICS[metric][0]
+    if kind == 'web_vital' and name == 'cls':
+        return 'score'
+    return 'ms'
+
+
+def higher_is_better(kind, name):
+    """Whether a larger value is an improvement (throughput) rather than a slowdown"""
+    metric = name.rsplit(':', 1)[-1]
+    return kind == 'load' and metric in MEASUREMENT_METRICS and MEASUREMENT_METRICS[metric][1]
+
+
+def scenario_measurements(context):
+    """(kind, name, value) tuples for everything the steps measured in the page"""
+    measurements = []
+    for name, value in (getattr(context, 'render_timings', None) or {}).items():
+        measurements.append(("render", name, value))
+    for name, value in (getattr(context, 'web_vitals', None) or {}).items():
+        measurements.append(("web_vital", name, value))
+    for name, value in (getattr(context, 'navigation_timing', None) or {}).items():
+        measurements.append(("navigation", name, value))
+    for route, stats in (getattr(context, 'load_results', None) or {}).items():
+        for pct in (50, 95, 99):
+            latency = stats.percentile(pct)
+            if latency is not None:
+                measurements.append(("load", f"{route}:p{pct}", latency))
+        measurements.append(("load", f"{route}:throughput", stats.throughput))
+        measurements.append(("load", f"{route}:error_rate", stats.error_rate))
+    return measurements
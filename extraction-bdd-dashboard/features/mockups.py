@@ -0,0 +1,82 @@
+"""
+Mockup JSON Cache for Dashboard Validation Tests
+Purpose: Parse each mockup option file once per run for the JSON mapping steps
+Source: specs/mockups/ (option_a_enablements.json, option_b_shared_steps.json, option_hybrid.json)
+
+The mockups directory is resolved once, with the same fallbacks as
+app/lib/mockups.ts: MOCKUP_DIR, then ../specs/mockups, then
+../../specs/mockups relative to the dashboard. Parsed files are kept for the
+whole run and re-read only if a file's mtime or size changes. Callers get the
+shared parsed object and must not modify it.
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MOCKUP_FILES = ("option_a_enablements.json", "option_b_shared_steps.json", "option_hybrid.json")
+
+
+def find_mockup_dir():
+    """First candidate directory that exists (the first candidate if none does)"""
+    candidates = [os.path.join(PROJECT_DIR, '..', 'specs', 'mockups'),
+                  os.path.join(PROJECT_DIR, '..', '..', 'specs', 'mockups')]
+    if os.getenv('MOCKUP_DIR'):
+        candidates.insert(0, os.getenv('MOCKUP_DIR'))
+    for candidate in candidates:
+        if os.path.isdir(candidate):
+            return os.path.abspath(candidate)
+    return os.path.abspath(candidates[0])
+
+
+class MockupCache:
+    """
+    Session-scoped mockup files.
+
+    Usage (environment.py before_all):
+        context.mockups = MockupCache()
+        context.mockups.preload()
+    Steps:
+        context.mockup_json = context.mockups.load("option_a_enablements.json")
+    """
+
+    def __init__(self, mockup_dir=None):
+        self.mockup_dir = mockup_dir or find_mockup_dir()
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def path(self, filename):
+        return os.path.join(self.mockup_dir, filename)
+
+    def load(self, filename):
+        """Parsed JSON of one mockup file; raises FileNotFoundError with the resolved path"""
+        path = self.path(filename)
+        stats = os.stat(path)
+        key = (stats.st_mtime_ns, stats.st_size)
+        entry = self._entries.get(filename)
+        if entry and entry[0] == key:
+            return entry[1]
+
+        with open(path, 'r') as f:
+            data = json.load(f)
+        with self._lock:
+            self._entries[filename] = (key, data)
+            self.loads += 1
+        return data
+
+    def preload(self, filenames=MOCKUP_FILES):
+        """Parse the option files in parallel; returns {filename: error} for those that failed"""
+        def load(filename):
+            try:
+                self.load(filename)
+                return filename, None
+            except (OSError, ValueError) as error:
+                return filename, error
+
+        with ThreadPoolExecutor(max_workers=len(filenames) or 1) as executor:
+            results = executor.map(load, filenames)
+        return {filename: error for filename, error in results if error is not None}
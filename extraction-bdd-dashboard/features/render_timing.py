@@ -0,0 +1,273 @@
+"""
+In-Page Render Timing for Dashboard Validation Tests
+Purpose: Measure section render times inside the browser, not around it
+Infrastructure: Real browser (Playwright), Performance API (NO MOCKS)
+
+An init script is installed on every pooled browser context before any page
+script runs. It keeps window.__renderTiming up to date with:
+    - LCP, FCP and CLS from PerformanceObserver
+    - a performance.mark('section:<name>') the first time each dashboard
+      section in SECTION_SELECTORS appears (MutationObserver), and again
+      each time more of its elements appear
+
+All times are milliseconds from the current origin: navigation start after a
+page load, or the trusted click event after begin() arms an interaction.
+Python round trips and behave overhead are never part of a measurement.
+"""
+
+import json
+import os
+
+# Dashboard sections, by the data-testid the dashboard views render them with
+# (app/bdd-progress/page.tsx, components/UniversalCard.tsx)
+SECTION_SELECTORS = {
+    "dashboard": '[data-testid="bdd-progress-dashboard"]',
+    "enablement_cards": '[data-testid="enablement-card"]',
+    "step_cards": '[data-testid="step-card"]',
+}
+
+# Sections of the PM/EM option views, which no dashboard page renders yet;
+# steps on them fail at once instead of waiting out the SLA
+UNRENDERED_SECTIONS = {
+    "blocker_analysis": '[data-testid="blocker-analysis"]',
+    "shared_steps": '[data-testid="shared-steps"]',
+    "quality_scores": '[data-testid="quality-score"]',
+}
+
+# Extra wait beyond an SLA, so a breach reports the real time instead of a timeout
+GRACE_SECONDS = 5
+
+# Calibrated budgets (timeout-strategy.yaml) may relax a literal .feature SLA
+# by at most this factor, so a loaded CI host stops flaking but a real
+# regression still fails
+MAX_BUDGET_STRETCH = 2.0
+
+# timeout-strategy.yaml profile key per measurement the steps assert on
+BUDGET_KEYS = {
+    "page_load": "page_load_p95",
+    "section_render": "render_p95",
+    "view_switch": "view_switch_p95",
+}
+
+INIT_SCRIPT = """
+(() => {
+  if (window.__renderTiming) return;
+  const SECTIONS = %s;
+  const seen = new WeakSet();
+  const state = {
+    label: 'navigation',
+    origin: 0,
+    armed: false,
+    sections: {},
+    vitals: { lcp: null, fcp: null, cls: 0 },
+  };
+
+  const scan = () => {
+    const now = performance.now();
+    for (const [name, selector] of Object.entries(SECTIONS)) {
+      let added = 0;
+      for (const element of document.querySelectorAll(selector)) {
+        if (!seen.has(element)) {
+          seen.add(element);
+          added += 1;
+        }
+      }
+      if (!added) continue;
+      performance.mark(`section:${name}`);
+      const section = state.sections[name];
+      state.sections[name] = {
+        first: section ? section.first : now - state.origin,
+        last: now - state.origin,
+        count: (section ? section.count : 0) + added,
+      };
+    }
+  };
+  new MutationObserver(scan).observe(document, { childList: true, subtree: true });
+
+  const observe = (type, callback) => {
+    try {
+      new PerformanceObserver((list) => list.getEntries().forEach(callback)).observe({ type, buffered: true });
+    } catch (error) {
+      // Entry type not supported by this browser engine
+    }
+  };
+  observe('largest-contentful-paint', (entry) => { state.vitals.lcp = entry.startTime; });
+  observe('paint', (entry) => {
+    if (entry.name === 'first-contentful-paint') state.vitals.fcp = entry.startTime;
+  });
+  observe('layout-shift', (entry) => {
+    if (!entry.hadRecentInput) state.vitals.cls += entry.value;
+  });
+
+  // The trusted click itself is the origin of an interaction measurement
+  addEventListener('click', (event) => {
+    if (!state.armed) return;
+    state.armed = false;
+    state.origin = event.timeStamp;
+    performance.mark(`begin:${state.label}`);
+  }, true);
+
+  const nextPaint = () => new Promise((resolve) =>
+    requestAnimationFrame(() => requestAnimationFrame(() => resolve(performance.now()))));
+
+  window.__renderTiming = {
+    begin(label) {
+      // Elements already on screen belong to the previous view
+      for (const selector of Object.values(SECTIONS)) {
+        document.querySelectorAll(selector).forEach((element) => seen.add(element));
+      }
+      state.label = label;
+      state.sections = {};
+      state.armed = true;
+    },
+    async painted() {
+      const now = await nextPaint();
+      performance.mark(`painted:${state.label}`);
+      return now - state.origin;
+    },
+    whenPresent(selector) {
+      const elapsed = () => performance.now() - state.origin;
+      if (document.querySelector(selector)) return Promise.resolve(elapsed());
+      return new Promise((resolve) => {
+        const observer = new MutationObserver(() => {
+          if (document.querySelector(selector)) {
+            observer.disconnect();
+            resolve(elapsed());
+          }
+        });
+        observer.observe(document, { childList: true, subtree: true });
+      });
+    },
+    snapshot() {
+      const navigation = performance.getEntriesByType('navigation')[0];
+      return {
+        label: state.label,
+        sections: state.sections,
+        vitals: state.vitals,
+        navigation: navigation ? {
+          dom_content_loaded: navigation.domContentLoadedEventEnd,
+          load: navigation.loadEventEnd,
+        } : null,
+      };
+    },
+  };
+})();
+""" % json.dumps(SECTION_SELECTORS)
+
+
+def load_budgets(path, environment):
+    """
+    Calibrated budgets (ms) for environment from timeout-strategy.yaml,
+    keyed like BUDGET_KEYS; empty when the file or PyYAML is missing.
+    """
+    try:
+        import yaml
+    except ImportError:
+        return {}
+    if not os.path.exists(path):
+        return {}
+
+    with open(path) as f:
+        strategy = yaml.safe_load(f) or {}
+    profile = (strategy.get("environments") or {}).get(environment) or {}
+    return {name: profile[key] for name, key in BUDGET_KEYS.items() if key in profile}
+
+
+def sla_ms(context, budget_name, literal_ms):
+    """
+    Effective limit for a timing assertion: the literal SLA, relaxed to the
+    calibrated budget for this environment but never past MAX_BUDGET_STRETCH.
+    """
+    budget = (getattr(context, "timeout_budgets", None) or {}).get(budget_name)
+    if not budget:
+        return literal_ms
+    return max(literal_ms, min(budget, literal_ms * MAX_BUDGET_STRETCH))
+
+
+def install(browser_context):
+    """Install the timing script on every page the context opens"""
+    browser_context.add_init_script(INIT_SCRIPT)
+
+
+def snapshot(page):
+    """Current timing state: sections, web vitals and navigation timing (ms)"""
+    return page.evaluate("() => window.__renderTiming.snapshot()")
+
+
+def begin(page, label):
+    """Arm an interaction: the next click becomes the origin for section times"""
+    page.evaluate("label => window.__renderTiming.begin(label)", label)
+
+
+def painted(page):
+    """Milliseconds from the armed click to the next frame painted after it"""
+    return page.evaluate("() => window.__renderTiming.painted()")
+
+
+def when_present(page, selector, timeout_seconds):
+    """Milliseconds from the origin until selector first matched"""
+    return page.evaluate(
+        """([selector, timeout]) => Promise.race([
+            window.__renderTiming.whenPresent(selector),
+            new Promise((resolve) => setTimeout(() => resolve(null), timeout)),
+        ])""",
+        [selector, timeout_seconds * 1000],
+    )
+
+
+def wait_for_sections(page, names, timeout_seconds, settle=False):
+    """
+    Wait (in the browser) until every named section has rendered since the
+    origin, then return the timing snapshot. With settle, also wait for the
+    network to go idle so late-arriving cards are counted.
+    """
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    timeout_ms = (timeout_seconds + GRACE_SECONDS) * 1000
+    try:
+        page.wait_for_function(
+            "names => names.every(name => window.__renderTiming.snapshot().sections[name])",
+            arg=list(names), timeout=timeout_ms,
+        )
+        if settle:
+            page.wait_for_load_state("networkidle", timeout=timeout_ms)
+    except PlaywrightTimeoutError:
+        # Missing sections are reported by the caller's assertion
+        pass
+    return snapshot(page)
+
+
+def assert_rendered_within(context, names, seconds, settle=False):
+    """
+    Measure sections in the page, record them on context.render_timings /
+    context.web_vitals and fail the step if any breached the SLA.
+
+    settle measures until the last element of each section appeared
+    ("all cards"), otherwise until the first one did.
+    """
+    for name in names:
+        if name in UNRENDERED_SECTIONS:
+            raise AssertionError(f"{name} ({UNRENDERED_SECTIONS[name]}) is not rendered by any dashboard view")
+        if name not in SECTION_SELECTORS:
+            raise ValueError(f"Unknown dashboard section: {name}. "
+                             f"Valid sections are: {', '.join(SECTION_SELECTORS)}")
+
+    limit_ms = sla_ms(context, "section_render", seconds * 1000)
+    timing = wait_for_sections(context.page, names, limit_ms / 1000, settle)
+    context.web_vitals = timing["vitals"]
+    context.navigation_timing = timing["navigation"]
+    if not hasattr(context, "render_timings"):
+        context.render_timings = {}
+
+    breaches = []
+    for name in names:
+        section = timing["sections"].get(name)
+        if section is None:
+            breaches.append(f"{name} did not render within {limit_ms / 1000 + GRACE_SECONDS:.1f}s")
+            continue
+        elapsed_ms = section["last"] if settle else section["first"]
+        context.render_timings[name] = elapsed_ms
+        if elapsed_ms > limit_ms:
+            breaches.append(f"{name} rendered in {elapsed_ms:.0f}ms (>{limit_ms:.0f}ms)")
+
+    assert not breaches, "; ".join(breaches)
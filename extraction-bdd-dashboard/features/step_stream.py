@@ -0,0 +1,187 @@
+"""
+Live Step Result Stream for Dashboard Validation Tests
+Purpose: Append every step result to a JSONL stream the moment it completes
+Output: public/bdd-data/live/step-stream.jsonl, tailed by GET /api/bdd/progress/stream
+
+behave only writes behave-results.json when the run ends; this formatter
+lets the bdd-progress page follow a run as it happens. One JSON object per
+line, each with a "type":
+
+    run            a behave process started (run_id, worker)
+    feature        a feature started
+    scenario       a scenario started
+    step           a step finished: status, duration, error_message, and its
+                   index in the scenario's steps (Background steps first, as
+                   in behave's JSON report)
+    scenario_end   a scenario finished: status, duration
+    feature_end    a feature finished in this process
+    worker_end     the behave process is done
+
+feature_id is the id /api/bdd/features uses. The formatter never blocks the
+run: callbacks only queue a dict, and a background thread serializes and
+appends queued events in batches with one O_APPEND write, so parallel
+workers can share the file without interleaving lines.
+
+Usage:
+    behave -f features.step_stream:StepStreamFormatter -f pretty
+    STEP_STREAM=/tmp/steps.jsonl behave -f features.step_stream:StepStreamFormatter -f progress
+
+A single-process run moves the previous stream to step-stream.prev.jsonl;
+scripts/run_behave_parallel.py does that once for all its workers.
+"""
+
+import json
+import os
+import queue
+import re
+import threading
+import time
+
+from behave.formatter.base import Formatter
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_STREAM = os.path.join(PROJECT_DIR, 'public', 'bdd-data', 'live', 'step-stream.jsonl')
+
+# Events serialized per write; bounds the work done per batch
+MAX_BATCH = 256
+
+_STOP = object()
+
+
+def feature_id(name):
+    """Same id the features route derives: lowercased, whitespace runs -> _"""
+    return re.sub(r"\s+", "_", name.lower())
+
+
+def previous_stream_path(path):
+    root, extension = os.path.splitext(path)
+    return f"{root}.prev{extension}"
+
+
+def rotate_stream(path):
+    """Start a new stream for a new run, keeping the last one"""
+    if os.path.exists(path):
+        os.replace(path, previous_stream_path(path))
+
+
+class StreamWriter(threading.Thread):
+    """Background appender; put() never blocks the caller"""
+
+    def __init__(self, path):
+        super().__init__(name="step-stream-writer", daemon=True)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self.queue = queue.SimpleQueue()
+        self.failed = False
+
+    def put(self, event):
+        self.queue.put(event)
+
+    def run(self):
+        stopping = False
+        while not stopping:
+            events = [self.queue.get()]
+            while len(events) < MAX_BATCH:
+                try:
+                    events.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if events[-1] is _STOP:
+                stopping = True
+                events.pop()
+            if not events or self.failed:
+                continue
+
+            # One write per batch: O_APPEND appends it contiguously, so lines
+            # from other worker processes never land inside it
+            payload = "".join(json.dumps(event, separators=(",", ":"), default=str) + "\n"
+                              for event in events).encode()
+            try:
+                os.write(self.fd, payload)
+            except OSError as error:
+                # Losing the live view must not fail the run
+                self.failed = True
+                print(f"⚠️  Step stream disabled ({self.path}): {error}")
+        os.close(self.fd)
+
+    def close(self, timeout=5.0):
+        self.queue.put(_STOP)
+        self.join(timeout)
+
+
+class StepStreamFormatter(Formatter):
+    """behave formatter appending step results to the live JSONL stream"""
+
+    name = "step_stream"
+    description = "Append each step result to a JSONL stream as it completes"
+
+    def __init__(self, stream_opener, config):
+        super().__init__(stream_opener, config)
+        path = os.getenv('STEP_STREAM') or stream_opener.name or DEFAULT_STREAM
+        self.run_id = os.getenv('TEST_RUN_ID') or f"dashboard-validation-{int(time.time())}"
+        self.worker = int(os.getenv('BEHAVE_WORKER') or 0)
+        if os.getenv('BEHAVE_WORKER') is None:
+            rotate_stream(path)
+
+        self.writer = StreamWriter(path)
+        self.writer.start()
+        self.current_feature = None
+        self.current_scenario = None
+        self.step_positions = {}
+        self.emit("run", pid=os.getpid())
+
+    def emit(self, event_type, **fields):
+        event = {"type": event_type, "run_id": self.run_id, "worker": self.worker, "ts": time.time()}
+        event.update(fields)
+        self.writer.put(event)
+
+    def _end_scenario(self):
+        scenario = self.current_scenario
+        if scenario is not None:
+            self.emit("scenario_end", feature_id=feature_id(self.current_feature.name), scenario=scenario.name,
+                      status=scenario.status.name, duration=scenario.duration)
+        self.current_scenario = None
+
+    # -- FORMATTER API:
+    def feature(self, feature):
+        self.current_feature = feature
+        self.emit("feature", feature_id=feature_id(feature.name), feature=feature.name,
+                  location=str(feature.location))
+
+    def scenario(self, scenario):
+        self._end_scenario()
+        self.current_scenario = scenario
+        # Background steps come first, as in behave's JSON report
+        self.step_positions = {id(step): index for index, step in enumerate(scenario.all_steps)}
+        self.emit("scenario", feature_id=feature_id(self.current_feature.name), scenario=scenario.name,
+                  location=str(scenario.location))
+
+    def result(self, step):
+        if self.current_scenario is None:
+            return
+        event = {
+            "feature_id": feature_id(self.current_feature.name),
+            "scenario": self.current_scenario.name,
+            "index": self.step_positions.get(id(step)),
+            "step": f"{step.keyword} {step.name}",
+            "status": step.status.name,
+            "duration": step.duration,
+        }
+        if step.error_message and step.status.has_failed():
+            event["error_message"] = step.error_message
+        self.emit("step", **event)
+
+    def eof(self):
+        self._end_scenario()
+        if self.current_feature is not None:
+            self.emit("feature_end", feature_id=feature_id(self.current_feature.name),
+                      status=self.current_feature.status.name, duration=self.current_feature.duration)
+        self.current_feature = None
+
+    def close(self):
+        self._end_scenario()
+        self.emit("worker_end")
+        self.writer.close()
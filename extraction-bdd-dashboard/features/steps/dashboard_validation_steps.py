@@ -5,9 +5,15 @@ Infrastructure: Real browser, real dashboard server (NO MOCKS)
 """
 
 from behave import given, when, then
+from functools import lru_cache
 import time
 import json
 import os
+import urllib.request
+
+import json_mapping
+import load_generator
+import render_timing
 
 
 # ============================================================================
@@ -23,8 +29,7 @@ def step_impl(context, url):
 
 @given('I open a browser')
 def step_impl(context):
-    """Open browser using Playwright MCP"""
-    # Browser will be opened by Playwright MCP when first navigation occurs
+    """Use the pre-warmed browser context checked out in before_scenario"""
     context.browser_open = True
     context.timer_start = None
     context.timer_end = None
@@ -46,13 +51,29 @@ def step_impl(context, option):
     mode = mode_map.get(option, option.lower())
     url = f"{context.dashboard_url}/bdd-progress?mode={mode}"
 
-    # Use Playwright MCP to navigate
-    # This will be implemented via MCP browser navigation
+    if context.page is not None:
+        response = context.browser_pool.goto(context.browser_session, url)
+        assert response is None or response.ok, f"Navigation to {url} returned HTTP {response.status}"
+
     context.current_mode = option
     context.current_url = url
     context.navigation_complete = True
 
 
+@given('I open the dashboard page "{path}"')
+@when('I open the dashboard page "{path}"')
+def step_impl(context, path):
+    """Navigate to a dashboard page by path (e.g. /bdd-progress)"""
+    url = f"{context.dashboard_url}{path}"
+
+    if context.page is not None:
+        response = context.browser_pool.goto(context.browser_session, url)
+        assert response is None or response.ok, f"Navigation to {url} returned HTTP {response.status}"
+
+    context.current_url = url
+    context.navigation_complete = True
+
+
 @when('I switch to "{option}" view')
 def step_impl(context, option):
     """Switch to different dashboard view"""
@@ -67,11 +88,16 @@ def step_impl(context, option):
 @when('I click the "{button_name}" button')
 def step_impl(context, button_name):
     """Click a mode switcher button"""
-    # Use Playwright MCP to click button
     # Real DOM interaction (NO MOCKS)
     context.clicked_button = button_name
     context.button_click_time = time.time()
 
+    if context.page is not None:
+        # Time from the click event to the next painted frame, measured in the page
+        render_timing.begin(context.page, f"click:{button_name}")
+        context.page.get_by_role("button", name=button_name).click()
+        context.view_switch_ms = render_timing.painted(context.page)
+
 
 @when('I look at the blocker analysis section')
 @when('I view the blocker analysis section')
@@ -158,7 +184,18 @@ def step_impl(context, seconds):
 @then('the page should load within {seconds:d} second')
 def step_impl(context, seconds):
     """Validate page load performance"""
-    if context.timer_start:
+    if context.page is not None:
+        limit_ms = render_timing.sla_ms(context, "page_load", seconds * 1000)
+        # loadEventEnd stays 0 until the load event has finished
+        context.page.wait_for_load_state("load", timeout=limit_ms + render_timing.GRACE_SECONDS * 1000)
+        timing = render_timing.snapshot(context.page)
+        context.navigation_timing = timing["navigation"]
+        context.web_vitals = timing["vitals"]
+        assert timing["navigation"] and timing["navigation"]["load"], \
+            "No navigation timing recorded (navigate to a dashboard page first)"
+        load_ms = timing["navigation"]["load"]
+        assert load_ms <= limit_ms, f"Page load took {load_ms:.0f}ms (>{limit_ms:.0f}ms)"
+    elif context.timer_start:
         elapsed = time.time() - context.timer_start
         assert elapsed <= seconds, f"Page load took {elapsed:.2f}s (>{seconds}s)"
 
@@ -167,8 +204,9 @@ def step_impl(context, seconds):
 @then('blocker analysis should render within {seconds:d} seconds')
 def step_impl(context, seconds):
     """Validate blocker analysis render time"""
-    # Use Playwright to measure when element appears in DOM
     context.render_timeout = seconds
+    if context.page is not None:
+        render_timing.assert_rendered_within(context, ["blocker_analysis"], seconds)
 
 
 @then('all step cards should render within {seconds:d} second')
@@ -176,12 +214,20 @@ def step_impl(context, seconds):
 def step_impl(context, seconds):
     """Validate step cards render time"""
     context.render_timeout = seconds
+    if context.page is not None:
+        render_timing.assert_rendered_within(context, ["step_cards"], seconds, settle=True)
 
 
 @then('the view should switch within {milliseconds:d} milliseconds')
 def step_impl(context, milliseconds):
     """Validate view switch performance"""
-    if hasattr(context, 'button_click_time'):
+    if getattr(context, 'view_switch_ms', None) is not None:
+        context.render_timings = getattr(context, 'render_timings', {})
+        context.render_timings['view_switch'] = context.view_switch_ms
+        limit_ms = render_timing.sla_ms(context, "view_switch", milliseconds)
+        assert context.view_switch_ms <= limit_ms, \
+            f"View switch took {context.view_switch_ms:.0f}ms (>{limit_ms:.0f}ms)"
+    elif hasattr(context, 'button_click_time'):
         elapsed_ms = (time.time() - context.button_click_time) * 1000
         assert elapsed_ms <= milliseconds, f"View switch took {elapsed_ms:.0f}ms (>{milliseconds}ms)"
 
@@ -191,6 +237,8 @@ def step_impl(context, milliseconds):
 def step_impl(context, seconds):
     """Validate enablement cards render time"""
     context.render_timeout = seconds
+    if context.page is not None:
+        render_timing.assert_rendered_within(context, ["enablement_cards"], seconds, settle=True)
 
 
 @then('both sections should render within {seconds:d} second')
@@ -198,6 +246,8 @@ def step_impl(context, seconds):
 def step_impl(context, seconds):
     """Validate both sections render time"""
     context.render_timeout = seconds
+    if context.page is not None:
+        render_timing.assert_rendered_within(context, ["enablement_cards", "shared_steps"], seconds)
 
 
 # ============================================================================
@@ -321,22 +371,25 @@ def step_impl(context, score):
 
 @given('I have JSON mockup file "{filename}"')
 def step_impl(context, filename):
-    """Load JSON mockup file for validation"""
-    json_path = f"/Users/nicholasjayanty/Projects/technical_proof_of_concepts/discrete_connection/worktrees/dashboard-mockup-options/specs/mockups/{filename}"
+    """Load JSON mockup file for validation (parsed once per run, see features/mockups.py)"""
+    context.mockup_json = context.mockups.load(filename)
+
 
-    with open(json_path, 'r') as f:
-        context.mockup_json = json.load(f)
+@given('I have JSON from dashboard API "{route}"')
+def step_impl(context, route):
+    """Load the JSON a dashboard API route serves, to check the page renders it"""
+    with urllib.request.urlopen(f"{context.dashboard_url}{route}", timeout=30) as response:
+        context.mockup_json = json.load(response)
 
 
 @then('enablement {number:d} name should match JSON field "{json_path}"')
 @then('enablement {number:d} status should match JSON field "{json_path}"')
 @then('enablement {number:d} steps should match JSON field "{json_path}"')
+@then('enablement {number:d} progress should match JSON field "{json_path}"')
 def step_impl(context, number, json_path):
     """Validate enablement data matches JSON"""
-    # Parse json_path like "enablements[0].name"
-    # Query DOM for enablement data
-    # Compare with parsed JSON value
     context.json_field_path = json_path
+    check_json_field(context)
 
 
 @then('overall progress should match JSON field "{json_path}"')
@@ -346,49 +399,187 @@ def step_impl(context, number, json_path):
 def step_impl(context, json_path):
     """Validate data matches JSON field"""
     context.json_field_path = json_path
+    check_json_field(context)
+
+
+# ============================================================================
+# API Load Steps (Real HTTP against the dashboard server)
+# ============================================================================
+
+@when('{concurrency:d} clients send {count:d} requests to "{route}"')
+def step_impl(context, concurrency, count, route):
+    """Drive one API route with a fixed number of requests"""
+    context.load_results = load_generator.load_test(context.dashboard_url, [route], concurrency, requests=count)
+    for line in load_generator.report_lines(context.load_results):
+        print(line)
+
+
+@when('{concurrency:d} clients load "{route}" for {seconds:d} seconds')
+def step_impl(context, concurrency, route, seconds):
+    """Drive one API route for a fixed duration"""
+    context.load_results = load_generator.load_test(context.dashboard_url, [route], concurrency, duration=seconds)
+    for line in load_generator.report_lines(context.load_results):
+        print(line)
+
+
+@then('the {percentile:w} latency should be under {milliseconds:d} milliseconds')
+def step_impl(context, percentile, milliseconds):
+    """Validate a latency percentile (p50, p95, p99) across the load run"""
+    assert percentile in ("p50", "p95", "p99"), f"Unknown percentile: {percentile}"
+    total = context.load_results["total"]
+    latency = total.percentile(int(percentile[1:]))
+    assert latency is not None, f"No successful requests ({total.errors} failed, statuses {total.status_counts})"
+    assert latency < milliseconds, f"{percentile} latency was {latency:.1f}ms (>={milliseconds}ms)"
+
+
+@then('the error rate should be below {percent:g} percent')
+def step_impl(context, percent):
+    """Validate the share of failed requests (HTTP >= 400 or no response)"""
+    total = context.load_results["total"]
+    assert total.error_rate < percent, \
+        f"Error rate was {total.error_rate:.2f}% ({total.errors}/{total.requests}, statuses {total.status_counts})"
+
+
+@then('throughput should be at least {rps:d} requests per second')
+def step_impl(context, rps):
+    """Validate sustained request throughput"""
+    total = context.load_results["total"]
+    assert total.throughput >= rps, f"Throughput was {total.throughput:.1f} req/s (<{rps} req/s)"
 
 
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
+class JsonPath:
+    """
+    Compiled JSON path like 'enablements[0].name' or 'enablements[*].status'
+
+    The path string is tokenized once; resolve() then walks the data without
+    any string work. Besides keys and indexes, tokens may be:
+        [*]      every element of a list (or value of a dict)
+        [1:3]    a list slice (Python semantics, negative bounds allowed)
+    Paths containing either resolve to a list of all matches, so a whole
+    column can be pulled in a single traversal.
+    """
+
+    WILDCARD = "*"
+
+    def __init__(self, path):
+        self.path = path
+        self.tokens = tuple(self._tokenize(path))
+        self.multi = any(token == self.WILDCARD or isinstance(token, slice) for token in self.tokens)
+
+    @staticmethod
+    def _tokenize(path):
+        import re
+
+        for part in re.split(r'[\.\[]', path):
+            part = part.rstrip(']')
+            if not part:
+                continue
+            if part == JsonPath.WILDCARD:
+                yield part
+            elif ':' in part:
+                bounds = [int(bound) if bound else None for bound in part.split(':')]
+                yield slice(*bounds)
+            elif part.lstrip('-').isdigit():
+                yield int(part)
+            else:
+                yield part
+
+    def resolve(self, json_data):
+        """Value at path, or the list of matches for wildcard/slice paths"""
+        if not self.multi:
+            value = json_data
+            for token in self.tokens:
+                value = value[token]
+            return value
+
+        values = [json_data]
+        for token in self.tokens:
+            if token == self.WILDCARD:
+                values = [item for value in values
+                          for item in (value.values() if isinstance(value, dict) else value)]
+            elif isinstance(token, slice):
+                values = [item for value in values for item in value[token]]
+            else:
+                values = [value[token] for value in values]
+        return values
+
+    def __repr__(self):
+        return f"JsonPath({self.path!r})"
+
+
+@lru_cache(maxsize=1024)
+def compile_json_path(path):
+    """Compiled JsonPath for path, cached so each distinct path is tokenized once"""
+    return JsonPath(path)
+
+
 def parse_json_path(json_data, path):
     """
     Parse JSON path like 'enablements[0].name' and return value
 
     Args:
         json_data: Parsed JSON dict
-        path: JSON path string
+        path: JSON path string (wildcards/slices return a list, see JsonPath)
 
     Returns:
         Value at path
     """
-    import re
-
-    parts = re.split(r'[\.\[]', path)
-    value = json_data
+    return compile_json_path(path).resolve(json_data)
 
-    for part in parts:
-        part = part.rstrip(']')
-        if part.isdigit():
-            value = value[int(part)]
-        elif part:
-            value = value[part]
-
-    return value
 
+def check_json_field(context):
+    """
+    Assert the current "... should match JSON field" step
 
-def measure_element_render_time(context, selector):
+    The first step of a run of consecutive field checks extracts every card
+    in one page evaluation and diffs the whole run (see json_mapping); later
+    steps of the run only look up their result. The first failing step lists
+    every mismatch in the run with its step and DOM location.
+    """
+    if context.page is None:
+        return
+
+    step = context.current_step
+    results = context.json_field_results
+    if results is None or str(step.location) not in results["steps"]:
+        assert getattr(context, 'mockup_json', None) is not None, \
+            'No JSON loaded (Given I have JSON mockup file "..." / I have JSON from dashboard API "...")'
+        checks = [check for _, check in json_mapping.pending_checks(context.scenario, step)]
+        snapshot = json_mapping.extract_page(context.page)
+        mismatches = json_mapping.compare(checks, snapshot, lambda path: parse_json_path(context.mockup_json, path))
+        results = context.json_field_results = {
+            "steps": {check.location for check in checks},
+            "failed": {mismatch["location"] for mismatch in mismatches},
+            "mismatches": mismatches,
+            "total": len(checks),
+            "reported": False,
+        }
+
+    if str(step.location) in results["failed"]:
+        if not results["reported"]:
+            results["reported"] = True
+            raise AssertionError(json_mapping.format_mismatches(results["mismatches"], results["total"]))
+        mismatch = next(m for m in results["mismatches"] if m["location"] == str(step.location))
+        raise AssertionError(json_mapping.format_mismatches([mismatch], 1))
+
+
+def measure_element_render_time(context, selector, timeout=30):
     """
     Measure how long it takes for element to appear in DOM
 
     Args:
         context: Behave context
         selector: CSS selector
+        timeout: Seconds to wait before giving up
 
     Returns:
-        Elapsed time in seconds
+        Elapsed time in seconds from navigation (or the last armed click),
+        measured in the page; None if the element never appeared
     """
-    # Use Playwright MCP to wait for element and measure time
     # This is a real timing measurement (NO MOCKS)
-    pass
+    elapsed_ms = render_timing.when_present(context.page, selector, timeout)
+    return None if elapsed_ms is None else elapsed_ms / 1000
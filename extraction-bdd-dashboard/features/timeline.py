@@ -0,0 +1,140 @@
+"""
+Performance Timeline Recorder for Dashboard Validation Tests
+Purpose: Hierarchical run -> feature -> scenario -> step spans per behave run
+Output: Chrome trace-event JSON (chrome://tracing, Perfetto) + step summary CSV
+
+Timestamps come from time.perf_counter_ns(), so spans are monotonic and
+unaffected by wall-clock adjustments. Step spans are also aggregated per
+step definition (pattern + location in dashboard_validation_steps.py); the
+summary rows are appended to a history CSV so step cost can be tracked
+across runs.
+"""
+
+import csv
+import json
+import os
+import time
+
+SUMMARY_FIELDS = ("test_run_id", "worker", "step_type", "step_definition", "location",
+                  "calls", "failures", "total_ms", "mean_ms", "max_ms", "share_of_steps_pct")
+
+
+class TimelineRecorder:
+    """
+    Span stack for one behave process.
+
+    Usage (environment.py):
+        timeline = TimelineRecorder(run_id, worker)
+        timeline.begin("run", "run")
+        ...
+        timeline.end()
+        timeline.write(output_dir)
+    """
+
+    def __init__(self, test_run_id, worker=None):
+        self.test_run_id = test_run_id
+        self.worker = int(worker or 0)
+        self.pid = os.getpid()
+        self.origin_ns = time.perf_counter_ns()
+        self.events = [
+            {"name": "process_name", "ph": "M", "pid": self.pid, "args": {"name": f"behave {test_run_id}"}},
+            {"name": "thread_name", "ph": "M", "pid": self.pid, "tid": self.worker,
+             "args": {"name": f"worker {self.worker}"}},
+        ]
+        self._open = []
+        self._definitions = {}
+        self.step_stats = {}
+
+    def begin(self, name, category, **args):
+        """Open a span nested in the current one"""
+        self._open.append((name, category, time.perf_counter_ns(), args))
+
+    def end(self, **args):
+        """Close the innermost span; returns its duration in nanoseconds"""
+        finished = time.perf_counter_ns()
+        name, category, started, begin_args = self._open.pop()
+        self.events.append({
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "pid": self.pid,
+            "tid": self.worker,
+            "ts": (started - self.origin_ns) / 1000,
+            "dur": (finished - started) / 1000,
+            "args": {**begin_args, **args},
+        })
+        return finished - started
+
+    def end_step(self, step, step_registry):
+        """Close a step span and fold it into the per-definition stats"""
+        status = step.status.name
+        duration_ns = self.end(status=status)
+
+        definition = self._definition(step, step_registry)
+        stats = self.step_stats.setdefault(definition, {"calls": 0, "failures": 0, "total_ns": 0, "max_ns": 0})
+        stats["calls"] += 1
+        stats["failures"] += status in ("failed", "error")
+        stats["total_ns"] += duration_ns
+        stats["max_ns"] = max(stats["max_ns"], duration_ns)
+
+    def _definition(self, step, step_registry):
+        """(step_type, pattern, location) of the step definition that ran step"""
+        key = (step.step_type, step.name)
+        if key not in self._definitions:
+            matcher = step_registry.find_step_definition(step)
+            if matcher is None:
+                self._definitions[key] = (step.step_type, "(undefined)", "")
+            else:
+                self._definitions[key] = (step.step_type, matcher.pattern, str(matcher.location))
+        return self._definitions[key]
+
+    def summary_rows(self):
+        """Per step definition rows, most expensive first"""
+        total_ns = sum(stats["total_ns"] for stats in self.step_stats.values()) or 1
+        rows = []
+        for (step_type, pattern, location), stats in self.step_stats.items():
+            rows.append({
+                "test_run_id": self.test_run_id,
+                "worker": self.worker,
+                "step_type": step_type,
+                "step_definition": pattern,
+                "location": location,
+                "calls": stats["calls"],
+                "failures": stats["failures"],
+                "total_ms": round(stats["total_ns"] / 1e6, 3),
+                "mean_ms": round(stats["total_ns"] / stats["calls"] / 1e6, 3),
+                "max_ms": round(stats["max_ns"] / 1e6, 3),
+                "share_of_steps_pct": round(stats["total_ns"] / total_ns * 100, 1),
+            })
+        rows.sort(key=lambda row: -row["total_ms"])
+        return rows
+
+    def write(self, output_dir):
+        """
+        Write <run>[-worker<N>].trace.json and .summary.csv, and append the
+        summary to step-history.csv. Returns (trace path, summary path).
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        stem = self.test_run_id if not self.worker else f"{self.test_run_id}-worker{self.worker}"
+        trace_path = os.path.join(output_dir, f"{stem}.trace.json")
+        summary_path = os.path.join(output_dir, f"{stem}.summary.csv")
+        history_path = os.path.join(output_dir, "step-history.csv")
+
+        with open(trace_path, "w") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms",
+                       "otherData": {"test_run_id": self.test_run_id, "worker": self.worker}}, f)
+
+        rows = self.summary_rows()
+        with open(summary_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+
+        new_history = not os.path.exists(history_path)
+        with open(history_path, "a", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS)
+            if new_history:
+                writer.writeheader()
+            writer.writerows(rows)
+
+        return trace_path, summary_path
@@ -17,6 +17,7 @@ export interface ParsedScenario {
   steps: ParsedStep[]
   status: 'passed' | 'failed' | 'undefined' | 'skipped' | 'pending'
   tags: string[]
+  outline?: boolean
 }
 
 export interface ParsedFeature {
@@ -41,6 +42,8 @@ interface BehaveStep {
 
 interface BehaveScenario {
   name: string
+  type?: string
+  keyword?: string
   steps: BehaveStep[]
   status?: 'passed' | 'failed' | 'skipped' | 'pending' | 'undefined'
 }
@@ -112,7 +115,8 @@ export function parseFeatureFile(filePath: string): ParsedFeature | null {
             description: scenario.description || undefined,
             steps,
             status: 'undefined',
-            tags: scenario.tags ? scenario.tags.map(tag => tag.name) : []
+            tags: scenario.tags ? scenario.tags.map(tag => tag.name) : [],
+            outline: scenario.examples.length > 0
           })
         }
       }
@@ -160,87 +164,281 @@ export function parseFeatureDirectory(directory: string): ParsedFeature[] {
   return features
 }
 
+type Status = ParsedStep['status']
+
 /**
- * Merge parsed features with behave test results
+ * Behave results indexed for merging:
+ * feature name -> scenario name -> (keyword, text) -> status
+ *
+ * Duplicate names are matched by occurrence: the 2nd feature, scenario or
+ * identical step with a name is merged with the 2nd one behave reported.
+ * Scenario Outline example rows (named "<name> -- @1.2 <examples>") are
+ * grouped under their outline, whose steps take the worst status across
+ * rows by position (row step text has the placeholders filled in). Steps
+ * behave copied in from the Background are dropped, since parsed
+ * scenarios do not contain them.
  */
-export function mergeWithTestResults(
-  features: ParsedFeature[],
-  behaveResultsPath?: string
-): ParsedFeature[] {
-  if (!behaveResultsPath || !fs.existsSync(behaveResultsPath)) {
-    return features
+interface IndexedScenario {
+  status?: Status
+  // Own steps (Background removed); byKey is built on first use
+  steps: BehaveStep[]
+  byKey?: Map<string, (Status | undefined)[]>
+}
+
+interface IndexedFeature {
+  status?: Status
+  scenarios: Map<string, IndexedScenario[]>
+  outlineRows: Map<string, IndexedScenario[]>
+}
+
+export type BehaveResultsIndex = Map<string, IndexedFeature[]>
+
+// Most severe first; an outline takes the worst status of its rows
+const STATUS_SEVERITY = ['failed', 'error', 'undefined', 'pending', 'skipped', 'passed']
+
+function worstStatus(statuses: (Status | undefined)[]): Status | undefined {
+  let worst: Status | undefined
+  for (const status of statuses) {
+    if (status && (!worst || severity(status) < severity(worst))) {
+      worst = status
+    }
   }
+  return worst
+}
 
-  try {
-    const resultsContent = fs.readFileSync(behaveResultsPath, 'utf-8')
-    const behaveResults: BehaveFeature[] = JSON.parse(resultsContent)
+function severity(status: string): number {
+  const rank = STATUS_SEVERITY.indexOf(status)
+  return rank === -1 ? STATUS_SEVERITY.length : rank
+}
+
+function stepKey(keyword: string, text: string): string {
+  return `${keyword.trim()}\u0000${text}`
+}
+
+function pushTo<T>(map: Map<string, T[]>, key: string, value: T): void {
+  const list = map.get(key)
+  if (list) {
+    list.push(value)
+  } else {
+    map.set(key, [value])
+  }
+}
 
-    return features.map(feature => {
-      const behaveFeature = behaveResults.find(
-        bf => bf.name === feature.name
-      )
+/**
+ * Build the merge index for a behave JSON report (one pass over it)
+ */
+export function indexBehaveResults(behaveResults: BehaveFeature[]): BehaveResultsIndex {
+  const index: BehaveResultsIndex = new Map()
+
+  for (const behaveFeature of behaveResults) {
+    const elements = behaveFeature.elements || []
+    const background = elements.find(element => element.type === 'background')
+    const backgroundSteps = background ? background.steps.length : 0
+
+    const feature: IndexedFeature = { status: behaveFeature.status, scenarios: new Map(), outlineRows: new Map() }
+    for (const element of elements) {
+      if (element.type === 'background') {
+        continue
+      }
 
-      if (!behaveFeature) {
-        return feature
+      const scenario: IndexedScenario = {
+        status: element.status,
+        steps: (element.steps || []).slice(backgroundSteps)
       }
 
-      const updatedScenarios = feature.scenarios.map(scenario => {
-        const behaveScenario = behaveFeature.elements?.find(
-          bs => bs.name === scenario.name
-        )
+      const isOutlineRow = /^Scenario (Outline|Template)$/.test(element.keyword || '') && element.name.includes(' -- @')
+      if (isOutlineRow) {
+        pushTo(feature.outlineRows, element.name.slice(0, element.name.lastIndexOf(' -- @')), scenario)
+      } else {
+        pushTo(feature.scenarios, element.name, scenario)
+      }
+    }
 
-        if (!behaveScenario) {
-          return scenario
-        }
+    pushTo(index, behaveFeature.name, feature)
+  }
 
-        const updatedSteps = scenario.steps.map(step => {
-          const behaveStep = behaveScenario.steps.find(
-            bs => bs.keyword.trim() === step.keyword && bs.name === step.text
-          )
-
-          return {
-            ...step,
-            status: behaveStep?.result?.status || step.status
-          }
-        })
-
-        // Calculate scenario status based on steps
-        let scenarioStatus: ParsedScenario['status'] = 'passed'
-        if (updatedSteps.some(s => s.status === 'failed')) {
-          scenarioStatus = 'failed'
-        } else if (updatedSteps.some(s => s.status === 'undefined')) {
-          scenarioStatus = 'undefined'
-        } else if (updatedSteps.some(s => s.status === 'pending')) {
-          scenarioStatus = 'pending'
-        } else if (updatedSteps.some(s => s.status === 'skipped')) {
-          scenarioStatus = 'skipped'
-        }
+  return index
+}
+
+/**
+ * Behave status per parsed step. When both step lists line up (the usual
+ * case) that is a positional zip; otherwise the (keyword, text) index is
+ * built on first use and the nth identical step takes the nth match.
+ */
+function stepStatuses(scenario: IndexedScenario, steps: ParsedStep[]): (Status | undefined)[] {
+  const behaveSteps = scenario.steps
+  const aligned = behaveSteps.length === steps.length && steps.every((step, position) =>
+    step.text === behaveSteps[position].name && step.keyword === behaveSteps[position].keyword.trim())
+  if (aligned) {
+    return behaveSteps.map(step => step.result?.status)
+  }
+
+  if (!scenario.byKey) {
+    scenario.byKey = new Map()
+    for (const step of behaveSteps) {
+      pushTo(scenario.byKey, stepKey(step.keyword, step.name), step.result?.status)
+    }
+  }
+  const seen = new Map<string, number>()
+  return steps.map(step => {
+    const key = stepKey(step.keyword, step.text)
+    const nth = seen.get(key) || 0
+    seen.set(key, nth + 1)
+    return scenario.byKey!.get(key)?.[nth]
+  })
+}
+
+/**
+ * Example rows for an outline: rows named exactly like it, else rows whose
+ * name fits the outline's name with <placeholders> filled in. Rows are
+ * claimed, so two outlines never share them.
+ */
+function takeOutlineRows(feature: IndexedFeature, name: string): IndexedScenario[] {
+  const exact = feature.outlineRows.get(name)
+  if (exact) {
+    feature.outlineRows.delete(name)
+    return exact
+  }
+  if (!/<[^>]+>/.test(name)) {
+    return []
+  }
 
-        return {
-          ...scenario,
-          steps: updatedSteps,
-          status: behaveScenario.status || scenarioStatus
+  const parts = name.split(/<[^>]+>/)
+  let pattern: RegExp | null = null
+  const rows: IndexedScenario[] = []
+  for (const [rowName, matched] of Array.from(feature.outlineRows)) {
+    if (!rowName.startsWith(parts[0]) || !rowName.endsWith(parts[parts.length - 1])) {
+      continue
+    }
+    pattern = pattern || new RegExp('^' + parts
+      .map(part => part.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'))
+      .join('.*') + '$', 's')
+    if (pattern.test(rowName)) {
+      rows.push(...matched)
+      feature.outlineRows.delete(rowName)
+    }
+  }
+  return rows
+}
+
+function rollUpStatus(statuses: Status[]): Status {
+  if (statuses.some(s => s === 'failed')) {
+    return 'failed'
+  } else if (statuses.some(s => s === 'undefined')) {
+    return 'undefined'
+  } else if (statuses.some(s => s === 'pending')) {
+    return 'pending'
+  } else if (statuses.some(s => s === 'skipped')) {
+    return 'skipped'
+  }
+  return 'passed'
+}
+
+/**
+ * Merge parsed features with an index of behave results
+ */
+export function mergeWithResultsIndex(
+  features: ParsedFeature[],
+  resultsIndex: BehaveResultsIndex
+): ParsedFeature[] {
+  // nth occurrence of a name -> nth indexed entry; fresh counters per merge
+  const featureSeen = new Map<string, number>()
+
+  return features.map(feature => {
+    const occurrence = featureSeen.get(feature.name) || 0
+    featureSeen.set(feature.name, occurrence + 1)
+    const indexed = resultsIndex.get(feature.name)?.[occurrence]
+
+    if (!indexed) {
+      return feature
+    }
+
+    // Outline rows are claimed as they are matched; work on a copy
+    const behaveFeature: IndexedFeature = { ...indexed, outlineRows: new Map(indexed.outlineRows) }
+    const scenarioSeen = new Map<string, number>()
+
+    const updatedScenarios = feature.scenarios.map(scenario => {
+      let status: Status | undefined
+      let statuses: (Status | undefined)[]
+
+      if (scenario.outline) {
+        const rows = takeOutlineRows(behaveFeature, scenario.name)
+        if (rows.length === 0) {
+          return scenario
+        }
+        status = worstStatus(rows.map(row => row.status))
+        // Row step text has the placeholders filled in: match by position
+        statuses = scenario.steps.map((_step, position) =>
+          worstStatus(rows.map(row => row.steps[position]?.result?.status)))
+      } else {
+        const nth = scenarioSeen.get(scenario.name) || 0
+        scenarioSeen.set(scenario.name, nth + 1)
+        const behaveScenario = behaveFeature.scenarios.get(scenario.name)?.[nth]
+        if (!behaveScenario) {
+          return scenario
         }
-      })
-
-      // Calculate feature status based on scenarios
-      let featureStatus: ParsedFeature['status'] = 'passed'
-      if (updatedScenarios.some(s => s.status === 'failed')) {
-        featureStatus = 'failed'
-      } else if (updatedScenarios.some(s => s.status === 'undefined')) {
-        featureStatus = 'undefined'
-      } else if (updatedScenarios.some(s => s.status === 'pending')) {
-        featureStatus = 'pending'
-      } else if (updatedScenarios.some(s => s.status === 'skipped')) {
-        featureStatus = 'skipped'
+        status = behaveScenario.status
+        statuses = stepStatuses(behaveScenario, scenario.steps)
       }
 
+      const updatedSteps = scenario.steps.map((step, position) => ({
+        ...step,
+        status: statuses[position] || step.status
+      }))
+
       return {
-        ...feature,
-        scenarios: updatedScenarios,
-        status: behaveFeature.status || featureStatus
+        ...scenario,
+        steps: updatedSteps,
+        // Calculate scenario status based on steps when behave gave none
+        status: status || rollUpStatus(updatedSteps.map(s => s.status))
       }
     })
+
+    return {
+      ...feature,
+      scenarios: updatedScenarios,
+      // Calculate feature status based on scenarios when behave gave none
+      status: behaveFeature.status || rollUpStatus(updatedScenarios.map(s => s.status))
+    }
+  })
+}
+
+// Index per results file, rebuilt only when the file changes
+let resultsIndexCache: { path: string; mtimeMs: number; size: number; index: BehaveResultsIndex } | null = null
+
+/**
+ * Load (or reuse) the merge index for a behave results file
+ */
+export function loadBehaveResultsIndex(behaveResultsPath: string): BehaveResultsIndex {
+  const stats = fs.statSync(behaveResultsPath)
+  if (
+    resultsIndexCache &&
+    resultsIndexCache.path === behaveResultsPath &&
+    resultsIndexCache.mtimeMs === stats.mtimeMs &&
+    resultsIndexCache.size === stats.size
+  ) {
+    return resultsIndexCache.index
+  }
+
+  const behaveResults: BehaveFeature[] = JSON.parse(fs.readFileSync(behaveResultsPath, 'utf-8'))
+  const index = indexBehaveResults(behaveResults)
+  resultsIndexCache = { path: behaveResultsPath, mtimeMs: stats.mtimeMs, size: stats.size, index }
+  return index
+}
+
+/**
+ * Merge parsed features with behave test results
+ */
+export function mergeWithTestResults(
+  features: ParsedFeature[],
+  behaveResultsPath?: string
+): ParsedFeature[] {
+  if (!behaveResultsPath || !fs.existsSync(behaveResultsPath)) {
+    return features
+  }
+
+  try {
+    return mergeWithResultsIndex(features, loadBehaveResultsIndex(behaveResultsPath))
   } catch (error) {
     console.error('Error merging with test results:', error)
     return features
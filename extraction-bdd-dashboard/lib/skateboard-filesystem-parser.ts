@@ -6,6 +6,7 @@
  * Works in Vercel if projects are in same deployment
  */
 
+import crypto from 'crypto';
 import fs from 'fs';
 import path from 'path';
 import { glob } from 'glob';
@@ -113,6 +114,15 @@ export function parseFeatureFile(filePath: string, projectId: string): Feature {
   };
 }
 
+// Lint layer patterns, one per layer (no g flag, so test() keeps no lastIndex state).
+// scripts/test_score_feature_quality.py checks region_layers against them
+const FUNCTIONAL_PATTERN = /^\s*Then\s+/m;
+const MEASURABLE_PATTERN =
+  /<\d+\s*(second|minute|hour|ms|MB|GB)|>\d+%|\d+\s*(users|scenarios|features)/i; // Time/size units, percentages, counts
+const REAL_NAME_PATTERN = /Bella|Maya|Alice|Joel|Bob/;
+const DELIGHT_PATTERN =
+  /\bcan\s+\w+|\bso that\b|\benables\b|\bfeels\s+confident/i; // "Bella can...", "so that...", "enables...", "feels confident..."
+
 /**
  * Simple lint scorer (extracted from bdd-quality-linter.py logic)
  *
@@ -121,6 +131,12 @@ export function parseFeatureFile(filePath: string, projectId: string): Feature {
  * - Reliable: Has measurable criteria (numbers, time units)
  * - Usable: Uses domain language (not technical jargon)
  * - Delightful: Has user enablement language ("Bella can...", "so that")
+ *
+ * 25 points per layer. Patterns are compiled once at module load; each layer
+ * is one regex, so a feature is scanned at most once per layer.
+ * scripts/score_feature_quality.py is the batch twin that detects the same
+ * layers for every scenario of a directory, but weights them as
+ * consent-quality-report.json does (30/10/30/30).
  */
 export function lintFeature(feature: Feature): number {
   const { content } = feature;
@@ -134,37 +150,25 @@ export function lintFeature(feature: Feature): number {
   };
 
   // FUNCTIONAL: Has "Then" steps
-  if (/^\s*Then\s+/m.test(content)) {
+  if (FUNCTIONAL_PATTERN.test(content)) {
     layers.functional = true;
     score += 25;
   }
 
   // RELIABLE: Has measurable criteria
-  const measurablePatterns = [
-    /<\d+\s*(second|minute|hour|ms|MB|GB)/i,  // Time/size units
-    />\d+%/,                                    // Percentages
-    /\d+\s*(users|scenarios|features)/i         // Counts
-  ];
-  if (measurablePatterns.some(pattern => pattern.test(content))) {
+  if (MEASURABLE_PATTERN.test(content)) {
     layers.reliable = true;
     score += 25;
   }
 
   // USABLE: Has real user names (Bella, Maya, Alice) not generic "user"
-  const realNames = ['Bella', 'Maya', 'Alice', 'Joel', 'Bob'];
-  if (realNames.some(name => content.includes(name))) {
+  if (REAL_NAME_PATTERN.test(content)) {
     layers.usable = true;
     score += 25;
   }
 
   // DELIGHTFUL: Has user enablement language
-  const delightPatterns = [
-    /\bcan\s+\w+/i,           // "Bella can create workspace"
-    /\bso that\b/i,           // "so that Bella can..."
-    /\benables\b/i,           // "enables data scientists to..."
-    /\bfeels\s+confident/i    // "feels confident to..."
-  ];
-  if (delightPatterns.some(pattern => pattern.test(content))) {
+  if (DELIGHT_PATTERN.test(content)) {
     layers.delightful = true;
     score += 25;
   }
@@ -173,51 +177,230 @@ export function lintFeature(feature: Feature): number {
   return score;
 }
 
+/**
+ * INCREMENTAL INDEX: per-file path + mtime + content hash
+ *
+ * Every scanned .feature file keeps its scenario count and lint score in an
+ * index persisted under the dashboard's .next/cache (per rootDir, rewritten
+ * only when an entry changed). On a rescan a file is
+ * only read when its mtime/size changed, and only re-parsed and re-linted
+ * when its content hash changed too. Project totals are adjusted as entries
+ * change, so a refresh costs a directory walk plus one stat per file.
+ */
+export interface IndexedFeature {
+  path: string;
+  fileName: string;
+  mtimeMs: number;
+  size: number;
+  hash: string;
+  scenarioCount: number;
+  lintScore: number;
+}
+
+interface ProjectIndex {
+  files: Record<string, IndexedFeature>;
+  totalScenarios: number;
+  totalScore: number;
+}
+
+interface FeatureIndex {
+  version: number;
+  rootDir: string;
+  projects: Record<string, ProjectIndex>;
+}
+
+// Bump whenever parseFeatureFile or lintFeature change, so stored entries are re-linted
+const INDEX_VERSION = 2;
+const INDEX_PATH = path.join(process.cwd(), '.next', 'cache', 'skateboard-feature-index.json');
+
+let featureIndex: { rootDir: string; index: FeatureIndex } | null = null;
+// Set when the in-memory index differs from the persisted one
+let indexDirty = false;
+
+function emptyProjectIndex(): ProjectIndex {
+  return { files: {}, totalScenarios: 0, totalScore: 0 };
+}
+
+function hashContent(content: string): string {
+  return crypto.createHash('sha1').update(content).digest('hex');
+}
+
+/**
+ * In-memory index for rootDir, loaded from disk the first time
+ */
+function getFeatureIndex(rootDir: string): FeatureIndex {
+  if (featureIndex && featureIndex.rootDir === rootDir) {
+    return featureIndex.index;
+  }
+
+  let index: FeatureIndex = { version: INDEX_VERSION, rootDir, projects: {} };
+  try {
+    const stored = JSON.parse(fs.readFileSync(INDEX_PATH, 'utf-8')) as FeatureIndex;
+    if (stored.version === INDEX_VERSION && stored.rootDir === rootDir) {
+      index = stored;
+    }
+  } catch {
+    // Missing or unreadable index: every file is parsed on the first scan
+  }
+
+  featureIndex = { rootDir, index };
+  indexDirty = false;
+  return index;
+}
+
+/**
+ * Persist the index atomically (write to a temp file, then rename)
+ */
+function saveFeatureIndex(index: FeatureIndex): void {
+  const tmpPath = `${INDEX_PATH}.${process.pid}.tmp`;
+  try {
+    fs.mkdirSync(path.dirname(INDEX_PATH), { recursive: true });
+    fs.writeFileSync(tmpPath, JSON.stringify(index));
+    fs.renameSync(tmpPath, INDEX_PATH);
+    indexDirty = false;
+  } catch (error) {
+    console.warn(`Could not persist feature index to ${INDEX_PATH}:`, error);
+  }
+}
+
+function setEntry(project: ProjectIndex, entry: IndexedFeature | null, filePath: string): void {
+  const previous = project.files[filePath];
+  if (previous) {
+    project.totalScenarios -= previous.scenarioCount;
+    project.totalScore -= previous.lintScore;
+    delete project.files[filePath];
+    indexDirty = true;
+  }
+  if (entry) {
+    project.files[filePath] = entry;
+    project.totalScenarios += entry.scenarioCount;
+    project.totalScore += entry.lintScore;
+    indexDirty = true;
+  }
+}
+
+/**
+ * Bring one file's entry up to date. Returns true if its summary changed
+ */
+function updateIndexedFeature(project: ProjectIndex, filePath: string, projectId: string): boolean {
+  const previous = project.files[filePath];
+
+  let stats: fs.Stats;
+  try {
+    stats = fs.statSync(filePath);
+  } catch {
+    // Deleted
+    setEntry(project, null, filePath);
+    return Boolean(previous);
+  }
+
+  if (previous && previous.mtimeMs === stats.mtimeMs && previous.size === stats.size) {
+    return false;
+  }
+
+  const feature = parseFeatureFile(filePath, projectId);
+  const hash = hashContent(feature.content);
+  if (previous && previous.hash === hash) {
+    // Touched but not edited: keep the summary, remember the new mtime
+    previous.mtimeMs = stats.mtimeMs;
+    previous.size = stats.size;
+    indexDirty = true;
+    return false;
+  }
+
+  setEntry(project, {
+    path: filePath,
+    fileName: feature.fileName,
+    mtimeMs: stats.mtimeMs,
+    size: stats.size,
+    hash,
+    scenarioCount: feature.scenarioCount,
+    lintScore: lintFeature(feature)
+  }, filePath);
+  return true;
+}
+
+function summarizeProject(project: Project, projectIndex: ProjectIndex): ProjectSummary {
+  const entries = Object.keys(projectIndex.files).sort().map(filePath => projectIndex.files[filePath]);
+  const avgLintScore = entries.length > 0 ? Math.round(projectIndex.totalScore / entries.length) : 0;
+
+  const featureSummaries: FeatureSummary[] = entries.map(f => ({
+    fileName: f.fileName,
+    scenarioCount: f.scenarioCount,
+    lintScore: f.lintScore,
+    qualityLayers: {
+      functional: f.lintScore >= 25,
+      reliable: f.lintScore >= 50,
+      usable: f.lintScore >= 75,
+      delightful: f.lintScore === 100
+    }
+  }));
+
+  return {
+    id: project.id,
+    name: project.name,
+    featureCount: entries.length,
+    scenarioCount: projectIndex.totalScenarios,
+    avgLintScore,
+    features: featureSummaries
+  };
+}
+
+/**
+ * Dashboard data from the index as it stands (no filesystem access)
+ */
+function buildDashboardData(projects: Project[], index: FeatureIndex): DashboardData {
+  return {
+    projects: projects.map(project => summarizeProject(project, index.projects[project.id] || emptyProjectIndex())),
+    lastUpdated: new Date().toISOString()
+  };
+}
+
 /**
  * Generate dashboard data for all projects
+ *
+ * Walks every project's features directory and brings the index up to date;
+ * only new or edited files are parsed and linted.
  */
 export async function generateDashboardData(rootDir: string): Promise<DashboardData> {
   const projects = loadProjectRegistry(rootDir);
-  const projectSummaries: ProjectSummary[] = [];
+  const index = getFeatureIndex(rootDir);
+  let changed = false;
+
+  const registered = new Set(projects.map(project => project.id));
+  for (const projectId of Object.keys(index.projects)) {
+    if (!registered.has(projectId)) {
+      delete index.projects[projectId];
+      changed = true;
+    }
+  }
 
   for (const project of projects) {
+    const projectIndex = index.projects[project.id] || (index.projects[project.id] = emptyProjectIndex());
     const featureFiles = await findFeatureFiles(project, rootDir);
-    const features: Feature[] = featureFiles.map(file => parseFeatureFile(file, project.id));
-
-    // Lint all features
-    features.forEach(feature => lintFeature(feature));
-
-    // Calculate project summary
-    const totalScenarios = features.reduce((sum, f) => sum + f.scenarioCount, 0);
-    const totalScore = features.reduce((sum, f) => sum + (f.lintScore || 0), 0);
-    const avgLintScore = features.length > 0 ? Math.round(totalScore / features.length) : 0;
-
-    const featureSummaries: FeatureSummary[] = features.map(f => ({
-      fileName: f.fileName,
-      scenarioCount: f.scenarioCount,
-      lintScore: f.lintScore || 0,
-      qualityLayers: {
-        functional: (f.lintScore || 0) >= 25,
-        reliable: (f.lintScore || 0) >= 50,
-        usable: (f.lintScore || 0) >= 75,
-        delightful: (f.lintScore || 0) === 100
+
+    const present = new Set(featureFiles);
+    for (const filePath of Object.keys(projectIndex.files)) {
+      if (!present.has(filePath)) {
+        setEntry(projectIndex, null, filePath);
+        changed = true;
       }
-    }));
+    }
 
-    projectSummaries.push({
-      id: project.id,
-      name: project.name,
-      featureCount: features.length,
-      scenarioCount: totalScenarios,
-      avgLintScore,
-      features: featureSummaries
-    });
+    for (const filePath of featureFiles) {
+      changed = updateIndexedFeature(projectIndex, filePath, project.id) || changed;
+    }
   }
 
-  return {
-    projects: projectSummaries,
-    lastUpdated: new Date().toISOString()
-  };
+  // Also persists touched-only mtimes, so they are not re-hashed after a restart
+  if (indexDirty) {
+    saveFeatureIndex(index);
+  }
+  if (changed) {
+    console.log('Feature index updated');
+  }
+
+  return buildDashboardData(projects, index);
 }
 
 /**
@@ -228,6 +411,13 @@ export async function generateDashboardData(rootDir: string): Promise<DashboardD
  * - Cache prevents redundant parsing on rapid page refreshes
  * - 60s TTL = near real-time (acceptable for local dev)
  * - No external cache needed (Redis overkill for Skateboard)
+ *
+ * A cache miss is an incremental rescan (see INCREMENTAL INDEX). While a
+ * watcher covers every project (see watchFeatureFiles) it pushes single-file
+ * updates into the cache and only a 10-minute backstop TTL applies, in case
+ * an event was missed. If some project's featuresPath does not exist yet,
+ * the 60s TTL stays in force and each rescan restarts the watcher, so the
+ * directory is picked up once it appears.
  */
 let cache: { data: DashboardData | null; timestamp: number } = {
   data: null,
@@ -235,11 +425,18 @@ let cache: { data: DashboardData | null; timestamp: number } = {
 };
 
 const CACHE_TTL_MS = 60 * 1000; // 60 seconds
+const WATCHED_CACHE_TTL_MS = 10 * 60 * 1000; // 10 minutes
+
+// complete: every project's features directory (and the registry) is watched
+let watcher: { rootDir: string; complete: boolean; close: () => void } | null = null;
+let watchUnsupported = false;
 
 export async function getCachedDashboardData(rootDir: string): Promise<DashboardData> {
   const now = Date.now();
+  const watched = watcher !== null && watcher.rootDir === rootDir && watcher.complete;
+  const ttl = watched ? WATCHED_CACHE_TTL_MS : CACHE_TTL_MS;
 
-  if (cache.data && (now - cache.timestamp) < CACHE_TTL_MS) {
+  if (cache.data && (now - cache.timestamp) < ttl) {
     console.log('Serving from cache');
     return cache.data;
   }
@@ -248,5 +445,114 @@ export async function getCachedDashboardData(rootDir: string): Promise<Dashboard
   const data = await generateDashboardData(rootDir);
   cache = { data, timestamp: now };
 
+  // Set SKATEBOARD_WATCH=0 to rely on the TTL alone (e.g. read-only deployments)
+  if (!watched && !watchUnsupported && process.env.SKATEBOARD_WATCH !== '0') {
+    watchFeatureFiles(rootDir);
+  }
+
   return data;
 }
+
+/**
+ * Watch every project's features directory and apply changes file by file
+ *
+ * A .feature file event re-indexes just that file and rebuilds the cached
+ * dashboard data from the index. A directory added, renamed or removed, or
+ * any change to .dashboard-projects.json, stops the watcher and invalidates
+ * the cache, so the next request rescans (and starts a fresh watcher).
+ * Returns a function that stops watching.
+ */
+export function watchFeatureFiles(rootDir: string): () => void {
+  if (watcher) {
+    watcher.close();
+  }
+
+  const projects = loadProjectRegistry(rootDir);
+  const index = getFeatureIndex(rootDir);
+  const watchers: fs.FSWatcher[] = [];
+  let saveTimer: NodeJS.Timeout | null = null;
+
+  let complete = true;
+
+  const invalidate = () => {
+    close();
+    cache = { data: null, timestamp: 0 };
+  };
+
+  try {
+    // The directory, not the file: the registry may be replaced by a rename
+    watchers.push(fs.watch(rootDir, (_event, fileName) => {
+      if (!fileName || fileName.toString() === '.dashboard-projects.json') {
+        invalidate();
+      }
+    }));
+  } catch (error) {
+    console.warn(`Cannot watch ${rootDir} for registry changes, falling back to ${CACHE_TTL_MS / 1000}s rescans:`, error);
+    complete = false;
+  }
+
+  for (const project of projects) {
+    const absolutePath = path.resolve(rootDir, project.featuresPath);
+    if (!fs.existsSync(absolutePath)) {
+      // Not watchable yet; the short TTL rescans (and re-watches) until it exists
+      complete = false;
+      continue;
+    }
+
+    try {
+      watchers.push(fs.watch(absolutePath, { recursive: true }, (_event, fileName) => {
+        if (!fileName) {
+          invalidate();
+          return;
+        }
+
+        const filePath = path.join(absolutePath, fileName.toString());
+        if (/[\\/](node_modules|venv)[\\/]/.test(filePath)) {
+          return;
+        }
+
+        const projectIndex = index.projects[project.id] || (index.projects[project.id] = emptyProjectIndex());
+        if (!filePath.endsWith('.feature')) {
+          // Editor temp files are ignored; a directory added, moved or removed needs a rescan
+          const isDirectory = fs.existsSync(filePath) && fs.statSync(filePath).isDirectory();
+          const heldFeatures = Object.keys(projectIndex.files).some(p => p.startsWith(filePath + path.sep));
+          if (isDirectory || heldFeatures) {
+            invalidate();
+          }
+          return;
+        }
+
+        if (updateIndexedFeature(projectIndex, filePath, project.id)) {
+          cache = { data: buildDashboardData(projects, index), timestamp: Date.now() };
+          if (!saveTimer) {
+            saveTimer = setTimeout(() => {
+              saveTimer = null;
+              saveFeatureIndex(index);
+            }, 1000);
+          }
+        }
+      }));
+    } catch (error) {
+      // Recursive watching is unavailable on some platforms: fall back to the TTL
+      console.warn(`Cannot watch ${absolutePath}, falling back to ${CACHE_TTL_MS / 1000}s rescans:`, error);
+      watchers.forEach(w => w.close());
+      watchUnsupported = true;
+      return () => {};
+    }
+  }
+
+  const close = () => {
+    watchers.forEach(w => w.close());
+    if (saveTimer) {
+      clearTimeout(saveTimer);
+      saveTimer = null;
+      saveFeatureIndex(index);
+    }
+    if (watcher && watcher.close === close) {
+      watcher = null;
+    }
+  };
+
+  watcher = { rootDir, complete, close };
+  return close;
+}
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the Python data pipeline
+Measures throughput and peak memory, and gates on a stored baseline
+
+Cases cover the longitudinal generator (s_curve, generate_week_snapshot,
+generate_longitudinal_dataset per engine), behave report ingestion and
+parse_json_path from the dashboard validation steps, over a matrix of
+feature counts, week counts and report sizes.
+
+Throughput is normalized by a fixed pure-Python calibration loop, so a
+baseline recorded on one Linux box stays meaningful on another: each sample
+of a case is paired with a calibration sample taken right before it, and the
+median of the per-pair ratios is kept, so load drift and one-off stalls
+cancel out. The gate widens its tolerance for microsecond-scale cases and
+for cases whose samples spread widely, ignores peak memory changes below
+MEMORY_NOISE_BYTES, and does not gate reference cases (the legacy
+implementations kept only for comparison). Runs fully offline; synthetic
+inputs are built in a temporary directory.
+
+Usage:
+    python benchmark_pipeline.py                    # compare against baseline
+    python benchmark_pipeline.py --update-baseline  # record a new baseline (median of --runs suites)
+    python benchmark_pipeline.py --threshold 15 --quick
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+import generate_longitudinal_data as generator
+from ingest_behave_results import summarize_report
+
+FEATURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "features")
+sys.path[:0] = [FEATURES_DIR, os.path.join(FEATURES_DIR, "steps")]
+from dashboard_validation_steps import compile_json_path, parse_json_path  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark-baseline.json")
+BEHAVE_RESULTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                   "..", "public", "bdd-data", "behave-results.json")
+
+# Default regression tolerance, in percent, for both throughput and peak memory
+DEFAULT_THRESHOLD = 25.0
+
+# Minimum wall time per timing sample, and samples per case (median is kept)
+MIN_SAMPLE_SECONDS = 0.2
+SAMPLES = 7
+
+# Cases faster than this per call get SMALL_CASE_FACTOR times the tolerance
+SMALL_CASE_SECONDS = 0.001
+SMALL_CASE_FACTOR = 2.0
+
+# Tolerance is at least this many times the relative spread of the samples
+SPREAD_FACTOR = 3.0
+
+# Upper bound for any widened throughput tolerance
+MAX_TOLERANCE = 90.0
+
+# Peak memory growth below this many bytes is noise, whatever the percentage
+MEMORY_NOISE_BYTES = 64 * 1024
+
+# Name marker of reference-only cases (measured, never gated)
+REFERENCE_MARKER = "legacy"
+
+FULL_MATRIX = {
+    "features": (6, 100, 1000),
+    "weeks": (24, 104, 260),
+    "report_features": (6, 60, 600),
+    "mockup_entries": (10, 1000, 10000),
+}
+
+QUICK_MATRIX = {
+    "features": (6, 100),
+    "weeks": (24, 104),
+    "report_features": (6, 60),
+    "mockup_entries": (10, 1000),
+}
+
+
+def calibration_workload():
+    """Fixed pure-Python workload; its ops/sec normalizes throughput"""
+    total = 0.0
+    for i in range(20000):
+        total += math.exp(-i % 12) * (i % 7)
+    return {"total": total, "items": [i for i in range(200)]}
+
+
+def sample_rate(func: Callable) -> Tuple[float, float]:
+    """Calls/sec of func over at least MIN_SAMPLE_SECONDS, and seconds per call"""
+    gc.collect()
+    calls = 0
+    started = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < MIN_SAMPLE_SECONDS:
+        func()
+        calls += 1
+        elapsed = time.perf_counter() - started
+    return calls / elapsed, elapsed / calls
+
+
+def median(values: List[float]) -> float:
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    return ordered[middle] if len(ordered) % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def calibrate() -> float:
+    """Median ops/sec of the calibration workload"""
+    return median([sample_rate(calibration_workload)[0] for _ in range(SAMPLES)])
+
+
+def time_case(func: Callable, units: int) -> Dict:
+    """
+    SAMPLES paired samples of func and the calibration workload.
+
+    Returns throughput (median units/sec), normalized_throughput (median of
+    the per-pair ratios), seconds_per_call and spread (interquartile range
+    of the ratios relative to their median).
+    """
+    rates, ratios, per_calls = [], [], []
+    for _ in range(SAMPLES):
+        calibration, _ = sample_rate(calibration_workload)
+        rate, per_call = sample_rate(func)
+        rates.append(rate * units)
+        ratios.append(rate * units / calibration)
+        per_calls.append(per_call)
+
+    ordered = sorted(ratios)
+    quartile = len(ordered) // 4
+    normalized = median(ratios)
+    return {
+        "throughput": median(rates),
+        "normalized_throughput": normalized,
+        "seconds_per_call": median(per_calls),
+        "spread": (ordered[-1 - quartile] - ordered[quartile]) / normalized if normalized else 0.0,
+    }
+
+
+def peak_memory(func: Callable) -> int:
+    """Peak traced Python allocation (bytes) during one call"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def legacy_parse_json_path(json_data, path):
+    """parse_json_path as it was before JsonPath: re-split and walk on every call"""
+    import re
+
+    parts = re.split(r'[\.\[]', path)
+    value = json_data
+
+    for part in parts:
+        part = part.rstrip(']')
+        if part.isdigit():
+            value = value[int(part)]
+        elif part:
+            value = value[part]
+
+    return value
+
+
+def build_report(path: str, num_features: int) -> None:
+    """Write a behave report with num_features features cloned from behave-results.json"""
+    with open(BEHAVE_RESULTS_PATH) as f:
+        template = json.load(f)
+    features = [template[i % len(template)] for i in range(num_features)]
+    with open(path, "w") as f:
+        json.dump(features, f)
+
+
+def build_mockup(num_entries: int) -> Dict:
+    """Mockup-shaped JSON with num_entries enablements and shared steps"""
+    return {
+        "option": "benchmark",
+        "enablements": [
+            {"name": f"Enablement {i}", "status": "passing" if i % 2 else "pending",
+             "steps": [f"step {i}.{j}" for j in range(4)]}
+            for i in range(num_entries)
+        ],
+        "shared_steps": [
+            {"definition": f"Given shared step {i}", "blocker_impact": {"total_features_blocked": i % 7}}
+            for i in range(num_entries)
+        ],
+    }
+
+
+def benchmark_cases(matrix: Dict, workdir: str) -> List[Tuple[str, Callable, int, str]]:
+    """(name, func, units per call, unit label) for every case in the matrix"""
+    cases = []
+
+    weeks_grid = [(week, start, duration) for week in range(1, 53) for start in (1, 8, 16) for duration in (4, 6)]
+    cases.append(("s_curve", lambda: [generator.s_curve(*args) for args in weeks_grid],
+                  len(weeks_grid), "calls"))
+
+    for num_features in matrix["features"]:
+        schedule = generator.synthetic_schedule(num_features, 52)
+        cases.append((f"generate_week_snapshot[features={num_features}]",
+                      lambda schedule=schedule: generator.generate_week_snapshot(12, schedule),
+                      1, "snapshots"))
+
+        for weeks in matrix["weeks"]:
+            schedule = generator.synthetic_schedule(num_features, weeks)
+            for engine in generator.ENGINES:
+                if engine == "vectorized" and generator.np is None:
+                    continue
+                cases.append((
+                    f"generate_longitudinal_dataset[{engine},features={num_features},weeks={weeks}]",
+                    lambda weeks=weeks, engine=engine, schedule=schedule:
+                        generator.generate_longitudinal_dataset(weeks, engine, schedule),
+                    num_features * weeks, "cells"))
+
+    for num_features in matrix["report_features"]:
+        path = os.path.join(workdir, f"report-{num_features}.json")
+        build_report(path, num_features)
+        cases.append((f"summarize_report[features={num_features}]",
+                      lambda path=path: summarize_report(path),
+                      os.path.getsize(path), "bytes"))
+
+    for num_entries in matrix["mockup_entries"]:
+        mockup = build_mockup(num_entries)
+        paths = [f"enablements[{i}].name" for i in range(0, num_entries, max(1, num_entries // 100))]
+        paths += [f"shared_steps[{i}].blocker_impact.total_features_blocked"
+                  for i in range(0, num_entries, max(1, num_entries // 100))]
+        cases.append((f"parse_json_path[entries={num_entries}]",
+                      lambda mockup=mockup, paths=paths: [parse_json_path(mockup, p) for p in paths],
+                      len(paths), "lookups"))
+        cases.append((f"json_path[legacy,entries={num_entries}]",
+                      lambda mockup=mockup, paths=paths: [legacy_parse_json_path(mockup, p) for p in paths],
+                      len(paths), "lookups"))
+
+        # A whole column: N indexed lookups vs one wildcard traversal
+        column = [f"enablements[{i}].status" for i in range(num_entries)]
+        cases.append((f"json_path[column-legacy,entries={num_entries}]",
+                      lambda mockup=mockup, column=column: [legacy_parse_json_path(mockup, p) for p in column],
+                      num_entries, "values"))
+        cases.append((f"json_path[column-wildcard,entries={num_entries}]",
+                      lambda mockup=mockup: compile_json_path("enablements[*].status").resolve(mockup),
+                      num_entries, "values"))
+
+    return cases
+
+
+def run_suite(matrix: Dict, only: Optional[str] = None) -> Dict:
+    """Run every case; returns {"calibration": ops/sec, "cases": {name: metrics}}"""
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, func, units, unit in benchmark_cases(matrix, workdir):
+            if only and only not in name:
+                continue
+            metrics = time_case(func, units)
+            results[name] = {"unit": unit, **metrics, "peak_bytes": peak_memory(func)}
+            print(f"   {name}: {metrics['throughput']:,.0f} {unit}/s "
+                  f"(±{metrics['spread'] * 100:.0f}%), peak {results[name]['peak_bytes'] / 1024:,.0f} KiB")
+    return {"calibration": calibrate(), "cases": results}
+
+
+def median_suite(suites: List[Dict]) -> Dict:
+    """Per case and metric, the median across several run_suite() results"""
+    cases = {}
+    for name, first in suites[0]["cases"].items():
+        runs = [suite["cases"][name] for suite in suites if name in suite["cases"]]
+        cases[name] = {key: median([run[key] for run in runs]) if isinstance(value, (int, float)) else value
+                       for key, value in first.items()}
+        cases[name]["peak_bytes"] = int(cases[name]["peak_bytes"])
+    return {"calibration": median([suite["calibration"] for suite in suites]), "cases": cases}
+
+
+def is_reference(name: str) -> bool:
+    return REFERENCE_MARKER in name
+
+
+def case_tolerance(metrics: Dict, reference: Dict, threshold: float) -> float:
+    """Allowed throughput regression in percent for one case"""
+    tolerance = threshold
+    if min(metrics["seconds_per_call"], reference["seconds_per_call"]) < SMALL_CASE_SECONDS:
+        tolerance *= SMALL_CASE_FACTOR
+    spread = max(metrics.get("spread", 0.0), reference.get("spread", 0.0))
+    return min(max(tolerance, SPREAD_FACTOR * spread * 100), MAX_TOLERANCE)
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Regressions beyond each case's tolerance, as human-readable lines"""
+    regressions = []
+    for name, metrics in current["cases"].items():
+        reference = baseline.get("cases", {}).get(name)
+        if not reference or is_reference(name):
+            continue
+
+        tolerance = case_tolerance(metrics, reference, threshold)
+        floor = reference["normalized_throughput"] * (1 - tolerance / 100)
+        if metrics["normalized_throughput"] < floor:
+            change = (metrics["normalized_throughput"] / reference["normalized_throughput"] - 1) * 100
+            regressions.append(f"{name}: throughput {change:+.1f}% (limit -{tolerance:.0f}%)")
+
+        ceiling = max(reference["peak_bytes"] * (1 + threshold / 100), reference["peak_bytes"] + MEMORY_NOISE_BYTES)
+        if metrics["peak_bytes"] > ceiling:
+            change = (metrics["peak_bytes"] / reference["peak_bytes"] - 1) * 100
+            regressions.append(f"{name}: peak memory {change:+.1f}% (limit +{threshold:.0f}%)")
+
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Python data pipeline against a baseline")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline file to compare against / update")
+    parser.add_argument("--threshold", type=float,
+                        default=float(os.getenv("BENCHMARK_THRESHOLD", DEFAULT_THRESHOLD)),
+                        help="Allowed regression in percent, widened per case for small or noisy "
+                             "cases (env: BENCHMARK_THRESHOLD)")
+    parser.add_argument("--update-baseline", action="store_true", help="Record results as the new baseline")
+    parser.add_argument("--runs", type=int, default=3,
+                        help="Suite runs whose per-case median --update-baseline records")
+    parser.add_argument("--quick", action="store_true", help="Run the smaller matrix")
+    parser.add_argument("--only", default=None, help="Only run cases whose name contains this string")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    matrix = QUICK_MATRIX if args.quick else FULL_MATRIX
+
+    print(f"⏱️  Benchmarking pipeline ({'quick' if args.quick else 'full'} matrix)")
+    if args.update_baseline and args.runs > 1:
+        suites = []
+        for run in range(args.runs):
+            print(f"   -- run {run + 1}/{args.runs}")
+            suites.append(run_suite(matrix, args.only))
+        current = median_suite(suites)
+    else:
+        current = run_suite(matrix, args.only)
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.setdefault("cases", {}).update(current["cases"])
+        baseline["calibration"] = current["calibration"]
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"\n📁 Baseline updated: {args.baseline}")
+        sys.exit(0)
+
+    if not os.path.exists(args.baseline):
+        print(f"\n⚠️  No baseline at {args.baseline}; run with --update-baseline to record one")
+        sys.exit(0)
+
+    with open(args.baseline) as f:
+        regressions = compare(current, json.load(f), args.threshold)
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond tolerance (base {args.threshold:.0f}%):")
+        for line in regressions:
+            print(f"   {line}")
+        sys.exit(1)
+
+    print(f"\n✅ No regressions beyond tolerance (base {args.threshold:.0f}%)")
@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""
+Prebuild dashboard API payloads from behave results, feature files and DUX Behaviors
+Writes versioned JSON snapshots that the API routes stream instead of parsing per request
+
+Payloads (same shapes the routes compute in-process):
+    features            GET /api/bdd/features
+    feature/<id>        GET /api/bdd/features/<id>
+    progress            GET /api/bdd/progress
+    skateboard          GET /api/skateboard/dashboard
+
+Each build goes to <output>/<version>/ and becomes live when manifest.json is
+atomically replaced to point at it, so a route never sees a half-written
+build. Older builds are pruned after --keep newer ones exist. With
+--compress, .gz and .br (if the brotli package is installed) siblings are
+written and served to clients that accept them.
+
+The manifest records the mtime/size of every input a build was computed
+from. A route serves a prebuilt payload only while its inputs are unchanged
+and computes the payload live otherwise, so results and .feature edits show
+up even when no builder is running.
+
+With --watch, the inputs (behave-results.json, every project's features
+directory, DUX-Governance behaviors, .dashboard-projects.json) are polled
+and a new build is written whenever one of them changes.
+
+Usage:
+    python build_api_snapshots.py
+    python build_api_snapshots.py --watch --compress gzip,br
+"""
+
+import argparse
+import glob
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from generate_evidence_corpus import EvidenceIndex
+from score_feature_quality import region_layers
+
+try:
+    import brotli
+except ImportError:  # brotli is only needed for --compress br
+    brotli = None
+
+DASHBOARD_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+DEFAULT_OUTPUT = os.path.join(DASHBOARD_DIR, "public", "bdd-data", "prebuilt")
+DEFAULT_RESULTS = os.path.join(DASHBOARD_DIR, "public", "bdd-data", "behave-results.json")
+# The routes resolve these from process.cwd() (the dashboard directory)
+DEFAULT_DUX_GOVERNANCE = os.path.join(DASHBOARD_DIR, "..", "DUX-Governance")
+DEFAULT_ROOT_DIR = os.path.join(DASHBOARD_DIR, "..", "..")
+
+# Bump when a payload shape changes; routes ignore manifests with another schema
+MANIFEST_SCHEMA = 2
+
+COMPRESSIONS = ("gzip", "br")
+
+BEHAVIOR_JSON = re.compile(r"```json\s*\n([\s\S]*?)\n```")
+SCENARIO_LINE = re.compile(r"^\s*(Scenario|Scenario Outline):", re.MULTILINE)
+
+# Sections of /api/bdd/progress not derived from behave results; kept as the
+# route serves them until their sources exist
+PROGRESS_STATIC_SECTIONS = {
+    "unit_dependencies": [],
+    "conservative_hitl_metrics": {
+        "evidence_in_review": 12,
+        "evidence_approved": 45,
+        "evidence_rejected": 3,
+        "average_review_time_ms": 120000,
+        "active_reviewers": 5,
+        "quality_gates_passed": 8,
+    },
+    "demo_readiness": {
+        "overall_status": "ready",
+        "critical_blockers": 0,
+        "key_features_operational": 3,
+        "evidence_pipeline_health": "healthy",
+    },
+    "atlas_unit_status": {
+        "unit_1_evidence_validation": "operational",
+        "unit_2_hitl_integration": "operational",
+        "unit_7_slide_generation": "in_progress",
+    },
+}
+
+
+def now_iso() -> str:
+    return datetime.utcnow().isoformat(timespec="milliseconds") + "Z"
+
+
+def feature_id(name: str) -> str:
+    """Same id the features route derives: lowercased, whitespace runs -> _"""
+    return re.sub(r"\s+", "_", name.lower())
+
+
+def load_behaviors(dux_governance: str) -> List[Dict]:
+    """DUX Behavior objects, as loadAllBehaviors() in app/lib/parseDuxObjects.ts"""
+    behaviors_dir = os.path.join(dux_governance, "instances", "behaviors")
+    if not os.path.isdir(behaviors_dir):
+        return []
+    behaviors = []
+    for name in sorted(os.listdir(behaviors_dir)):
+        if not name.endswith(".md"):
+            continue
+        try:
+            with open(os.path.join(behaviors_dir, name), encoding="utf-8") as f:
+                match = BEHAVIOR_JSON.search(f.read())
+            if match:
+                behaviors.append(json.loads(match.group(1)))
+        except (OSError, ValueError) as error:
+            print(f"⚠️  Skipping behavior {name}: {error}")
+    return behaviors
+
+
+def build_features(behave_results: List[Dict], behaviors: List[Dict]) -> List[Dict]:
+    """BDDFeature list, as buildPayload() in app/lib/featuresPayload.ts"""
+    index = EvidenceIndex(behaviors)
+    features = []
+    for idx, feature in enumerate(behave_results):
+        fid = feature_id(feature["name"])
+        scenarios = []
+        for sidx, scenario in enumerate(e for e in feature.get("elements") or [] if e.get("type") == "scenario"):
+            steps = []
+            for step_idx, step in enumerate(scenario.get("steps") or []):
+                result = step.get("result") or {}
+                entry = {
+                    "id": f"step_{idx}_{sidx}_{step_idx}",
+                    "name": f"{step.get('keyword')}{step.get('name')}",
+                    "status": result.get("status") or "undefined",
+                    "execution_time": result.get("duration") or 0,
+                }
+                if "error_message" in result:
+                    entry["error_message"] = result["error_message"]
+                steps.append(entry)
+            status = scenario.get("status") or "undefined"
+            scenarios.append({
+                "id": f"{fid}_s{sidx + 1}",
+                "name": scenario.get("name"),
+                "description": scenario.get("name"),
+                "status": status,
+                "feature_id": fid,
+                "steps": steps,
+                "passed": status == "passed",
+                "pending": status == "pending",
+            })
+
+        passed = sum(1 for s in scenarios if s["status"] == "passed")
+        status = feature.get("status")
+        features.append({
+            "id": fid,
+            "name": feature["name"],
+            "title": feature["name"],
+            "file_path": feature.get("location"),
+            "status": ("completed" if status == "passed" else "failed" if status == "failed"
+                       else "in_progress" if passed > 0 else "not_started"),
+            # Math.round for non-negative values
+            "overall_progress": int(passed / len(scenarios) * 100 + 0.5) if scenarios else 0,
+            "evidenceCount": index.lookup(feature["name"])[0],
+            "passedScenarios": passed,
+            "totalScenarios": len(scenarios),
+            "passing": status == "passed",
+            "inProgress": 0 < passed < len(scenarios),
+            "scenarios": scenarios,
+        })
+    return features
+
+
+def features_payload(features: List[Dict], generated_at: str) -> Dict:
+    return {
+        "features": features,
+        "summary": {
+            "total_features": len(features),
+            "total_scenarios": sum(len(f["scenarios"]) for f in features),
+            "total_steps": sum(len(s["steps"]) for f in features for s in f["scenarios"]),
+            "status": "specification_phase",
+            "step_definitions_implemented": False,
+        },
+        "generated_at": generated_at,
+        "data_source": "Behave Test Results (Real Data)",
+    }
+
+
+def progress_payload(features: List[Dict], generated_at: str) -> Dict:
+    """BDDProgressData with bdd_progress computed from the behave results"""
+    steps = [step for f in features for s in f["scenarios"] for step in s["steps"]]
+    scenarios = [s for f in features for s in f["scenarios"]]
+    counts = {status: sum(1 for step in steps if step["status"] == status)
+              for status in ("passed", "failed", "undefined", "skipped", "pending")}
+
+    def percent(part, whole):
+        return int(part / whole * 100 + 0.5) if whole else 0
+
+    payload = {
+        "bdd_progress": {
+            "total_features": len(features),
+            "total_scenarios": len(scenarios),
+            "total_steps": len(steps),
+            **{f"{status}_steps": count for status, count in counts.items()},
+            "implementation_completeness": percent(sum(1 for s in scenarios if s["status"] == "passed"),
+                                                   len(scenarios)),
+            "definition_coverage": percent(len(steps) - counts["undefined"], len(steps)),
+            "step_execution_rate": percent(counts["passed"], len(steps)),
+        },
+    }
+    payload.update(PROGRESS_STATIC_SECTIONS)
+    payload["generated_at"] = generated_at
+    return payload
+
+
+def load_projects(root_dir: str) -> List[Dict]:
+    """Project registry, as loadProjectRegistry() in lib/skateboard-filesystem-parser.ts"""
+    registry_path = os.path.join(root_dir, ".dashboard-projects.json")
+    if not os.path.exists(registry_path):
+        return [{"id": "discrete-connection", "name": "Discrete Connection",
+                 "featuresPath": "./features", "source": "local"}]
+    with open(registry_path) as f:
+        return json.load(f)["projects"]
+
+
+def project_feature_files(project: Dict, root_dir: str) -> List[str]:
+    features_dir = os.path.abspath(os.path.join(root_dir, project["featuresPath"]))
+    files = glob.glob(os.path.join(features_dir, "**", "*.feature"), recursive=True)
+    return sorted(f for f in files if not re.search(r"[\\/](node_modules|venv)[\\/]", f))
+
+
+def skateboard_payload(root_dir: str, generated_at: str) -> Dict:
+    """DashboardData, as generateDashboardData() in lib/skateboard-filesystem-parser.ts"""
+    summaries = []
+    for project in load_projects(root_dir):
+        features = []
+        for path in project_feature_files(project, root_dir):
+            with open(path, encoding="utf-8", errors="replace") as f:
+                content = f.read()
+            # lintFeature: 25 points per layer, over the whole file
+            score = 25 * sum(region_layers(content).values())
+            features.append({
+                "fileName": os.path.basename(path),
+                "scenarioCount": len(SCENARIO_LINE.findall(content)),
+                "lintScore": score,
+                "qualityLayers": {
+                    "functional": score >= 25,
+                    "reliable": score >= 50,
+                    "usable": score >= 75,
+                    "delightful": score == 100,
+                },
+            })
+        summaries.append({
+            "id": project["id"],
+            "name": project["name"],
+            "featureCount": len(features),
+            "scenarioCount": sum(f["scenarioCount"] for f in features),
+            "avgLintScore": (int(sum(f["lintScore"] for f in features) / len(features) + 0.5)
+                             if features else 0),
+            "features": features,
+        })
+    return {"projects": summaries, "lastUpdated": generated_at}
+
+
+def build_payloads(results_path: str, dux_governance: str, root_dir: str) -> Dict[str, Dict]:
+    """{payload name: document} for every prebuilt route"""
+    generated_at = now_iso()
+    with open(results_path) as f:
+        behave_results = json.load(f)
+    features = build_features(behave_results, load_behaviors(dux_governance))
+
+    payloads = {
+        "features": features_payload(features, generated_at),
+        "progress": progress_payload(features, generated_at),
+        "skateboard": skateboard_payload(root_dir, generated_at),
+    }
+    for feature in features:
+        payloads[f"feature/{feature['id']}"] = {"feature": feature, "generated_at": generated_at}
+    return payloads
+
+
+def payload_file(name: str) -> str:
+    """File name for a payload; feature ids can contain any character"""
+    if name.startswith("feature/"):
+        return f"feature-{hashlib.sha1(name.encode()).hexdigest()[:16]}.json"
+    return f"{name}.json"
+
+
+def write_build(output_dir: str, payloads: Dict[str, Dict], compress: Tuple[str, ...], keep: int,
+                signature: Dict[str, Tuple]) -> Dict:
+    """
+    Write one versioned build, switch manifest.json to it, prune old builds;
+    returns the manifest. signature is input_signature() taken before the
+    payloads were computed; the routes compare it with the files on disk and
+    compute live when an input has changed since.
+    """
+    version = datetime.utcnow().strftime("%Y%m%dT%H%M%S%fZ")
+    build_dir = os.path.join(output_dir, version)
+    os.makedirs(build_dir)
+
+    entries = {}
+    for name, document in payloads.items():
+        body = json.dumps(document, separators=(",", ":")).encode()
+        file_name = payload_file(name)
+        with open(os.path.join(build_dir, file_name), "wb") as f:
+            f.write(body)
+
+        encodings = {}
+        if "gzip" in compress:
+            with open(os.path.join(build_dir, f"{file_name}.gz"), "wb") as f:
+                f.write(gzip.compress(body, compresslevel=9, mtime=0))
+            encodings["gzip"] = f"{version}/{file_name}.gz"
+        if "br" in compress and brotli is not None:
+            with open(os.path.join(build_dir, f"{file_name}.br"), "wb") as f:
+                f.write(brotli.compress(body))
+            encodings["br"] = f"{version}/{file_name}.br"
+
+        entries[name] = {
+            "file": f"{version}/{file_name}",
+            "etag": f'W/"{hashlib.sha1(body).hexdigest()[:20]}"',
+            "size": len(body),
+            "encodings": encodings,
+            "inputs": payload_inputs(name),
+        }
+
+    manifest = {
+        "schema": MANIFEST_SCHEMA,
+        "version": version,
+        "generated_at": now_iso(),
+        "payloads": entries,
+        # mtime_ns as a string: it does not fit a JSON (double) number
+        "inputs": {
+            group: [{"path": path, "mtime_ns": None if mtime_ns is None else str(mtime_ns), "size": size}
+                    for path, mtime_ns, size in stamps]
+            for group, stamps in signature.items()
+        },
+    }
+    manifest_path = os.path.join(output_dir, "manifest.json")
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
+
+    # Older builds stay around briefly for responses still streaming from them
+    builds = sorted(d for d in os.listdir(output_dir) if os.path.isdir(os.path.join(output_dir, d)))
+    for stale in builds[:-keep] if keep > 0 else []:
+        shutil.rmtree(os.path.join(output_dir, stale), ignore_errors=True)
+    return manifest
+
+
+def input_paths(results_path: str, dux_governance: str, root_dir: str) -> Dict[str, List[str]]:
+    """{input group: paths} - "results" feeds the features/progress payloads, "skateboard" the skateboard one"""
+    results = [results_path]
+    behaviors_dir = os.path.join(dux_governance, "instances", "behaviors")
+    results.append(behaviors_dir)
+    if os.path.isdir(behaviors_dir):
+        results.extend(os.path.join(behaviors_dir, name) for name in sorted(os.listdir(behaviors_dir)))
+
+    # Directories too, so an added or removed .feature file changes the signature
+    skateboard = [os.path.join(root_dir, ".dashboard-projects.json")]
+    try:
+        for project in load_projects(root_dir):
+            files = project_feature_files(project, root_dir)
+            directories = {os.path.abspath(os.path.join(root_dir, project["featuresPath"]))}
+            directories.update(os.path.dirname(path) for path in files)
+            skateboard.extend(sorted(directories))
+            skateboard.extend(files)
+    except (OSError, ValueError, KeyError):
+        pass
+    return {"results": [os.path.abspath(path) for path in results],
+            "skateboard": [os.path.abspath(path) for path in skateboard]}
+
+
+def input_signature(results_path: str, dux_governance: str, root_dir: str) -> Dict[str, Tuple]:
+    """{input group: mtime/size of every input}; a change means that group's payloads are stale"""
+    signature = {}
+    for group, paths in input_paths(results_path, dux_governance, root_dir).items():
+        entries = []
+        for path in paths:
+            try:
+                stats = os.stat(path)
+                entries.append((path, stats.st_mtime_ns, stats.st_size))
+            except OSError:
+                entries.append((path, None, None))
+        signature[group] = tuple(entries)
+    return signature
+
+
+def payload_inputs(name: str) -> str:
+    """Input group a payload is computed from"""
+    return "skateboard" if name == "skateboard" else "results"
+
+
+def build(args, signature: Dict[str, Tuple]) -> Optional[Dict]:
+    started = time.perf_counter()
+    try:
+        payloads = build_payloads(args.results, args.dux_governance, args.root_dir)
+    except (OSError, ValueError) as error:
+        # A results drop may be mid-write; the next poll retries
+        print(f"⚠️  Build skipped: {error}")
+        return None
+    manifest = write_build(args.output, payloads, args.compress, args.keep, signature)
+    print(f"✅ Built {len(payloads)} payloads as {manifest['version']} "
+          f"({time.perf_counter() - started:.2f}s)")
+    return manifest
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Prebuild dashboard API payloads")
+    parser.add_argument("--results", default=DEFAULT_RESULTS, help="behave-results.json")
+    parser.add_argument("--dux-governance", default=DEFAULT_DUX_GOVERNANCE, help="DUX-Governance checkout")
+    parser.add_argument("--root-dir", default=DEFAULT_ROOT_DIR,
+                        help="Directory holding .dashboard-projects.json (skateboard projects)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Prebuilt payload directory")
+    parser.add_argument("--compress", default="",
+                        help=f"Comma-separated encodings to prebuild ({', '.join(COMPRESSIONS)})")
+    parser.add_argument("--keep", type=int, default=3, help="Builds to keep, including the live one")
+    parser.add_argument("--watch", action="store_true", help="Rebuild whenever an input changes")
+    parser.add_argument("--interval", type=float, default=2.0, help="Seconds between input polls")
+    args = parser.parse_args(argv)
+
+    args.compress = tuple(encoding for encoding in args.compress.split(",") if encoding)
+    unknown = set(args.compress) - set(COMPRESSIONS)
+    if unknown:
+        parser.error(f"Unknown encoding(s): {', '.join(sorted(unknown))}")
+    if "br" in args.compress and brotli is None:
+        print("⚠️  brotli is not installed; writing gzip only")
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    os.makedirs(args.output, exist_ok=True)
+
+    signature = input_signature(args.results, args.dux_governance, args.root_dir)
+    if not build(args, signature) and not args.watch:
+        sys.exit(1)
+    print(f"📁 Output: {os.path.join(args.output, 'manifest.json')}")
+    if not args.watch:
+        sys.exit(0)
+
+    print(f"⏱️  Watching inputs every {args.interval:g}s (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(args.interval)
+            current = input_signature(args.results, args.dux_governance, args.root_dir)
+            if current != signature:
+                # Only advance the signature once a build succeeds
+                if build(args, current):
+                    signature = current
+    except KeyboardInterrupt:
+        pass
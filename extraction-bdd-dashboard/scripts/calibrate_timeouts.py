@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Calibrate timeout budgets from measured behave timings
+Writes per-environment budgets into timeout-strategy.yaml for TimeoutManager
+
+Budgets are percentile-based: p95 of the measurements from passing runs in
+that environment (ci_cd / production / development, as recorded by the
+metrics store), times a headroom factor, rounded up to 100ms. Budgets that
+lack --min-samples measurements keep their current value.
+
+Calibrated values land in each environment profile as *_p95 keys and are
+exposed through timeout_formulas (page_load, section_render, view_switch,
+step_execution), so TimeoutManager applies its usual scaling factors.
+Everything else in an existing timeout-strategy.yaml is preserved.
+
+Usage:
+    python calibrate_timeouts.py
+    python calibrate_timeouts.py --headroom 1.3 --runs 50 --dry-run
+"""
+
+import argparse
+import copy
+import math
+import os
+import sys
+from datetime import datetime
+from typing import Dict, List
+
+import yaml
+
+from metrics_report import DEFAULT_DB, percentile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "features"))
+from metrics_store import connect  # noqa: E402
+
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "timeout-strategy.yaml")
+
+ENVIRONMENTS = ("ci_cd", "production", "development")
+
+# Profile key -> (formula name, SQL selecting (environment, value_ms) samples)
+BUDGETS = {
+    "page_load_p95": ("page_load", """
+        SELECT r.environment, m.value FROM measurements m
+        JOIN scenarios s ON s.id = m.scenario_id
+        JOIN runs r ON r.test_run_id = s.test_run_id AND r.worker = s.worker
+        WHERE m.kind = 'navigation' AND m.name = 'load' AND s.test_run_id IN ({runs})
+    """),
+    "render_p95": ("section_render", """
+        SELECT r.environment, m.value FROM measurements m
+        JOIN scenarios s ON s.id = m.scenario_id
+        JOIN runs r ON r.test_run_id = s.test_run_id AND r.worker = s.worker
+        WHERE m.kind = 'render' AND m.name != 'view_switch' AND s.test_run_id IN ({runs})
+    """),
+    "view_switch_p95": ("view_switch", """
+        SELECT r.environment, m.value FROM measurements m
+        JOIN scenarios s ON s.id = m.scenario_id
+        JOIN runs r ON r.test_run_id = s.test_run_id AND r.worker = s.worker
+        WHERE m.kind = 'render' AND m.name = 'view_switch' AND s.test_run_id IN ({runs})
+    """),
+    "step_p95": ("step_execution", """
+        SELECT r.environment, st.duration_ms FROM steps st
+        JOIN scenarios s ON s.id = st.scenario_id
+        JOIN runs r ON r.test_run_id = s.test_run_id AND r.worker = s.worker
+        WHERE st.status = 'passed' AND s.test_run_id IN ({runs})
+    """),
+}
+
+# Budget used for environments with no calibrated value yet (the .feature SLAs),
+# so every profile defines every variable the calibrated formulas reference
+UNCALIBRATED_BUDGETS = {
+    "page_load_p95": 3000,
+    "render_p95": 1000,
+    "view_switch_p95": 200,
+    "step_p95": 2000,
+}
+
+# Schema TimeoutManager consumes, used when no timeout-strategy.yaml exists yet
+# (mirrors TimeoutManager.getDefaultConfig plus port discovery defaults)
+DEFAULT_STRATEGY = {
+    "environments": {
+        environment: {
+            "docling_processing_base": 14000,
+            "network_buffer": 3000,
+            "ui_interaction_buffer": 2000,
+        }
+        for environment in ENVIRONMENTS
+    },
+    "timeout_formulas": {
+        "bdd_global": "docling_processing_base + network_buffer + ui_interaction_buffer + 5000",
+        "docling_operation": "docling_processing_base + network_buffer",
+        "ui_interaction": "ui_interaction_buffer",
+        "api_call": "network_buffer",
+        "dashboard_update": "network_buffer + ui_interaction_buffer",
+    },
+    "scaling_factors": {
+        "slow_machine_multiplier": 1.5,
+        "ci_environment_multiplier": 1.25,
+        "high_load_multiplier": 2.0,
+    },
+    "port_discovery": {
+        "base_port": 3000,
+        "max_retries": 10,
+        "health_check_timeout": 2000,
+    },
+}
+
+
+def passing_runs(connection, limit: int) -> List[str]:
+    """The latest `limit` test_run_ids in which no scenario failed"""
+    rows = connection.execute("""
+        SELECT r.test_run_id FROM runs r
+        WHERE NOT EXISTS (SELECT 1 FROM scenarios s
+                          WHERE s.test_run_id = r.test_run_id AND s.status IN ('failed', 'error'))
+        GROUP BY r.test_run_id ORDER BY MIN(r.started_at) DESC LIMIT ?
+    """, (limit,)).fetchall()
+    return [row[0] for row in rows]
+
+
+def calibrate(connection, runs: List[str], headroom: float, min_samples: int) -> Dict[str, Dict]:
+    """
+    {environment: {profile key: {"budget": ms, "p95": ms, "samples": n}}}
+    for every budget with at least min_samples measurements.
+    """
+    calibrated: Dict[str, Dict] = {}
+    if not runs:
+        return calibrated
+    placeholders = ", ".join("?" for _ in runs)
+
+    for key, (_, query) in BUDGETS.items():
+        samples: Dict[str, List[float]] = {}
+        for environment, value in connection.execute(query.format(runs=placeholders), runs):
+            samples.setdefault(environment or "development", []).append(value)
+
+        for environment, values in samples.items():
+            if len(values) < min_samples:
+                continue
+            p95 = percentile(values, 95)
+            calibrated.setdefault(environment, {})[key] = {
+                "budget": int(math.ceil(p95 * headroom / 100) * 100),
+                "p95": round(p95, 1),
+                "samples": len(values),
+            }
+    return calibrated
+
+
+def load_strategy(path: str) -> Dict:
+    """Existing strategy merged over the defaults, so every section is present"""
+    strategy = copy.deepcopy(DEFAULT_STRATEGY)
+    if os.path.exists(path):
+        with open(path) as f:
+            existing = yaml.safe_load(f) or {}
+        for section, values in existing.items():
+            if isinstance(values, dict) and isinstance(strategy.get(section), dict):
+                if section == "environments":
+                    for environment, profile in values.items():
+                        strategy[section].setdefault(environment, {}).update(profile or {})
+                else:
+                    strategy[section].update(values)
+            else:
+                strategy[section] = values
+    return strategy
+
+
+def apply_calibration(strategy: Dict, calibrated: Dict[str, Dict], headroom: float, runs: int) -> Dict:
+    for environment, budgets in calibrated.items():
+        profile = strategy["environments"].setdefault(environment, {})
+        for key, result in budgets.items():
+            profile[key] = result["budget"]
+            strategy["timeout_formulas"][BUDGETS[key][0]] = key
+
+    calibrated_keys = {key for budgets in calibrated.values() for key in budgets}
+    for profile in strategy["environments"].values():
+        for key in calibrated_keys:
+            profile.setdefault(key, UNCALIBRATED_BUDGETS[key])
+
+    # Kept outside `environments`: TimeoutManager substitutes every profile key into formulas
+    strategy["calibration"] = {
+        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "headroom": headroom,
+        "runs": runs,
+        "budgets": {
+            environment: {key: {"p95": result["p95"], "samples": result["samples"]}
+                          for key, result in budgets.items()}
+            for environment, budgets in calibrated.items()
+        },
+    }
+    return strategy
+
+
+def write_strategy(path: str, strategy: Dict) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write("# Timeout strategy consumed by timeout-manager.js\n")
+        f.write("# *_p95 budgets are calibrated by scripts/calibrate_timeouts.py from measured runs\n")
+        yaml.safe_dump(strategy, f, sort_keys=False, default_flow_style=False)
+    os.replace(tmp_path, path)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Calibrate timeout budgets from recorded behave timings")
+    parser.add_argument("--db", default=os.getenv("METRICS_DB", DEFAULT_DB), help="SQLite metrics store")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="timeout-strategy.yaml to update")
+    parser.add_argument("--runs", type=int, default=30, help="Most recent passing runs to calibrate from")
+    parser.add_argument("--headroom", type=float, default=1.5, help="Budget = p95 x headroom")
+    parser.add_argument("--min-samples", type=int, default=20,
+                        help="Measurements required before a budget is calibrated")
+    parser.add_argument("--dry-run", action="store_true", help="Print budgets without writing")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if not os.path.exists(args.db):
+        print(f"⚠️  No metrics store at {args.db}; run behave first")
+        sys.exit(0)
+
+    connection = connect(args.db)
+    runs = passing_runs(connection, args.runs)
+    calibrated = calibrate(connection, runs, args.headroom, args.min_samples)
+    print(f"📊 Calibrated from {len(runs)} passing runs (p95 x {args.headroom})")
+    for environment in sorted(calibrated):
+        for key, result in calibrated[environment].items():
+            print(f"   {environment}.{key}: {result['budget']}ms "
+                  f"(p95 {result['p95']:.0f}ms, n={result['samples']})")
+    if not calibrated:
+        print(f"⚠️  No budget has {args.min_samples}+ samples yet; nothing to calibrate")
+        sys.exit(0)
+
+    if args.dry_run:
+        sys.exit(0)
+
+    strategy = apply_calibration(load_strategy(args.output), calibrated, args.headroom, len(runs))
+    write_strategy(args.output, strategy)
+    print(f"📁 Output: {args.output}")
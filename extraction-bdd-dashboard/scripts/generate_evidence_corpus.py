@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Generate a synthetic DUX-Governance Behavior corpus for evidence matching benchmarks
+Writes thousands of instances/behaviors/*.md files plus matching feature names
+
+The corpus has the same layout loadAllBehaviors() reads, so the features API
+can be pointed at it, and --benchmark times a Python mirror of the old
+linear keyword scan against the token index in app/lib/parseDuxObjects.ts
+(checking both return identical counts and IDs).
+
+Usage:
+    python generate_evidence_corpus.py --behaviors 5000 --features 500
+    python generate_evidence_corpus.py --behaviors 20000 --benchmark
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import shutil
+import time
+from typing import Dict, List, Tuple
+
+# Mirrors FEATURE_BEHAVIOR_KEYWORDS in app/lib/parseDuxObjects.ts
+FEATURE_BEHAVIOR_KEYWORDS = (
+    ("ownership", "owner"),
+    ("connect", "connect"),
+    ("signal", "signal"),
+    ("interest", "interest"),
+    ("health", "health"),
+    ("privacy", "privacy"),
+    ("reputation", "reputation"),
+)
+
+# Written to the corpus root; only a directory holding it is ever cleared
+CORPUS_MARKER = ".evidence-corpus"
+
+# Vocabulary for synthetic user_enablement sentences and feature names
+SUBJECTS = ("member", "steward", "analyst", "owner", "reviewer", "operator", "newcomer", "moderator")
+VERBS = ("can see", "can adjust", "is notified of", "can export", "can compare", "can share", "can audit")
+OBJECTS = ("workspace ownership", "connection requests", "signal strength", "shared interests",
+           "community health", "privacy settings", "reputation history", "budget limits",
+           "consent receipts", "evidence trails", "quality scores", "onboarding progress")
+FEATURE_PREFIXES = ("Workspace", "Connection", "Signal", "Interest", "Community", "Privacy",
+                    "Reputation", "Budget", "Consent", "Evidence", "Quality", "Onboarding")
+
+
+def synthetic_behaviors(count: int, seed: int = 7) -> List[Dict]:
+    rng = random.Random(seed)
+    behaviors = []
+    for index in range(count):
+        behaviors.append({
+            "object_type": "behavior",
+            "id": f"BHV-{index + 1:05d}",
+            "user_enablement": f"{rng.choice(SUBJECTS)} {rng.choice(VERBS)} {rng.choice(OBJECTS)}",
+            "observable_signals": [f"signal-{rng.randrange(1000)}" for _ in range(rng.randrange(1, 4))],
+            "acceptance_criteria": [],
+            "evidence": [f"EVD-{rng.randrange(100000):05d}" for _ in range(rng.randrange(0, 9))],
+            "tags": ["synthetic"],
+        })
+    return behaviors
+
+
+def synthetic_features(count: int, seed: int = 11) -> List[str]:
+    rng = random.Random(seed)
+    return [f"{rng.choice(FEATURE_PREFIXES)} {rng.choice(OBJECTS).split()[-1]} {index + 1}"
+            for index in range(count)]
+
+
+def write_corpus(output_dir: str, behaviors: List[Dict], features: List[str]) -> str:
+    """
+    Write <output_dir>/instances/behaviors/*.md and features.json; returns the behaviors dir.
+
+    A previous corpus is replaced only if CORPUS_MARKER shows this script
+    wrote it; raises ValueError rather than delete any other behaviors
+    directory (e.g. a real DUX-Governance checkout).
+    """
+    behaviors_dir = os.path.join(output_dir, "instances", "behaviors")
+    marker_path = os.path.join(output_dir, CORPUS_MARKER)
+    if os.path.isdir(behaviors_dir) and os.listdir(behaviors_dir):
+        if not os.path.isfile(marker_path):
+            raise ValueError(f"{behaviors_dir} exists and was not generated by this script; "
+                             f"choose a new or empty --output")
+        shutil.rmtree(behaviors_dir)
+    os.makedirs(behaviors_dir, exist_ok=True)
+    with open(marker_path, "w") as f:
+        f.write("Synthetic Behavior corpus written by scripts/generate_evidence_corpus.py\n")
+
+    for behavior in behaviors:
+        with open(os.path.join(behaviors_dir, f"{behavior['id']}.md"), "w") as f:
+            f.write(f"# {behavior['id']}\n\n{behavior['user_enablement']}\n\n")
+            f.write(f"```json\n{json.dumps(behavior, indent=2)}\n```\n")
+
+    with open(os.path.join(output_dir, "features.json"), "w") as f:
+        json.dump(features, f, indent=2)
+    return behaviors_dir
+
+
+def behavior_text(behavior: Dict) -> str:
+    return f"{behavior.get('user_enablement')} {behavior.get('id')}".lower()
+
+
+def linear_lookup(feature: str, behaviors: List[Dict]) -> Tuple[int, List[str]]:
+    """The matching as it was: a find() over every behavior per feature"""
+    normalized = feature.lower()
+    counted = next((b for b in behaviors
+                    if any(fk in normalized and bk in behavior_text(b) for fk, bk in FEATURE_BEHAVIOR_KEYWORDS)),
+                   None)
+    first_word = normalized.split(" ")[0]
+    linked = next((b for b in behaviors if first_word in behavior_text(b)), None)
+    return (len(counted["evidence"]) if counted else 0), (linked["evidence"] if linked else [])
+
+
+class EvidenceIndex:
+    """Python mirror of EvidenceIndex in app/lib/parseDuxObjects.ts"""
+
+    def __init__(self, behaviors: List[Dict]):
+        self.behaviors = behaviors
+        self.first_by_token: Dict[str, int] = {}
+        self.first_by_fragment: Dict[str, int] = {}
+        for position, behavior in enumerate(behaviors):
+            for token in re.split(r"\s+", behavior_text(behavior)):
+                self.first_by_token.setdefault(token, position)
+        self.keyword_matches = [self.first_containing(bk) for _, bk in FEATURE_BEHAVIOR_KEYWORDS]
+
+    def first_containing(self, fragment: str) -> int:
+        if fragment not in self.first_by_fragment:
+            self.first_by_fragment[fragment] = min(
+                (position for token, position in self.first_by_token.items() if fragment in token), default=-1)
+        return self.first_by_fragment[fragment]
+
+    def lookup(self, feature: str) -> Tuple[int, List[str]]:
+        normalized = feature.lower()
+        positions = [position for (fk, _), position in zip(FEATURE_BEHAVIOR_KEYWORDS, self.keyword_matches)
+                     if position != -1 and fk in normalized]
+        count = len(self.behaviors[min(positions)]["evidence"]) if positions else 0
+        linked = self.first_containing(normalized.split(" ")[0])
+        return count, (self.behaviors[linked]["evidence"] if linked != -1 else [])
+
+
+def benchmark(behaviors: List[Dict], features: List[str], rounds: int = 3) -> Dict:
+    """Seconds per full pass (best of rounds) for both strategies, plus agreement"""
+    linear_seconds = index_seconds = build_seconds = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        linear = [linear_lookup(feature, behaviors) for feature in features]
+        linear_seconds = min(linear_seconds, time.perf_counter() - started)
+
+        started = time.perf_counter()
+        index = EvidenceIndex(behaviors)
+        build_seconds = min(build_seconds, time.perf_counter() - started)
+        started = time.perf_counter()
+        indexed = [index.lookup(feature) for feature in features]
+        index_seconds = min(index_seconds, time.perf_counter() - started)
+
+    return {
+        "identical": linear == indexed,
+        "linear_seconds": linear_seconds,
+        "build_seconds": build_seconds,
+        "index_seconds": index_seconds,
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic Behavior corpus for evidence matching")
+    parser.add_argument("--behaviors", type=int, default=5000, help="Number of Behavior objects")
+    parser.add_argument("--features", type=int, default=500, help="Number of feature names to match")
+    parser.add_argument("--output", default="../reports/evidence-corpus",
+                        help="Corpus root, new or previously generated; point the features API's "
+                             "DUX-Governance path at it instead of a real checkout")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Time linear scan vs token index on the corpus")
+    parser.add_argument("--no-write", action="store_true", help="Benchmark in memory without writing files")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    behaviors = synthetic_behaviors(args.behaviors)
+    features = synthetic_features(args.features)
+
+    if not args.no_write:
+        try:
+            behaviors_dir = write_corpus(args.output, behaviors, features)
+        except ValueError as error:
+            print(f"❌ {error}")
+            raise SystemExit(1)
+        print(f"✅ Generated {len(behaviors)} behaviors and {len(features)} feature names")
+        print(f"📁 Output: {behaviors_dir}")
+
+    if args.benchmark:
+        result = benchmark(behaviors, features)
+        print(f"{'✅' if result['identical'] else '❌'} linear scan vs token index: "
+              f"{'identical' if result['identical'] else 'MISMATCH'}")
+        print(f"⏱️  Linear scan: {result['linear_seconds'] * 1000:.1f}ms for {len(features)} features")
+        print(f"⏱️  Token index: {result['build_seconds'] * 1000:.1f}ms build + "
+              f"{result['index_seconds'] * 1000:.1f}ms lookups "
+              f"({result['linear_seconds'] / max(result['build_seconds'] + result['index_seconds'], 1e-9):.1f}x)")
+        raise SystemExit(0 if result["identical"] else 1)
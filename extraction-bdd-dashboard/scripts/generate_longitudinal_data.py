@@ -4,10 +4,43 @@ Generate synthetic longitudinal BDD roadmap data for Discrete Connection
 Simulates 24-week development timeline across 4 phases
 """
 
+import argparse
+import hashlib
 import json
 import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List
+from itertools import chain
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for the vectorized engine
+    np = None
+
+# Generation engines: "scalar" walks every (feature, week) pair one call at a
+# time; "vectorized" computes all pairs as NumPy matrices in one batched pass
+ENGINES = ("scalar", "vectorized")
+
+# Output formats: "json" is the single document the dashboard fetches,
+# "jsonl" is a header line followed by one snapshot per line
+OUTPUT_FORMATS = ("json", "jsonl")
+
+# Weeks computed per batch by the vectorized engine while streaming, so
+# matrix memory stays bounded for arbitrarily long histories
+CHUNK_WEEKS = 52
+
+# Bump whenever s_curve, evidence_count, scenario_status or the pipeline/journey
+# formulas change, so incremental runs know stored snapshots are stale
+GENERATOR_VERSION = 1
+
+# Spare bytes reserved after the JSONL header line, so an incremental run
+# can rewrite total_weeks/generated_at in place instead of the whole file
+JSONL_HEADER_PADDING = 64
+
+DEFAULT_PROJECT = "Discrete Connection - BDD Roadmap Progression"
 
 
 def s_curve(week: int, start_week: int, duration: int) -> float:
@@ -71,22 +104,36 @@ FEATURE_SCHEDULE = {
 }
 
 
-def generate_feature_snapshot(feature_id: str, week: int) -> Dict:
+def synthetic_schedule(num_features: int, weeks: int) -> Dict:
+    """
+    Build a deterministic schedule of num_features features spread across
+    the given horizon, for capacity-planning runs beyond the 6 real features
+    """
+    window = max(1, weeks - 4)
+    schedule = {}
+    for i in range(num_features):
+        schedule[f"feature_{i:05d}"] = {
+            "start": 1 + (i * 7) % window,
+            "duration": 4 + i % 5,
+            "max_evidence": 12 + i % 3,
+            "scenarios": 3 + i % 4,
+        }
+    return schedule
+
+
+def generate_feature_snapshot(feature_id: str, week: int, schedule: Optional[Dict] = None) -> Dict:
     """Generate a single feature's state at a given week"""
-    schedule = FEATURE_SCHEDULE[feature_id]
+    schedule = (schedule or FEATURE_SCHEDULE)[feature_id]
     progress = s_curve(week, schedule["start"], schedule["duration"])
     evidence = evidence_count(progress, schedule["max_evidence"])
 
     # Determine overall status
     if progress == 0:
         status = "not_started"
-        in_progress = False
     elif progress < 100:
         status = "in_progress"
-        in_progress = True
     else:
         status = "completed"
-        in_progress = False
 
     # Calculate passing scenarios
     passing_scenarios = 0
@@ -95,15 +142,23 @@ def generate_feature_snapshot(feature_id: str, week: int) -> Dict:
         if scenario_state["passed"]:
             passing_scenarios += 1
 
+    return build_feature_snapshot(
+        feature_id, status, progress, evidence, passing_scenarios, schedule["scenarios"]
+    )
+
+
+def build_feature_snapshot(feature_id: str, status: str, progress: float, evidence: Optional[int],
+                           passing_scenarios: int, total_scenarios: int) -> Dict:
+    """Materialize one feature's snapshot dict (shared by both engines; evidence None when unknown)"""
     return {
         "id": feature_id,
         "status": status,
         "overall_progress": progress,
         "evidenceCount": evidence,
         "passedScenarios": passing_scenarios,
-        "totalScenarios": schedule["scenarios"],
+        "totalScenarios": total_scenarios,
         "passing": progress == 100,
-        "inProgress": in_progress
+        "inProgress": status == "in_progress"
     }
 
 
@@ -166,14 +221,25 @@ def calculate_journey_phase(week: int) -> Dict:
         }
 
 
-def generate_week_snapshot(week: int) -> Dict:
+def generate_week_snapshot(week: int, schedule: Optional[Dict] = None) -> Dict:
     """Generate complete system snapshot for a given week"""
+    schedule = schedule or FEATURE_SCHEDULE
 
     features = []
-    for feature_id in FEATURE_SCHEDULE.keys():
-        features.append(generate_feature_snapshot(feature_id, week))
+    for feature_id in schedule.keys():
+        features.append(generate_feature_snapshot(feature_id, week, schedule))
+
+    return build_week_snapshot(week, features)
 
-    pipeline = calculate_pipeline_metrics(week)
+
+def build_week_snapshot(week: int, features: List[Dict], pipeline: Optional[Dict] = None,
+                        timestamp: Optional[datetime] = None) -> Dict:
+    """
+    Assemble a week snapshot around already-computed feature states.
+    pipeline and timestamp default to the synthetic model; measured
+    history (ingest_behave_results.py) passes its own.
+    """
+    pipeline = pipeline or calculate_pipeline_metrics(week)
     journey = calculate_journey_phase(week)
 
     # Calculate overall completion
@@ -182,7 +248,7 @@ def generate_week_snapshot(week: int) -> Dict:
 
     # Time calculations
     start_date = datetime(2025, 1, 6)
-    current_date = start_date + timedelta(weeks=week)
+    current_date = timestamp or start_date + timedelta(weeks=week)
     elapsed_minutes = week * 7 * 24 * 60  # Total minutes elapsed
 
     return {
@@ -203,18 +269,142 @@ def generate_week_snapshot(week: int) -> Dict:
     }
 
 
-def generate_longitudinal_dataset(weeks: int = 24) -> Dict:
-    """Generate complete 24-week dataset"""
+def _tabulate(func: Callable, a, b):
+    """
+    Evaluate a scalar function of two arguments over matching arrays.
 
-    snapshots = []
-    for week in range(1, weeks + 1):
-        snapshots.append(generate_week_snapshot(week))
+    The function runs once per distinct (a, b) value pair and the results are
+    scattered back by index, so the output is bit-identical to calling it
+    per element while costing O(unique values) Python calls instead of O(cells).
+    """
+    a_values, a_index = np.unique(a, return_inverse=True)
+    b_values, b_index = np.unique(b, return_inverse=True)
+    table = np.array([[func(x, y) for y in b_values.tolist()] for x in a_values.tolist()])
+    return table[a_index.reshape(np.shape(a)), b_index.reshape(np.shape(b))]
+
+
+def compute_feature_matrices(weeks: int, schedule: Optional[Dict] = None, first_week: int = 1) -> Dict:
+    """
+    Compute progress, evidence and passing-scenario matrices for every
+    (week, feature) pair in one batched pass.
+
+    Rows are weeks first_week..weeks, columns follow the schedule's key order.
+    Uses the same scalar formulas as the per-call path (via _tabulate) and
+    IEEE-identical array arithmetic for the scenario thresholds.
+    """
+    if np is None:
+        raise RuntimeError("The vectorized engine requires numpy (pip install numpy)")
+
+    schedule = schedule or FEATURE_SCHEDULE
+    entries = list(schedule.values())
+    starts = np.array([e["start"] for e in entries], dtype=np.int64)
+    durations = np.array([e["duration"] for e in entries], dtype=np.int64)
+    max_evidence = np.array([e["max_evidence"] for e in entries], dtype=np.int64)
+    scenarios = np.array([e["scenarios"] for e in entries], dtype=np.int64)
+
+    week_numbers = np.arange(first_week, weeks + 1, dtype=np.int64)[:, None]
+    shape = (len(week_numbers), len(entries))
+
+    # s_curve only depends on the offset into the window and its length;
+    # clipping to [-1, duration] keeps the number of distinct keys small
+    offsets = np.clip(week_numbers - starts[None, :], -1, durations[None, :])
+    progress = _tabulate(
+        lambda offset, duration: s_curve(offset, 0, duration),
+        offsets, np.broadcast_to(durations, shape)
+    ).astype(np.float64)
+
+    evidence = _tabulate(
+        evidence_count, progress, np.broadcast_to(max_evidence, shape)
+    ).astype(np.int64)
+
+    # Scenario i passes once progress reaches ((i + 1) / total) * 100
+    passed = np.zeros(shape, dtype=np.int64)
+    for i in range(int(scenarios.max(initial=0))):
+        threshold = ((i + 1) / scenarios) * 100
+        passed += (progress >= threshold[None, :]) & (i < scenarios)[None, :]
 
     return {
-        "project": "Discrete Connection - BDD Roadmap Progression",
+        "weeks": week_numbers[:, 0].tolist(),
+        "feature_ids": list(schedule.keys()),
+        "progress": progress,
+        "evidence": evidence,
+        "passed_scenarios": passed,
+        "total_scenarios": scenarios,
+    }
+
+
+def iter_snapshots_from_matrices(matrices: Dict) -> Iterator[Dict]:
+    """Materialize week snapshot dicts from compute_feature_matrices output"""
+    feature_ids = matrices["feature_ids"]
+    total_scenarios = matrices["total_scenarios"].tolist()
+
+    rows = zip(
+        matrices["weeks"],
+        matrices["progress"].tolist(),
+        matrices["evidence"].tolist(),
+        matrices["passed_scenarios"].tolist(),
+    )
+    for week, progress_row, evidence_row, passed_row in rows:
+        features = []
+        for feature_id, progress, evidence, passed, total in zip(
+                feature_ids, progress_row, evidence_row, passed_row, total_scenarios):
+            if progress == 0:
+                status = "not_started"
+            elif progress < 100:
+                status = "in_progress"
+            else:
+                status = "completed"
+            features.append(build_feature_snapshot(feature_id, status, progress, evidence, passed, total))
+        yield build_week_snapshot(week, features)
+
+
+def iter_week_snapshots(weeks: int = 24, engine: str = "scalar", schedule: Optional[Dict] = None,
+                        first_week: int = 1) -> Iterator[Dict]:
+    """
+    Lazily yield week snapshots first_week..weeks.
+
+    Only one snapshot (scalar) or one CHUNK_WEEKS batch of matrices
+    (vectorized) is alive at a time, so memory does not grow with history.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine: {engine}. Valid engines are: {', '.join(ENGINES)}")
+    schedule = schedule or FEATURE_SCHEDULE
+
+    if engine == "vectorized":
+        return (
+            snapshot
+            for chunk_start in range(first_week, weeks + 1, CHUNK_WEEKS)
+            for snapshot in iter_snapshots_from_matrices(compute_feature_matrices(
+                min(weeks, chunk_start + CHUNK_WEEKS - 1), schedule, chunk_start))
+        )
+    return (generate_week_snapshot(week, schedule) for week in range(first_week, weeks + 1))
+
+
+def _digest(value) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def generator_fingerprint(schedule: Optional[Dict] = None) -> Dict:
+    """
+    Hashes identifying the inputs that produced a dataset: the generator
+    version, the whole schedule, and each feature's schedule entry
+    """
+    schedule = schedule or FEATURE_SCHEDULE
+    return {
+        "version": GENERATOR_VERSION,
+        "schedule_hash": _digest(schedule),
+        "feature_hashes": {feature_id: _digest(entry) for feature_id, entry in schedule.items()},
+    }
+
+
+def dataset_header(weeks: int, schedule: Optional[Dict] = None, project: str = DEFAULT_PROJECT) -> Dict:
+    """Top-level dataset fields, with an empty snapshot list in its usual position"""
+    schedule = schedule or FEATURE_SCHEDULE
+    return {
+        "project": project,
         "generated_at": datetime.utcnow().isoformat() + "Z",
         "total_weeks": weeks,
-        "snapshots": snapshots,
+        "snapshots": [],
         "metadata": {
             "phases": [
                 {"name": "Phase 1: Foundation", "weeks": "1-8"},
@@ -222,28 +412,449 @@ def generate_longitudinal_dataset(weeks: int = 24) -> Dict:
                 {"name": "Phase 3: GitOps & Multi-Cloud", "weeks": "12-16"},
                 {"name": "Phase 4: Enterprise", "weeks": "16-24"}
             ],
-            "features": list(FEATURE_SCHEDULE.keys())
+            "features": list(schedule.keys()),
+            "generator": generator_fingerprint(schedule)
         }
     }
 
 
+def generate_longitudinal_dataset(weeks: int = 24, engine: str = "scalar",
+                                  schedule: Optional[Dict] = None) -> Dict:
+    """Generate complete 24-week dataset"""
+    dataset = dataset_header(weeks, schedule)
+    dataset["snapshots"] = list(iter_week_snapshots(weeks, engine, schedule))
+    return dataset
+
+
+def write_json_stream(f: TextIO, header: Dict, snapshots: Iterable[Dict],
+                      indent: Optional[int] = 2, compact: bool = False) -> Optional[Dict]:
+    """
+    Stream header + snapshots to f as one JSON document.
+
+    Output is byte-identical to json.dump of the assembled dataset with the
+    same indent/separators, but only one snapshot is serialized at a time.
+    Fields after "snapshots" (metadata) are serialized once the snapshots
+    are exhausted, so producers may fill them in while streaming.
+    Returns the last snapshot written (None if there were none).
+    """
+    separators = (",", ":") if compact else None
+    if compact:
+        indent = None
+
+    marker = json.dumps("__snapshots__")
+
+    def split_skeleton():
+        skeleton = dict(header, snapshots=["__snapshots__"])
+        return json.dumps(skeleton, indent=indent, separators=separators).split(marker)
+
+    head, _ = split_skeleton()
+
+    item_separator = (separators or ((", ", ": ") if indent is None else (",", ": ")))[0]
+    prefix = ""
+    if indent is not None:
+        prefix = head.rsplit("\n", 1)[1]
+        item_separator += "\n" + prefix
+
+    last = None
+    for snapshot in snapshots:
+        text = json.dumps(snapshot, indent=indent, separators=separators)
+        if prefix:
+            text = text.replace("\n", "\n" + prefix)
+        f.write(head if last is None else item_separator)
+        f.write(text)
+        last = snapshot
+
+    if last is None:
+        json.dump(header, f, indent=indent, separators=separators)
+    else:
+        f.write(split_skeleton()[1])
+    return last
+
+
+def write_jsonl_stream(f: TextIO, header: Dict, snapshots: Iterable[Dict]) -> Optional[Dict]:
+    """
+    Stream header + snapshots to f as JSON Lines: the header (without its
+    snapshot list) on the first line, then one snapshot per line.
+    Returns the last snapshot written (None if there were none).
+    """
+    f.write(_jsonl_header_line(header) + "\n")
+
+    last = None
+    for snapshot in snapshots:
+        f.write(json.dumps(snapshot, separators=(",", ":")) + "\n")
+        last = snapshot
+    return last
+
+
+def _jsonl_header_line(header: Dict, width: Optional[int] = None) -> str:
+    """Serialize the JSONL header, padded with spaces to width (or the default reserve)"""
+    header = {key: value for key, value in header.items() if key != "snapshots"}
+    line = json.dumps(header, separators=(",", ":"))
+    return line.ljust(len(line) + JSONL_HEADER_PADDING if width is None else width)
+
+
+def read_jsonl_header(path: str) -> Dict:
+    """Read the header line of a JSONL dataset"""
+    with open(path) as f:
+        return json.loads(f.readline())
+
+
+def iter_jsonl_snapshots(path: str) -> Iterator[Dict]:
+    """Lazily yield the snapshots of a JSONL dataset, one line at a time"""
+    with open(path) as f:
+        f.readline()
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def write_dataset(output_path: str, weeks: int, engine: str = "scalar", schedule: Optional[Dict] = None,
+                  fmt: str = "json", compact: bool = False, columnar_path: Optional[str] = None) -> Optional[Dict]:
+    """
+    Generate and stream a dataset straight to disk in constant memory.
+
+    Writes to a temporary sibling and renames it into place, so the
+    dashboard never fetches a half-written file. When columnar_path is set,
+    the same snapshots are also written in the roadmap_columnar binary
+    layout during the single generation pass. Returns the final snapshot.
+    """
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown format: {fmt}. Valid formats are: {', '.join(OUTPUT_FORMATS)}")
+
+    header = dataset_header(weeks, schedule)
+    snapshots = iter_week_snapshots(weeks, engine, schedule)
+    columnar = None
+    if columnar_path:
+        from roadmap_columnar import ColumnarWriter
+        columnar = ColumnarWriter(columnar_path, header)
+        snapshots = columnar.tee(snapshots)
+
+    last = write_dataset_file(output_path, header, snapshots, fmt, compact)
+    if columnar:
+        columnar.close()
+
+    return last
+
+
+def write_dataset_file(output_path: str, header: Dict, snapshots: Iterable[Dict],
+                       fmt: str = "json", compact: bool = False) -> Optional[Dict]:
+    """Stream a dataset to a temporary sibling and rename it over output_path"""
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, 'w') as f:
+        if fmt == "jsonl":
+            last = write_jsonl_stream(f, header, snapshots)
+        else:
+            last = write_json_stream(f, header, snapshots, compact=compact)
+    os.replace(tmp_path, output_path)
+    return last
+
+
+def _patch_snapshot(snapshot: Dict, schedule: Dict, changed: set) -> Dict:
+    """Recompute only the changed features of a stored snapshot and re-aggregate it"""
+    week = snapshot["week"]
+    stored = {feature["id"]: feature for feature in snapshot["features"]}
+    features = [
+        generate_feature_snapshot(feature_id, week, schedule) if feature_id in changed else stored[feature_id]
+        for feature_id in schedule
+    ]
+    return build_week_snapshot(week, features)
+
+
+def update_dataset(output_path: str, weeks: int, engine: str = "scalar", schedule: Optional[Dict] = None,
+                   fmt: str = "json", compact: bool = False) -> Dict:
+    """
+    Bring an existing dataset up to `weeks` without regenerating history.
+
+    The stored generator fingerprint decides what can be reused:
+    - unchanged schedule: only weeks total_weeks+1..weeks are generated and
+      appended (JSONL: lines appended and the padded header rewritten in
+      place; JSON: stored snapshots are copied through without recompute)
+    - changed/added/removed features: stored snapshots are patched by
+      recomputing just those features, then new weeks are appended
+    - missing file, version change or shrinking history: full regeneration
+
+    Returns {"mode", "appended_weeks", "recomputed_features", "last"}.
+    """
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown format: {fmt}. Valid formats are: {', '.join(OUTPUT_FORMATS)}")
+    schedule = schedule or FEATURE_SCHEDULE
+
+    def full():
+        last = write_dataset(output_path, weeks, engine, schedule, fmt, compact)
+        return {"mode": "full", "appended_weeks": weeks, "recomputed_features": list(schedule), "last": last}
+
+    if not os.path.exists(output_path):
+        return full()
+
+    if fmt == "jsonl":
+        stored_header = read_jsonl_header(output_path)
+        stored_snapshots = None
+    else:
+        # A single JSON document has no random access; it is parsed once here
+        with open(output_path) as f:
+            stored_header = json.load(f)
+        stored_snapshots = stored_header.pop("snapshots", [])
+
+    stored_fingerprint = stored_header.get("metadata", {}).get("generator")
+    stored_weeks = stored_header.get("total_weeks", 0)
+    if (not stored_fingerprint or stored_fingerprint.get("version") != GENERATOR_VERSION
+            or weeks < stored_weeks):
+        return full()
+
+    fingerprint = generator_fingerprint(schedule)
+    stored_hashes = stored_fingerprint.get("feature_hashes", {})
+    changed = {feature_id for feature_id, digest in fingerprint["feature_hashes"].items()
+               if stored_hashes.get(feature_id) != digest}
+    schedule_changed = fingerprint["schedule_hash"] != stored_fingerprint.get("schedule_hash")
+
+    header = dataset_header(weeks, schedule)
+    new_snapshots = iter_week_snapshots(weeks, engine, schedule, first_week=stored_weeks + 1)
+    result = {
+        "mode": "patch" if schedule_changed else "append",
+        "appended_weeks": weeks - stored_weeks,
+        "recomputed_features": sorted(changed),
+        "last": None,
+    }
+
+    if fmt == "jsonl" and not schedule_changed:
+        with open(output_path, "r+") as f:
+            width = len(f.readline().rstrip("\n"))
+            header_line = _jsonl_header_line(header)
+            if len(header_line.rstrip()) > width:
+                stored_snapshots = iter_jsonl_snapshots(output_path)
+            else:
+                f.seek(0, os.SEEK_END)
+                for snapshot in new_snapshots:
+                    f.write(json.dumps(snapshot, separators=(",", ":")) + "\n")
+                    result["last"] = snapshot
+                f.seek(0)
+                f.write(_jsonl_header_line(header, width))
+                return result
+
+    if stored_snapshots is None:
+        stored_snapshots = iter_jsonl_snapshots(output_path)
+    if schedule_changed:
+        stored_snapshots = (_patch_snapshot(snapshot, schedule, changed) for snapshot in stored_snapshots)
+
+    last = write_dataset_file(output_path, header, chain(stored_snapshots, new_snapshots), fmt, compact)
+    result["last"] = last
+    return result
+
+
+def load_project_schedules(projects_dir: str) -> List[Dict]:
+    """
+    Load per-project schedule files (*.json) from projects_dir.
+
+    Each file is either {"project": name, "weeks": n, "schedule": {...}} or a
+    bare FEATURE_SCHEDULE-shaped dict; the file stem becomes the project ID.
+    """
+    projects = []
+    for file_name in sorted(os.listdir(projects_dir)):
+        if not file_name.endswith(".json"):
+            continue
+        with open(os.path.join(projects_dir, file_name)) as f:
+            data = json.load(f)
+        project_id = os.path.splitext(file_name)[0]
+        if "schedule" not in data:
+            data = {"schedule": data}
+        projects.append({
+            "id": project_id,
+            "project": data.get("project", project_id),
+            "weeks": data.get("weeks"),
+            "schedule": data["schedule"],
+        })
+    return projects
+
+
+def generate_project(task: Tuple[Dict, str, int, str, str, bool]) -> Dict:
+    """
+    Generate one project's dataset (runs in a worker process).
+    Returns its output path, CPU seconds and a per-week summary for the
+    portfolio roll-up.
+    """
+    project, output_dir, weeks, engine, fmt, compact = task
+    started = time.process_time()
+    weeks = project["weeks"] or weeks
+    output_path = os.path.join(output_dir, f"{project['id']}.{fmt}")
+
+    summary = []
+
+    def summarize(snapshots: Iterable[Dict]) -> Iterator[Dict]:
+        for snapshot in snapshots:
+            summary.append({
+                "overall_completion": snapshot["overall_completion"],
+                "success_rate": snapshot["pipeline_metrics"]["success_rate"],
+                "features_operational": snapshot["demo_readiness"]["features_operational"],
+                "total_features": snapshot["demo_readiness"]["total_features"],
+            })
+            yield snapshot
+
+    header = dataset_header(weeks, project["schedule"], project["project"])
+    snapshots = iter_week_snapshots(weeks, engine, project["schedule"])
+    write_dataset_file(output_path, header, summarize(snapshots), fmt, compact)
+
+    return {
+        "id": project["id"],
+        "project": project["project"],
+        "output": output_path,
+        "seconds": time.process_time() - started,
+        "weeks": summary,
+    }
+
+
+def build_portfolio(results: List[Dict]) -> Dict:
+    """Roll per-project week summaries up into one portfolio dataset"""
+    total_weeks = max((len(result["weeks"]) for result in results), default=0)
+    snapshots = []
+    for week in range(1, total_weeks + 1):
+        projects = {result["id"]: result["weeks"][week - 1]
+                    for result in results if week <= len(result["weeks"])}
+        total_features = sum(p["total_features"] for p in projects.values())
+        weighted = sum(p["overall_completion"] * p["total_features"] for p in projects.values())
+        snapshots.append({
+            "week": week,
+            "projects": projects,
+            "overall_completion": round(weighted / total_features, 1) if total_features else 0.0,
+            "features_operational": sum(p["features_operational"] for p in projects.values()),
+            "total_features": total_features,
+        })
+
+    return {
+        "project": "Portfolio - BDD Roadmap Progression",
+        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "total_weeks": total_weeks,
+        "snapshots": snapshots,
+        "metadata": {
+            "projects": [{"id": r["id"], "project": r["project"], "output": r["output"]} for r in results]
+        }
+    }
+
+
+def generate_projects(projects_dir: str, output_dir: str, weeks: int = 24, engine: str = "scalar",
+                      fmt: str = "json", compact: bool = False, jobs: Optional[int] = None,
+                      portfolio_path: Optional[str] = None) -> Dict:
+    """
+    Generate every project in projects_dir across a process pool, writing
+    one dataset per project plus an aggregated portfolio file.
+
+    Returns the per-project results with wall-clock time and the speedup
+    over a serial run, estimated as the summed per-project CPU time (what
+    running them one after another would cost; wall time per worker would
+    overcount when workers share cores).
+    """
+    projects = load_project_schedules(projects_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    tasks = [(project, output_dir, weeks, engine, fmt, compact) for project in projects]
+
+    started = time.perf_counter()
+    if jobs == 1:
+        results = list(map(generate_project, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(generate_project, tasks))
+    wall_seconds = time.perf_counter() - started
+
+    portfolio_path = portfolio_path or os.path.join(output_dir, "portfolio.json")
+    portfolio = build_portfolio(results)
+    write_dataset_file(portfolio_path, portfolio, iter(portfolio.pop("snapshots")), "json", compact)
+
+    serial_seconds = sum(result["seconds"] for result in results)
+    return {
+        "results": results,
+        "portfolio": portfolio_path,
+        "wall_seconds": wall_seconds,
+        "serial_seconds": serial_seconds,
+        "speedup": serial_seconds / wall_seconds if wall_seconds > 0 else 0.0,
+    }
+
+
+def engines_agree(weeks: int = 24, schedule: Optional[Dict] = None) -> bool:
+    """Check that the scalar and vectorized engines produce identical snapshots"""
+    scalar = generate_longitudinal_dataset(weeks, "scalar", schedule)
+    vectorized = generate_longitudinal_dataset(weeks, "vectorized", schedule)
+    return scalar["snapshots"] == vectorized["snapshots"]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate longitudinal BDD roadmap data")
+    parser.add_argument("--weeks", type=int, default=24, help="Number of weekly snapshots")
+    parser.add_argument("--engine", choices=ENGINES, default="scalar",
+                        help="scalar (per-call) or vectorized (NumPy batched) generation")
+    parser.add_argument("--features", type=int, default=None,
+                        help="Simulate N synthetic features instead of FEATURE_SCHEDULE")
+    parser.add_argument("--check-engines", action="store_true",
+                        help="Verify both engines produce identical snapshots, then exit")
+    parser.add_argument("--output", default="../public/bdd-data/longitudinal-roadmap.json",
+                        help="Output path for the dataset")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="json",
+                        help="json (single document) or jsonl (header line + one snapshot per line)")
+    parser.add_argument("--compact", action="store_true",
+                        help="Skip pretty-printing (json format only)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Append only new weeks to an existing output, recomputing changed features")
+    parser.add_argument("--projects", default=None,
+                        help="Directory of per-project schedule files; generates one dataset per project")
+    parser.add_argument("--output-dir", default="../public/bdd-data/projects",
+                        help="Output directory for --projects datasets and portfolio.json")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Worker processes for --projects (default: CPU count, 1 = serial)")
+    parser.add_argument("--columnar", nargs="?", const="../public/bdd-data/longitudinal-roadmap.bin",
+                        default=None, help="Also write the columnar binary layout (see roadmap_columnar.py)")
+    args = parser.parse_args(argv)
+    if args.incremental and args.columnar:
+        parser.error("--columnar cannot be combined with --incremental (the binary layout is fixed-size)")
+    if args.projects and (args.incremental or args.columnar or args.features):
+        parser.error("--projects cannot be combined with --incremental, --columnar or --features")
+    return args
+
+
 if __name__ == "__main__":
-    dataset = generate_longitudinal_dataset(24)
+    args = parse_args()
+    schedule = synthetic_schedule(args.features, args.weeks) if args.features else FEATURE_SCHEDULE
+
+    if args.check_engines:
+        agree = engines_agree(args.weeks, schedule)
+        print(f"{'✅' if agree else '❌'} scalar vs vectorized: "
+              f"{'identical' if agree else 'MISMATCH'} ({len(schedule)} features × {args.weeks} weeks)")
+        raise SystemExit(0 if agree else 1)
+
+    if args.projects:
+        run = generate_projects(args.projects, args.output_dir, args.weeks, args.engine, args.format,
+                                args.compact, args.jobs)
+        print(f"✅ Generated {len(run['results'])} project datasets ({args.engine} engine)")
+        for result in run["results"]:
+            print(f"   {result['id']}: {result['output']} ({result['seconds']:.2f}s CPU)")
+        print(f"📁 Portfolio: {run['portfolio']}")
+        print(f"⏱️  Wall clock: {run['wall_seconds']:.2f}s vs serial {run['serial_seconds']:.2f}s "
+              f"({run['speedup']:.1f}x speedup)")
+        raise SystemExit(0)
 
     # Write to public directory for dashboard
-    output_path = "../public/bdd-data/longitudinal-roadmap.json"
+    output_path = args.output
+    if args.incremental:
+        update = update_dataset(output_path, args.weeks, args.engine, schedule, args.format, args.compact)
+        final_week = update["last"]
+        print(f"✅ Updated {args.weeks}-week longitudinal dataset ({update['mode']}, {args.engine} engine)")
+        print(f"➕ Weeks generated: {update['appended_weeks']}")
+        if update["mode"] == "patch":
+            print(f"🔁 Features recomputed: {len(update['recomputed_features'])}")
+    else:
+        final_week = write_dataset(output_path, args.weeks, args.engine, schedule, args.format, args.compact,
+                                   args.columnar)
+        print(f"✅ Generated {args.weeks}-week longitudinal dataset ({args.engine} engine)")
 
-    with open(output_path, 'w') as f:
-        json.dump(dataset, f, indent=2)
+    print(f"📊 Total snapshots: {args.weeks}")
+    print(f"📁 Output: {output_path} ({args.format}{', compact' if args.compact else ''})")
+    if args.columnar:
+        print(f"🗄️  Columnar: {args.columnar}")
 
-    print(f"✅ Generated 24-week longitudinal dataset")
-    print(f"📊 Total snapshots: {len(dataset['snapshots'])}")
-    print(f"📁 Output: {output_path}")
+    if final_week is None:
+        raise SystemExit(0)
 
     # Print summary statistics
-    final_week = dataset['snapshots'][-1]
-    print(f"\n📈 Final State (Week 24):")
+    print(f"\n📈 Final State (Week {args.weeks}):")
     print(f"   Overall Completion: {final_week['overall_completion']}%")
     print(f"   Success Rate: {final_week['pipeline_metrics']['success_rate']}%")
-    print(f"   Features Complete: {final_week['demo_readiness']['features_operational']}/6")
+    print(f"   Features Complete: {final_week['demo_readiness']['features_operational']}/"
+          f"{final_week['demo_readiness']['total_features']}")
     print(f"   Phase: {final_week['phase']}")
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Ingest archived behave JSON reports into longitudinal roadmap snapshots
+Replaces the synthetic pipeline_metrics curves with measured history
+
+Each report (the public/bdd-data/behave-results.json format) is summarized
+in a worker process with a streaming parser that holds at most one feature
+in memory. Summaries are folded into weekly snapshots in report-time order
+and streamed to disk in the schema the roadmap timeline consumes.
+
+Reports carry no evidence history, so every feature's evidenceCount is
+null. Weeks are numbered from the first week with a readable report. The
+output defaults to longitudinal-roadmap.measured.json, next to the
+generated dataset rather than over it.
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO
+
+from generate_longitudinal_data import build_feature_snapshot, build_week_snapshot, write_dataset_file
+
+# Characters read per refill of the streaming parser's buffer
+CHUNK_SIZE = 64 * 1024
+
+# Step statuses that mean the step actually ran
+EXECUTED_STATUSES = ("passed", "failed", "error")
+
+NUMBER_END = re.compile(r"[,\]\s]")
+
+
+def iter_json_array(f: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator:
+    """
+    Lazily yield the elements of a top-level JSON array.
+
+    Only the unconsumed tail of the input plus the element being decoded is
+    buffered, so memory is bounded by the largest element (one behave
+    feature), not the report size.
+    """
+    decoder = json.JSONDecoder()
+    buffer, pos, eof = "", 0, False
+
+    def more() -> bool:
+        nonlocal buffer, pos, eof
+        # Read at least as much as is already buffered so a large element
+        # is re-scanned O(log n) times rather than once per chunk
+        chunk = f.read(max(chunk_size, len(buffer) - pos))
+        if not chunk:
+            eof = True
+            return False
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        return True
+
+    def peek() -> str:
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if not more():
+                return ""
+
+    if peek() != "[":
+        raise ValueError("Expected a JSON array")
+    pos += 1
+    if peek() == "]":
+        return
+
+    while True:
+        # A number cut off mid-buffer ("2." of "2.5") would still decode, so
+        # buffer up to its delimiter first; other values fail loudly if cut
+        if peek() in "-0123456789":
+            while not NUMBER_END.search(buffer, pos) and more():
+                pass
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof or not more():
+                    raise
+                continue
+            break
+        pos = end
+        yield item
+
+        separator = peek()
+        if separator == ",":
+            pos += 1
+        elif separator == "]":
+            return
+        else:
+            raise ValueError(f"Unexpected {separator!r} in JSON array")
+
+
+def feature_id(name: str) -> str:
+    """Feature ID as derived by /api/bdd/features"""
+    return re.sub(r"\s+", "_", name.lower())
+
+
+def summarize_report(path: str) -> Dict:
+    """
+    Reduce one behave report to status counts, step durations and
+    per-feature scenario/step counts. Runs in a worker process.
+    """
+    summary = {
+        "path": path,
+        "mtime": os.path.getmtime(path),
+        "features": {},
+        "feature_counts": Counter(),
+        "scenario_counts": Counter(),
+        "step_counts": Counter(),
+        "duration_total": 0.0,
+        "duration_count": 0,
+        "duration_max": 0.0,
+    }
+
+    try:
+        with open(path) as f:
+            for feature in iter_json_array(f):
+                summary["feature_counts"][feature.get("status", "untested")] += 1
+                state = {"name": feature.get("name", ""), "passed": 0, "total": 0, "steps": Counter()}
+
+                for element in feature.get("elements") or []:
+                    if element.get("type") != "scenario":
+                        continue
+                    state["total"] += 1
+                    if element.get("status") == "passed":
+                        state["passed"] += 1
+                    summary["scenario_counts"][element.get("status", "untested")] += 1
+
+                    for step in element.get("steps") or []:
+                        result = step.get("result") or {}
+                        status = result.get("status", "untested")
+                        state["steps"][status] += 1
+                        summary["step_counts"][status] += 1
+                        duration = result.get("duration") or 0.0
+                        if status in EXECUTED_STATUSES:
+                            summary["duration_total"] += duration
+                            summary["duration_count"] += 1
+                            summary["duration_max"] = max(summary["duration_max"], duration)
+
+                summary["features"][feature_id(state["name"])] = state
+    except (OSError, ValueError) as error:
+        return {"path": path, "error": str(error)}
+
+    return summary
+
+
+def pipeline_metrics(step_counts: Counter) -> Dict:
+    """Measured equivalent of calculate_pipeline_metrics"""
+    total_steps = sum(step_counts.values())
+    defined_steps = total_steps - step_counts["undefined"]
+    implemented_steps = sum(step_counts[status] for status in EXECUTED_STATUSES)
+    passing_steps = step_counts["passed"]
+
+    if implemented_steps > 0:
+        success_rate = round((passing_steps / implemented_steps) * 100, 1)
+    else:
+        success_rate = 0.0
+
+    return {
+        "total_steps": total_steps,
+        "defined_steps": defined_steps,
+        "implemented_steps": implemented_steps,
+        "passing_steps": passing_steps,
+        "success_rate": success_rate,
+        "step_execution_rate": round((implemented_steps / total_steps) * 100, 1) if total_steps > 0 else 0
+    }
+
+
+def _feature_state_snapshot(feature_key: str, state: Dict) -> Dict:
+    passed, total = state["passed"], state["total"]
+    progress = round(passed / total * 100, 1) if total else 0.0
+    if progress == 0:
+        status = "not_started"
+    elif progress < 100:
+        status = "in_progress"
+    else:
+        status = "completed"
+    # Evidence is not in behave reports; null rather than a misleading 0
+    return build_feature_snapshot(feature_key, status, progress, None, passed, total)
+
+
+def week_start(timestamp: float) -> datetime:
+    """Midnight (UTC) of the Monday starting the week containing timestamp"""
+    day = datetime.utcfromtimestamp(timestamp).replace(hour=0, minute=0, second=0, microsecond=0)
+    return day - timedelta(days=day.weekday())
+
+
+def fold_weeks(summaries: Iterable[Dict], start: datetime, total_weeks: int,
+               feature_ids: List[str]) -> Iterator[Dict]:
+    """
+    Fold report summaries (in report-time order) into weekly snapshots.
+
+    Feature states carry forward from the latest report that mentioned
+    them; weeks without reports repeat the previous state with zero runs.
+    Weeks before the first report are dropped and the rest numbered from 1;
+    each snapshot's measured.week_start is the Monday its week begins.
+    feature_ids is filled in first-seen order as reports are consumed.
+    """
+    states: Dict[str, Dict] = {}
+    summaries = iter(summaries)
+    pending = next(summaries, None)
+    number = 0
+
+    for week in range(1, total_weeks + 1):
+        week_end = start + timedelta(weeks=week)
+        runs = Counter()
+        runs_timestamp = None
+        feature_counts, scenario_counts, step_counts = Counter(), Counter(), Counter()
+        duration_total, duration_count, duration_max = 0.0, 0, 0.0
+
+        while pending is not None and datetime.utcfromtimestamp(pending["mtime"]) < week_end:
+            for key, state in pending["features"].items():
+                if key not in states:
+                    feature_ids.append(key)
+                states[key] = state
+            runs["reports"] += 1
+            runs_timestamp = datetime.utcfromtimestamp(pending["mtime"])
+            feature_counts.update(pending["feature_counts"])
+            scenario_counts.update(pending["scenario_counts"])
+            step_counts.update(pending["step_counts"])
+            duration_total += pending["duration_total"]
+            duration_count += pending["duration_count"]
+            duration_max = max(duration_max, pending["duration_max"])
+            pending = next(summaries, None)
+
+        if not states:
+            continue
+        number += 1
+
+        features = [_feature_state_snapshot(key, states[key]) for key in feature_ids]
+        current_steps = Counter()
+        for key in feature_ids:
+            current_steps.update(states[key]["steps"])
+
+        snapshot = build_week_snapshot(number, features, pipeline_metrics(current_steps),
+                                       runs_timestamp or week_end)
+        snapshot["measured"] = {
+            "week_start": (week_end - timedelta(weeks=1)).isoformat() + "Z",
+            "reports": runs["reports"],
+            "feature_status_counts": dict(feature_counts),
+            "scenario_status_counts": dict(scenario_counts),
+            "step_status_counts": dict(step_counts),
+            "step_duration": {
+                "total_seconds": round(duration_total, 6),
+                "mean_seconds": round(duration_total / duration_count, 6) if duration_count else 0.0,
+                "max_seconds": round(duration_max, 6),
+            },
+        }
+        yield snapshot
+
+
+def iter_summaries(paths: List[str], jobs: Optional[int]) -> Iterator[Dict]:
+    """Summarize reports across a process pool, yielding in input order"""
+    if jobs == 1:
+        yield from map(summarize_report, paths)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        chunksize = max(1, len(paths) // ((jobs or os.cpu_count() or 1) * 8))
+        yield from executor.map(summarize_report, paths, chunksize=chunksize)
+
+
+def ingest_reports(report_dir: str, output_path: str, pattern: str = "*.json", jobs: Optional[int] = None,
+                   project: str = "Discrete Connection - BDD Roadmap Progression (measured)",
+                   compact: bool = False) -> Dict:
+    """
+    Ingest every report under report_dir matching pattern into output_path.
+    Returns counts of reports read/skipped and weeks written.
+    """
+    paths = sorted(glob.glob(os.path.join(report_dir, "**", pattern), recursive=True),
+                   key=os.path.getmtime)
+    stats = {"reports": len(paths), "skipped": [], "weeks": 0}
+    if not paths:
+        return stats
+
+    start = week_start(os.path.getmtime(paths[0]))
+    total_weeks = (datetime.utcfromtimestamp(os.path.getmtime(paths[-1])) - start).days // 7 + 1
+    feature_ids: List[str] = []
+
+    def readable(summaries: Iterable[Dict]) -> Iterator[Dict]:
+        for summary in summaries:
+            if "error" in summary:
+                stats["skipped"].append(summary["path"])
+            else:
+                yield summary
+
+    # total_weeks and metadata follow "snapshots" so they are written after
+    # the snapshots, once the weeks actually produced are known
+    header = {
+        "project": project,
+        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "snapshots": [],
+        "total_weeks": 0,
+        "metadata": {
+            "source": "behave-results",
+            "start_date": start.isoformat() + "Z",
+            "reports": len(paths),
+            "features": feature_ids,
+        },
+    }
+
+    def counted(snapshots: Iterable[Dict]) -> Iterator[Dict]:
+        for snapshot in snapshots:
+            if not stats["weeks"]:
+                header["metadata"]["start_date"] = snapshot["measured"]["week_start"]
+            stats["weeks"] += 1
+            header["total_weeks"] = stats["weeks"]
+            yield snapshot
+
+    snapshots = fold_weeks(readable(iter_summaries(paths, jobs)), start, total_weeks, feature_ids)
+    write_dataset_file(output_path, header, counted(snapshots), "json", compact)
+
+    return stats
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Ingest behave JSON reports into longitudinal snapshots")
+    parser.add_argument("report_dir", help="Directory of archived behave JSON reports (searched recursively)")
+    parser.add_argument("--pattern", default="*.json", help="Filename glob for reports")
+    parser.add_argument("--output", default="../public/bdd-data/longitudinal-roadmap.measured.json",
+                        help="Output path for the dataset (the generated longitudinal-roadmap.json is left alone)")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--compact", action="store_true", help="Skip pretty-printing")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    stats = ingest_reports(args.report_dir, args.output, args.pattern, args.jobs, compact=args.compact)
+
+    print(f"✅ Ingested {stats['reports'] - len(stats['skipped'])}/{stats['reports']} behave reports")
+    print(f"📊 Weekly snapshots: {stats['weeks']}")
+    print(f"📁 Output: {args.output}")
+    for path in stats["skipped"]:
+        print(f"⚠️  Skipped unreadable report: {path}")
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Reference implementation of mergeWithTestResults (lib/gherkinParser.ts)
+Merges parsed .feature files with behave JSON results through a dictionary index
+
+The index is built once per results load:
+    feature name -> scenario name -> (keyword, text) -> status
+with duplicate names matched by occurrence, Scenario Outline example rows
+grouped under their outline (worst status per step position) and
+Background steps behave copies into every scenario dropped.
+
+Also generates synthetic fixtures (parsed features + behave results) and
+benchmarks the index against the nested find() scans it replaced.
+
+Usage:
+    python merge_behave_results.py generate --steps 100000 --output-dir ../reports/merge-fixture
+    python merge_behave_results.py benchmark --steps 100000
+    python merge_behave_results.py merge parsed-features.json behave-results.json --output merged.json
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Most severe first; an outline takes the worst status of its rows
+STATUS_SEVERITY = ("failed", "error", "undefined", "pending", "skipped", "passed")
+ROLL_UP_ORDER = ("failed", "undefined", "pending", "skipped")
+
+
+def severity(status: str) -> int:
+    return STATUS_SEVERITY.index(status) if status in STATUS_SEVERITY else len(STATUS_SEVERITY)
+
+
+def worst_status(statuses) -> Optional[str]:
+    worst = None
+    for status in statuses:
+        if status and (worst is None or severity(status) < severity(worst)):
+            worst = status
+    return worst
+
+
+def roll_up_status(statuses: List[str]) -> str:
+    """Status derived from children when behave reported none"""
+    for status in ROLL_UP_ORDER:
+        if status in statuses:
+            return status
+    return "passed"
+
+
+def step_key(keyword: str, text: str) -> Tuple[str, str]:
+    return keyword.strip(), text
+
+
+def index_behave_results(behave_results: List[Dict]) -> Dict[str, List[Dict]]:
+    """{feature name: [indexed feature per occurrence]}"""
+    index: Dict[str, List[Dict]] = {}
+    for behave_feature in behave_results:
+        elements = behave_feature.get("elements") or []
+        background = next((e for e in elements if e.get("type") == "background"), None)
+        background_steps = len(background["steps"]) if background else 0
+
+        feature = {"status": behave_feature.get("status"), "scenarios": {}, "outline_rows": {}}
+        for element in elements:
+            if element.get("type") == "background":
+                continue
+            # Step lookups are built lazily (see step_statuses)
+            scenario = {"status": element.get("status"), "steps": (element.get("steps") or [])[background_steps:]}
+
+            name = element["name"]
+            if element.get("keyword") in ("Scenario Outline", "Scenario Template") and " -- @" in name:
+                feature["outline_rows"].setdefault(name[:name.rindex(" -- @")], []).append(scenario)
+            else:
+                feature["scenarios"].setdefault(name, []).append(scenario)
+
+        index.setdefault(behave_feature["name"], []).append(feature)
+    return index
+
+
+def status_of(step: Optional[Dict]) -> Optional[str]:
+    return (step.get("result") or {}).get("status") if step else None
+
+
+def step_statuses(scenario: Dict, steps: List[Dict]) -> List[Optional[str]]:
+    """
+    Behave status per parsed step. When both step lists line up (the usual
+    case) that is a positional zip; otherwise the (keyword, text) index is
+    built on first use and the nth identical step takes the nth match.
+    """
+    behave_steps = scenario["steps"]
+    if len(behave_steps) == len(steps) and all(
+            step["text"] == behave_step["name"] and step["keyword"] == behave_step["keyword"].strip()
+            for step, behave_step in zip(steps, behave_steps)):
+        return [status_of(behave_step) for behave_step in behave_steps]
+
+    if "by_key" not in scenario:
+        scenario["by_key"] = {}
+        for behave_step in behave_steps:
+            scenario["by_key"].setdefault(step_key(behave_step["keyword"], behave_step["name"]), []).append(
+                status_of(behave_step))
+    seen: Dict[Tuple[str, str], int] = {}
+    statuses = []
+    for step in steps:
+        key = step_key(step["keyword"], step["text"])
+        nth = seen.get(key, 0)
+        seen[key] = nth + 1
+        found = scenario["by_key"].get(key) or []
+        statuses.append(found[nth] if nth < len(found) else None)
+    return statuses
+
+
+def take_outline_rows(outline_rows: Dict[str, List[Dict]], name: str) -> List[Dict]:
+    """Rows named like the outline, else rows fitting it with <placeholders> filled; claimed once"""
+    if name in outline_rows:
+        return outline_rows.pop(name)
+    if not re.search(r"<[^>]+>", name):
+        return []
+    parts = re.split(r"<[^>]+>", name)
+    pattern = None
+    rows = []
+    for row_name in list(outline_rows):
+        if not (row_name.startswith(parts[0]) and row_name.endswith(parts[-1])):
+            continue
+        pattern = pattern or re.compile(".*".join(re.escape(part) for part in parts), re.DOTALL)
+        if pattern.fullmatch(row_name):
+            rows.extend(outline_rows.pop(row_name))
+    return rows
+
+
+def merge_with_results_index(features: List[Dict], index: Dict[str, List[Dict]]) -> List[Dict]:
+    merged = []
+    feature_seen: Dict[str, int] = {}
+    for feature in features:
+        occurrence = feature_seen.get(feature["name"], 0)
+        feature_seen[feature["name"]] = occurrence + 1
+        candidates = index.get(feature["name"]) or []
+        if occurrence >= len(candidates):
+            merged.append(feature)
+            continue
+        indexed = candidates[occurrence]
+        outline_rows = dict(indexed["outline_rows"])
+        scenario_seen: Dict[str, int] = {}
+
+        scenarios = []
+        for scenario in feature["scenarios"]:
+            if scenario.get("outline"):
+                rows = take_outline_rows(outline_rows, scenario["name"])
+                if not rows:
+                    scenarios.append(scenario)
+                    continue
+                status = worst_status(row["status"] for row in rows)
+                # Row step text has the placeholders filled in: match by position
+                statuses = [
+                    worst_status(status_of(row["steps"][position]) if position < len(row["steps"]) else None
+                                 for row in rows)
+                    for position in range(len(scenario["steps"]))
+                ]
+            else:
+                nth = scenario_seen.get(scenario["name"], 0)
+                scenario_seen[scenario["name"]] = nth + 1
+                matches = indexed["scenarios"].get(scenario["name"]) or []
+                if nth >= len(matches):
+                    scenarios.append(scenario)
+                    continue
+                behave_scenario = matches[nth]
+                status = behave_scenario["status"]
+                statuses = step_statuses(behave_scenario, scenario["steps"])
+
+            steps = [dict(step, status=found or step["status"]) for step, found in zip(scenario["steps"], statuses)]
+            scenarios.append(dict(scenario, steps=steps,
+                                  status=status or roll_up_status([s["status"] for s in steps])))
+
+        merged.append(dict(feature, scenarios=scenarios,
+                           status=indexed["status"] or roll_up_status([s["status"] for s in scenarios])))
+    return merged
+
+
+def merge_nested(features: List[Dict], behave_results: List[Dict]) -> List[Dict]:
+    """The merge as it was: find() at every level (first match wins)"""
+    merged = []
+    for feature in features:
+        behave_feature = next((bf for bf in behave_results if bf["name"] == feature["name"]), None)
+        if behave_feature is None:
+            merged.append(feature)
+            continue
+        scenarios = []
+        for scenario in feature["scenarios"]:
+            behave_scenario = next((bs for bs in behave_feature.get("elements") or []
+                                    if bs["name"] == scenario["name"]), None)
+            if behave_scenario is None:
+                scenarios.append(scenario)
+                continue
+            steps = []
+            for step in scenario["steps"]:
+                behave_step = next((bs for bs in behave_scenario["steps"]
+                                    if bs["keyword"].strip() == step["keyword"] and bs["name"] == step["text"]), None)
+                status = (behave_step.get("result") or {}).get("status") if behave_step else None
+                steps.append(dict(step, status=status or step["status"]))
+            scenarios.append(dict(scenario, steps=steps, status=behave_scenario.get("status")
+                                  or roll_up_status([s["status"] for s in steps])))
+        merged.append(dict(feature, scenarios=scenarios, status=behave_feature.get("status")
+                           or roll_up_status([s["status"] for s in scenarios])))
+    return merged
+
+
+def generate_fixture(total_steps: int, steps_per_scenario: int = 8, scenarios_per_feature: int = 25,
+                     unique: bool = False, seed: int = 3) -> Tuple[List[Dict], List[Dict]]:
+    """
+    (parsed features, behave results) with about total_steps parsed steps.
+    Unless unique, features get a Background, ~5% of scenarios are outlines
+    with 3 example rows and ~5% reuse an earlier scenario name.
+    """
+    rng = random.Random(seed)
+    keywords = ("Given", "When", "Then", "And")
+    statuses = ("passed", "passed", "passed", "failed", "skipped", "undefined")
+    scenario_count = max(1, total_steps // steps_per_scenario)
+    parsed, results = [], []
+
+    for f in range(0, scenario_count, scenarios_per_feature):
+        feature_name = f"Feature {f // scenarios_per_feature}"
+        background = [] if unique else [{"keyword": "Given", "name": "the dashboard is running",
+                                         "result": {"status": "passed"}}]
+        parsed_scenarios, elements = [], []
+        if background:
+            elements.append({"type": "background", "keyword": "Background", "name": "", "steps": background})
+
+        for s in range(min(scenarios_per_feature, scenario_count - f)):
+            duplicate = not unique and s > 0 and rng.random() < 0.05
+            outline = not unique and not duplicate and rng.random() < 0.05
+            name = parsed_scenarios[rng.randrange(len(parsed_scenarios))]["name"] if duplicate else \
+                f"Scenario {s} with <n> items" if outline else f"Scenario {s}"
+            texts = [f"step {s}.{t} {rng.randrange(1000)}" for t in range(steps_per_scenario)]
+            parsed_steps = [{"id": f"S{s + 1}-step-{t + 1}", "keyword": keywords[min(t, 3)],
+                             "text": text + (" <n>" if outline else ""), "status": "undefined"}
+                            for t, text in enumerate(texts)]
+            parsed_scenarios.append({"id": f"S{s + 1}", "name": name, "steps": parsed_steps,
+                                     "status": "undefined", "tags": [], "outline": outline})
+
+            rows = [(f" -- @1.{row + 1} Examples", str(row + 2)) for row in range(3)] if outline else [("", None)]
+            for suffix, value in rows:
+                steps = background + [
+                    {"keyword": step["keyword"],
+                     "name": step["text"].replace("<n>", value) if value else step["text"],
+                     "result": {"status": rng.choice(statuses)}}
+                    for step in parsed_steps
+                ]
+                elements.append({
+                    "type": "scenario",
+                    "keyword": "Scenario Outline" if outline else "Scenario",
+                    "name": (name.replace("<n>", value) if value else name) + suffix,
+                    "status": worst_status(step["result"]["status"] for step in steps),
+                    "steps": steps,
+                })
+
+        parsed.append({"id": f"feature-{len(parsed)}", "name": feature_name, "scenarios": parsed_scenarios,
+                       "status": "undefined", "tags": []})
+        results.append({"name": feature_name, "status": worst_status(e.get("status") for e in elements),
+                        "elements": elements})
+    return parsed, results
+
+
+def benchmark(total_steps: int, unique: bool, steps_per_scenario: int, scenarios_per_feature: int) -> Dict:
+    parsed, results = generate_fixture(total_steps, steps_per_scenario, scenarios_per_feature, unique)
+    started = time.perf_counter()
+    nested = merge_nested(parsed, results)
+    nested_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    index = index_behave_results(results)
+    index_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    indexed = merge_with_results_index(parsed, index)
+    merge_seconds = time.perf_counter() - started
+
+    return {
+        "steps": sum(len(s["steps"]) for f in parsed for s in f["scenarios"]),
+        "identical": nested == indexed,
+        "nested_seconds": nested_seconds,
+        "index_seconds": index_seconds,
+        "merge_seconds": merge_seconds,
+    }
+
+
+def write_json(path: str, document) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(document, f)
+    os.replace(tmp_path, path)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Merge parsed features with behave results (reference)")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = subcommands.add_parser("generate", help="Write a synthetic fixture")
+    generate_parser.add_argument("--output-dir", default="../reports/merge-fixture", help="Fixture directory")
+
+    benchmark_parser = subcommands.add_parser("benchmark", help="Nested find() vs index on a fixture")
+
+    for sub in (generate_parser, benchmark_parser):
+        sub.add_argument("--steps", type=int, default=100000, help="Parsed steps in the fixture")
+        sub.add_argument("--steps-per-scenario", type=int, default=10, help="Steps in each scenario")
+        sub.add_argument("--scenarios-per-feature", type=int, default=200, help="Scenarios in each feature")
+        sub.add_argument("--unique", action="store_true",
+                         help="No Background, outlines or duplicate names (both merges then agree)")
+
+    merge_parser = subcommands.add_parser("merge", help="Merge files")
+    merge_parser.add_argument("features", help="Parsed features JSON (ParsedFeature[])")
+    merge_parser.add_argument("results", help="behave JSON results")
+    merge_parser.add_argument("--output", default="merged-features.json", help="Merged output path")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    if args.command == "generate":
+        parsed, results = generate_fixture(args.steps, args.steps_per_scenario, args.scenarios_per_feature,
+                                           args.unique)
+        write_json(os.path.join(args.output_dir, "parsed-features.json"), parsed)
+        write_json(os.path.join(args.output_dir, "behave-results.json"), results)
+        print(f"✅ Generated {len(parsed)} features, "
+              f"{sum(len(s['steps']) for f in parsed for s in f['scenarios'])} steps")
+        print(f"📁 Output: {args.output_dir}")
+
+    elif args.command == "benchmark":
+        result = benchmark(args.steps, args.unique, args.steps_per_scenario, args.scenarios_per_feature)
+        print(f"📊 {result['steps']} steps ({'unique names' if args.unique else 'outlines, duplicates, background'})")
+        print(f"⏱️  Nested find(): {result['nested_seconds'] * 1000:.0f}ms")
+        print(f"⏱️  Index: {result['index_seconds'] * 1000:.0f}ms build + {result['merge_seconds'] * 1000:.0f}ms merge "
+              f"({result['nested_seconds'] / max(result['index_seconds'] + result['merge_seconds'], 1e-9):.1f}x)")
+        if args.unique:
+            print(f"{'✅' if result['identical'] else '❌'} nested vs index: "
+                  f"{'identical' if result['identical'] else 'MISMATCH'}")
+            raise SystemExit(0 if result["identical"] else 1)
+
+    else:
+        with open(args.features) as f:
+            features = json.load(f)
+        with open(args.results) as f:
+            results = json.load(f)
+        merged = merge_with_results_index(features, index_behave_results(results))
+        write_json(args.output, merged)
+        print(f"✅ Merged {len(merged)} features")
+        print(f"📁 Output: {args.output}")
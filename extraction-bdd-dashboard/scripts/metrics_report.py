@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Trend and regression report for the test-run metrics store
+Reads the SQLite store written by features/environment.py
+
+Commands:
+    trend        p50/p95 per run for each scenario, step definition or measurement
+    regressions  compare the most recent runs against the runs before them and
+                 flag slowdowns that are both large enough and statistically
+                 significant (one-sided Mann-Whitney U test); for measurements
+                 where higher is better (load throughput) a drop is the slowdown
+
+Usage:
+    python metrics_report.py trend --runs 10
+    python metrics_report.py trend --by step --match navigate
+    python metrics_report.py regressions --recent 3 --baseline 10
+"""
+
+import argparse
+import math
+import os
+import sys
+from collections import defaultdict
+from typing import Dict, List, Sequence, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "features"))
+from metrics_store import connect, higher_is_better, measurement_unit  # noqa: E402
+
+DEFAULT_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "reports", "metrics.sqlite3")
+
+# Sample source per --by choice: SQL yielding (test_run_id, key, value)
+SAMPLE_QUERIES = {
+    "scenario": """
+        SELECT s.test_run_id, s.feature || ' / ' || s.scenario, s.duration_ms
+        FROM scenarios s
+        WHERE s.test_run_id IN ({runs}) AND s.status = 'passed'
+    """,
+    "step": """
+        SELECT s.test_run_id, st.step_type || ' ' || st.step_definition, st.duration_ms
+        FROM steps st JOIN scenarios s ON s.id = st.scenario_id
+        WHERE s.test_run_id IN ({runs}) AND st.status = 'passed' AND st.step_definition IS NOT NULL
+    """,
+    "measurement": """
+        SELECT s.test_run_id, m.kind || ':' || m.name, m.value
+        FROM measurements m JOIN scenarios s ON s.id = m.scenario_id
+        WHERE s.test_run_id IN ({runs})
+    """,
+}
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Linear-interpolated percentile of values (0 <= pct <= 100)"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * pct / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def mann_whitney_greater(baseline: Sequence[float], current: Sequence[float]) -> float:
+    """
+    One-sided p-value that current tends to be larger than baseline
+    (Mann-Whitney U, normal approximation with tie and continuity correction).
+    """
+    n1, n2 = len(current), len(baseline)
+    if not n1 or not n2:
+        return 1.0
+
+    combined = sorted([(value, True) for value in current] + [(value, False) for value in baseline])
+    n = n1 + n2
+    rank_sum, tie_term, i = 0.0, 0.0, 0
+    while i < n:
+        j = i
+        while j + 1 < n and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        average_rank = (i + j) / 2 + 1
+        rank_sum += average_rank * sum(1 for k in range(i, j + 1) if combined[k][1])
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        i = j + 1
+
+    u = rank_sum - n1 * (n1 + 1) / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def key_traits(by: str, key: str) -> Tuple[str, bool]:
+    """(unit, higher is better) for a sample key; scenario and step keys are durations"""
+    if by != "measurement":
+        return "ms", False
+    kind, name = key.split(":", 1)
+    return measurement_unit(kind, name), higher_is_better(kind, name)
+
+
+def recent_runs(connection, limit: int) -> List[str]:
+    """The latest `limit` test_run_ids, oldest first"""
+    rows = connection.execute(
+        "SELECT test_run_id FROM runs GROUP BY test_run_id ORDER BY MIN(started_at) DESC LIMIT ?", (limit,)
+    ).fetchall()
+    return [row[0] for row in reversed(rows)]
+
+
+def load_samples(connection, runs: List[str], by: str, match: str = None) -> Dict[str, Dict[str, List[float]]]:
+    """{key: {test_run_id: [values]}} for the given runs"""
+    samples: Dict[str, Dict[str, List[float]]] = defaultdict(lambda: defaultdict(list))
+    if not runs:
+        return samples
+    query = SAMPLE_QUERIES[by].format(runs=", ".join("?" for _ in runs))
+    for run_id, key, value in connection.execute(query, runs):
+        if match and match.lower() not in key.lower():
+            continue
+        samples[key][run_id].append(value)
+    return samples
+
+
+def trend(connection, runs: int, by: str, match: str = None) -> None:
+    run_ids = recent_runs(connection, runs)
+    samples = load_samples(connection, run_ids, by, match)
+    print(f"📊 p50/p95 by {by} over {len(run_ids)} runs")
+    for key in sorted(samples):
+        print(f"\n   {key} ({key_traits(by, key)[0]})")
+        for run_id in run_ids:
+            values = samples[key].get(run_id)
+            if values:
+                print(f"      {run_id}: p50 {percentile(values, 50):9.1f}  p95 {percentile(values, 95):9.1f}  "
+                      f"(n={len(values)})")
+
+
+def find_regressions(connection, recent: int, baseline: int, by: str, alpha: float,
+                     min_slowdown: float, match: str = None) -> List[Tuple]:
+    """
+    (key, baseline p50, current p50, change %, p-value, unit) for every key
+    whose recent samples are significantly (p < alpha) and materially
+    (>= min_slowdown percent on p50) worse than the baseline window: larger
+    for durations, smaller for higher-is-better measurements.
+    """
+    run_ids = recent_runs(connection, recent + baseline)
+    current_runs, baseline_runs = run_ids[-recent:], run_ids[:-recent]
+    samples = load_samples(connection, run_ids, by, match)
+
+    regressions = []
+    for key, per_run in samples.items():
+        current = [v for run_id in current_runs for v in per_run.get(run_id, [])]
+        reference = [v for run_id in baseline_runs for v in per_run.get(run_id, [])]
+        if not current or not reference:
+            continue
+        unit, higher = key_traits(by, key)
+        before, after = percentile(reference, 50), percentile(current, 50)
+        change = (after / before - 1) * 100 if before else 0.0
+        if (-change if higher else change) < min_slowdown:
+            continue
+        if higher:
+            p_value = mann_whitney_greater(current, reference)
+        else:
+            p_value = mann_whitney_greater(reference, current)
+        if p_value < alpha:
+            regressions.append((key, before, after, change, p_value, unit))
+    return sorted(regressions, key=lambda row: row[4])
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Trends and regressions from the test-run metrics store")
+    parser.add_argument("--db", default=os.getenv("METRICS_DB", DEFAULT_DB), help="SQLite metrics store")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    trend_parser = subcommands.add_parser("trend", help="p50/p95 per run")
+    trend_parser.add_argument("--runs", type=int, default=10, help="Most recent runs to show")
+
+    regressions_parser = subcommands.add_parser("regressions", help="Flag significant slowdowns")
+    regressions_parser.add_argument("--recent", type=int, default=3, help="Runs under test")
+    regressions_parser.add_argument("--baseline", type=int, default=10, help="Runs before them to compare against")
+    regressions_parser.add_argument("--alpha", type=float, default=0.05, help="Significance level")
+    regressions_parser.add_argument("--min-slowdown", type=float, default=10.0,
+                                    help="Minimum p50 slowdown in percent")
+
+    for sub in (trend_parser, regressions_parser):
+        sub.add_argument("--by", choices=sorted(SAMPLE_QUERIES), default="scenario", help="What to group samples by")
+        sub.add_argument("--match", default=None, help="Only keys containing this string")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if not os.path.exists(args.db):
+        print(f"⚠️  No metrics store at {args.db}; run behave first")
+        sys.exit(0)
+
+    connection = connect(args.db)
+    if args.command == "trend":
+        trend(connection, args.runs, args.by, args.match)
+        sys.exit(0)
+
+    regressions = find_regressions(connection, args.recent, args.baseline, args.by,
+                                   args.alpha, args.min_slowdown, args.match)
+    if regressions:
+        print(f"❌ {len(regressions)} significant slowdown(s) in the last {args.recent} runs:")
+        for key, before, after, change, p_value, unit in regressions:
+            print(f"   {key}: p50 {before:.1f} {unit} -> {after:.1f} {unit} ({change:+.1f}%, p={p_value:.4f})")
+        sys.exit(1)
+
+    print(f"✅ No significant slowdowns in the last {args.recent} runs")
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Columnar binary layout for longitudinal roadmap snapshots
+Fixed-width week x feature arrays with a small JSON header, read via mmap
+
+File layout:
+    MAGIC (8 bytes) | header length (uint32 LE) | JSON header | columns...
+
+Every column starts on a 64-byte boundary. Per-feature metrics are stored
+week-major with shape (weeks, features), so a week range is one contiguous
+block and a single feature is a strided view - both zero-copy.
+"""
+
+import json
+import os
+import struct
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+MAGIC = b"DUXROAD1"
+ALIGNMENT = 64
+
+# Status strings are stored as uint8 codes; index into this tuple to decode
+STATUS_CODES = ("not_started", "in_progress", "completed")
+
+# (name, dtype) of the week x feature columns
+FEATURE_COLUMNS = (
+    ("overall_progress", "<f8"),
+    ("evidenceCount", "<i4"),
+    ("passedScenarios", "<i4"),
+    ("status", "|u1"),
+)
+
+# (name, dtype) of the per-week columns
+WEEK_COLUMNS = (
+    ("week", "<i4"),
+    ("overall_completion", "<f8"),
+    ("total_steps", "<i4"),
+    ("defined_steps", "<i4"),
+    ("implemented_steps", "<i4"),
+    ("passing_steps", "<i4"),
+    ("success_rate", "<f8"),
+    ("step_execution_rate", "<f8"),
+)
+
+PIPELINE_FIELDS = ("total_steps", "defined_steps", "implemented_steps",
+                   "passing_steps", "success_rate", "step_execution_rate")
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _layout(num_weeks: int, feature_ids: List[str]) -> Dict:
+    """Compute column shapes and offsets relative to the end of the header"""
+    columns = {}
+    offset = 0
+    specs = [(name, dtype, [num_weeks, len(feature_ids)]) for name, dtype in FEATURE_COLUMNS]
+    specs += [(name, dtype, [num_weeks]) for name, dtype in WEEK_COLUMNS]
+    specs.append(("totalScenarios", "<i4", [len(feature_ids)]))
+
+    for name, dtype, shape in specs:
+        offset = _align(offset)
+        columns[name] = {"dtype": dtype, "shape": shape, "offset": offset}
+        offset += int(np.prod(shape)) * np.dtype(dtype).itemsize
+
+    return columns
+
+
+class ColumnarWriter:
+    """
+    Incrementally write snapshots in the columnar layout.
+
+    header is the dataset header (project, generated_at, total_weeks,
+    metadata.features); snapshots must arrive in week order starting at
+    first_week. Rows are filled through writable memmaps, so memory stays
+    flat regardless of history length. The file is renamed into place on
+    close().
+    """
+
+    def __init__(self, path: str, header: Dict, first_week: int = 1):
+        feature_ids = header["metadata"]["features"]
+        columns = _layout(header["total_weeks"] - first_week + 1, feature_ids)
+        file_header = {
+            "version": 1,
+            "project": header["project"],
+            "generated_at": header["generated_at"],
+            "first_week": first_week,
+            "total_weeks": header["total_weeks"],
+            "feature_ids": feature_ids,
+            "status_codes": list(STATUS_CODES),
+            "columns": columns,
+        }
+        # Column offsets are relative to data_start, which depends on header size
+        header_bytes = json.dumps(file_header, separators=(",", ":")).encode("utf-8")
+        data_start = _align(len(MAGIC) + 4 + len(header_bytes))
+        end = max((c["offset"] + int(np.prod(c["shape"])) * np.dtype(c["dtype"]).itemsize
+                   for c in columns.values()), default=0)
+
+        self.path = path
+        self._tmp_path = f"{path}.tmp"
+        with open(self._tmp_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<I", len(header_bytes)))
+            f.write(header_bytes)
+            f.truncate(data_start + end)
+
+        self._views = {
+            name: np.memmap(self._tmp_path, dtype=spec["dtype"], mode="r+",
+                            offset=data_start + spec["offset"], shape=tuple(spec["shape"]))
+            for name, spec in columns.items() if np.prod(spec["shape"]) > 0
+        }
+        self._status_index = {status: code for code, status in enumerate(STATUS_CODES)}
+        self.rows_written = 0
+
+    def append(self, snapshot: Dict) -> None:
+        """Write the next week's snapshot"""
+        views = self._views
+        row = self.rows_written
+        features = snapshot["features"]
+        if features:
+            if row == 0:
+                views["totalScenarios"][:] = [f["totalScenarios"] for f in features]
+            views["overall_progress"][row] = [f["overall_progress"] for f in features]
+            views["evidenceCount"][row] = [f["evidenceCount"] for f in features]
+            views["passedScenarios"][row] = [f["passedScenarios"] for f in features]
+            views["status"][row] = [self._status_index[f["status"]] for f in features]
+
+        views["week"][row] = snapshot["week"]
+        views["overall_completion"][row] = snapshot["overall_completion"]
+        for field in PIPELINE_FIELDS:
+            views[field][row] = snapshot["pipeline_metrics"][field]
+        self.rows_written += 1
+
+    def tee(self, snapshots: Iterable[Dict]) -> Iterator[Dict]:
+        """Pass snapshots through unchanged while writing each one"""
+        for snapshot in snapshots:
+            self.append(snapshot)
+            yield snapshot
+
+    def close(self) -> None:
+        for view in self._views.values():
+            view.flush()
+        self._views = {}
+        os.replace(self._tmp_path, self.path)
+
+
+def write_columnar(path: str, header: Dict, snapshots: Iterable[Dict], first_week: int = 1) -> int:
+    """Write snapshots to path in the columnar layout; returns the row count"""
+    writer = ColumnarWriter(path, header, first_week)
+    for snapshot in snapshots:
+        writer.append(snapshot)
+    writer.close()
+    return writer.rows_written
+
+
+class ColumnarRoadmap:
+    """
+    Read-only, memory-mapped view of a columnar roadmap file.
+
+    All accessors return NumPy views onto the mapping; nothing is copied or
+    parsed beyond the JSON header until the caller touches the data.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            magic = f.read(len(MAGIC))
+            if magic != MAGIC:
+                raise ValueError(f"Not a columnar roadmap file: {path}")
+            (header_length,) = struct.unpack("<I", f.read(4))
+            self.header = json.loads(f.read(header_length))
+
+        data_start = _align(len(MAGIC) + 4 + header_length)
+        self.path = path
+        self.feature_ids: List[str] = self.header["feature_ids"]
+        self.first_week: int = self.header["first_week"]
+        self.total_weeks: int = self.header["total_weeks"]
+        self._feature_index = {feature_id: i for i, feature_id in enumerate(self.feature_ids)}
+        self._columns = {}
+        for name, spec in self.header["columns"].items():
+            shape = tuple(spec["shape"])
+            if np.prod(shape) == 0:
+                self._columns[name] = np.empty(shape, dtype=spec["dtype"])
+            else:
+                self._columns[name] = np.memmap(path, dtype=spec["dtype"], mode="r",
+                                                offset=data_start + spec["offset"], shape=shape)
+
+    def column(self, name: str) -> np.ndarray:
+        """Full view of one column"""
+        return self._columns[name]
+
+    def _rows(self, start_week: Optional[int], end_week: Optional[int]) -> slice:
+        start = self.first_week if start_week is None else start_week
+        end = self.total_weeks if end_week is None else end_week
+        return slice(max(0, start - self.first_week), max(0, end - self.first_week + 1))
+
+    def weeks(self, start_week: Optional[int] = None, end_week: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Views of every week-indexed column for weeks start_week..end_week (inclusive)"""
+        rows = self._rows(start_week, end_week)
+        return {name: column[rows] for name, column in self._columns.items() if name != "totalScenarios"}
+
+    def feature(self, feature_id: str, start_week: Optional[int] = None,
+                end_week: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Views of one feature's metrics over weeks start_week..end_week (inclusive)"""
+        index = self._feature_index[feature_id]
+        rows = self._rows(start_week, end_week)
+        views = {name: self._columns[name][rows, index] for name, _ in FEATURE_COLUMNS}
+        views["week"] = self._columns["week"][rows]
+        return views
+
+    def feature_states(self, week: int) -> List[Dict]:
+        """Materialize one week's feature list in the JSON snapshot schema"""
+        row = week - self.first_week
+        columns = self._columns
+        return [
+            {
+                "id": feature_id,
+                "status": STATUS_CODES[status],
+                "overall_progress": progress,
+                "evidenceCount": evidence,
+                "passedScenarios": passed,
+                "totalScenarios": total,
+                "passing": progress == 100,
+                "inProgress": STATUS_CODES[status] == "in_progress",
+            }
+            for feature_id, progress, evidence, passed, status, total in zip(
+                self.feature_ids,
+                columns["overall_progress"][row].tolist(),
+                columns["evidenceCount"][row].tolist(),
+                columns["passedScenarios"][row].tolist(),
+                columns["status"][row].tolist(),
+                columns["totalScenarios"].tolist(),
+            )
+        ]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: roadmap_columnar.py FILE [FEATURE_ID] [START_WEEK] [END_WEEK]")
+        sys.exit(1)
+
+    roadmap = ColumnarRoadmap(sys.argv[1])
+    print(f"📁 {roadmap.header['project']}: weeks {roadmap.first_week}-{roadmap.total_weeks}, "
+          f"{len(roadmap.feature_ids)} features")
+
+    if len(sys.argv) > 2:
+        start = int(sys.argv[3]) if len(sys.argv) > 3 else None
+        end = int(sys.argv[4]) if len(sys.argv) > 4 else None
+        history = roadmap.feature(sys.argv[2], start, end)
+        for week, progress, evidence in zip(history["week"].tolist(),
+                                            history["overall_progress"].tolist(),
+                                            history["evidenceCount"].tolist()):
+            print(f"   Week {week}: {progress}% ({evidence} evidence)")
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Parallel behave runner for the dashboard validation suite
+Shards scenarios across worker processes and merges their JSON results
+
+Scenarios are discovered with behave's own parser and assigned to workers
+longest-first, using step durations from the previous behave-results.json
+when available. Each worker is a separate behave process with its own
+browser pool (and, with --port-base, its own dashboard server). The
+per-worker JSON reports are merged into one behave-results.json in
+feature-file / line order, so output is stable regardless of sharding.
+Unless --no-stream is given, every worker also appends its step results to
+one live stream (features/step_stream.py) that the dashboard tails.
+Scenarios tagged @load are left out, as in behave.ini, unless --load is given.
+
+Usage:
+    python run_behave_parallel.py --workers 8
+    python run_behave_parallel.py --workers 4 --port-base 3100   # one `next start` per worker
+    python run_behave_parallel.py --load                         # include the @load features
+    python run_behave_parallel.py features/01_pm_declares_spec_confidently.feature -- --tags=@smoke
+"""
+
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Feature status from its scenarios when merging shards: the first status present wins
+STATUS_PRIORITY = ("failed", "error", "hook_error", "undefined", "pending", "passed", "skipped", "untested")
+
+STEP_STREAM_FORMATTER = "features.step_stream:StepStreamFormatter"
+
+# Excluded by behave.ini's default_tags; workers need an explicit --tags to run it
+LOAD_TAG = "load"
+
+
+def _line(location: str) -> int:
+    return int(location.rsplit(":", 1)[1])
+
+
+def discover_scenarios(feature_paths: List[str], include_load: bool = False) -> Tuple[List[Dict], List[str]]:
+    """
+    Parse feature files (paths relative to the project) with behave's parser.
+    Returns (scenarios, unparsable paths); each scenario is
+    {"location": "features/x.feature:12", "steps": n, "reports": [...]}.
+    A Scenario Outline stays one unit (behave runs every example row for
+    the outline's line) but behave reports each row at the row's own line,
+    so "reports" lists the element locations the unit produces.
+    Scenarios tagged @load (directly or via their feature) are skipped
+    unless include_load is set.
+    """
+    from behave.parser import ParserError, parse_file
+
+    scenarios, unparsable = [], []
+    for path in feature_paths:
+        try:
+            feature = parse_file(os.path.join(PROJECT_DIR, path))
+        except ParserError:
+            unparsable.append(path)
+            continue
+        if feature is None:
+            continue
+        background_steps = len(feature.background.steps) if feature.background else 0
+        for scenario in feature.scenarios:
+            if not include_load and LOAD_TAG in set(feature.tags) | set(scenario.tags):
+                continue
+            rows = getattr(scenario, "scenarios", None)
+            if rows:
+                reports = [f"{path}:{row.line}" for row in rows]
+                steps = sum(len(row.steps) + background_steps for row in rows)
+            else:
+                reports = [f"{path}:{scenario.line}"]
+                steps = len(scenario.steps) + background_steps
+            scenarios.append({"location": f"{path}:{scenario.line}", "steps": steps, "reports": reports})
+    return scenarios, unparsable
+
+
+def previous_durations(results_path: str) -> Dict[str, float]:
+    """Scenario location -> seconds, from an earlier behave JSON report"""
+    try:
+        with open(results_path) as f:
+            features = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    durations = {}
+    for feature in features:
+        for element in feature.get("elements") or []:
+            if element.get("type") != "scenario":
+                continue
+            durations[element["location"]] = sum(
+                (step.get("result") or {}).get("duration") or 0.0 for step in element.get("steps") or []
+            )
+    return durations
+
+
+def shard(scenarios: List[Dict], workers: int, durations: Dict[str, float]) -> List[List[str]]:
+    """
+    Longest-processing-time-first assignment of scenarios to workers.
+    Scenarios without history are weighted by step count at the mean
+    measured per-step time (or 1s per step with no history at all).
+    """
+    measured = [s for s in scenarios if all(location in durations for location in s["reports"])]
+    measured_steps = sum(s["steps"] for s in measured)
+    measured_seconds = sum(durations[location] for s in measured for location in s["reports"])
+    per_step = measured_seconds / measured_steps if measured_steps else 1.0
+
+    def weight(scenario: Dict) -> float:
+        if all(location in durations for location in scenario["reports"]):
+            return sum(durations[location] for location in scenario["reports"])
+        return scenario["steps"] * per_step
+
+    loads = [0.0] * workers
+    shards: List[List[str]] = [[] for _ in range(workers)]
+    for scenario in sorted(scenarios, key=lambda s: (-weight(s), s["location"])):
+        target = loads.index(min(loads))
+        shards[target].append(scenario["location"])
+        loads[target] += weight(scenario)
+
+    return [sorted(locations, key=lambda loc: (loc.rsplit(":", 1)[0], _line(loc))) for locations in shards if locations]
+
+
+def run_workers(shards: List[List[str]], workdir: str, test_run_id: str,
+                port_base: Optional[int], behave_args: List[str], stream: Optional[str] = None) -> List[Dict]:
+    """Start one behave process per shard and wait for all of them"""
+    if stream:
+        # Workers share the stream (features/step_stream.py); start it fresh once
+        if os.path.exists(stream):
+            root, extension = os.path.splitext(stream)
+            os.replace(stream, f"{root}.prev{extension}")
+        behave_args = ["-f", STEP_STREAM_FORMATTER, *behave_args]
+
+    workers = []
+    for index, locations in enumerate(shards):
+        env = dict(os.environ, TEST_RUN_ID=test_run_id, BEHAVE_WORKER=str(index))
+        if port_base is not None:
+            env["DASHBOARD_URL"] = f"http://localhost:{port_base + index}"
+            env["DASHBOARD_START_SERVER"] = "1"
+        if stream:
+            env["STEP_STREAM"] = stream
+
+        report_path = os.path.join(workdir, f"worker-{index}.json")
+        log_path = os.path.join(workdir, f"worker-{index}.log")
+        log = open(log_path, "w")
+        command = [sys.executable, "-m", "behave", "-f", "json", "-o", report_path,
+                   "-f", "progress", *behave_args, *locations]
+        workers.append({
+            "index": index,
+            "scenarios": len(locations),
+            "report": report_path,
+            "log_path": log_path,
+            "log": log,
+            "started": time.perf_counter(),
+            "process": subprocess.Popen(command, cwd=PROJECT_DIR, env=env, stdout=log, stderr=subprocess.STDOUT),
+        })
+
+    for worker in workers:
+        worker["returncode"] = worker["process"].wait()
+        worker["seconds"] = time.perf_counter() - worker["started"]
+        worker["log"].close()
+    return workers
+
+
+def merge_reports(reports: List[Tuple[str, List[str]]], feature_order: List[str]) -> List[Dict]:
+    """
+    Merge per-worker behave JSON reports, given as (report path, element
+    locations the worker owned, outline rows expanded). behave reports the scenarios a worker was
+    not given as skipped, so only owned scenarios are taken from each
+    report. Shards of the same feature are combined into one feature
+    entry; elements are ordered by line and a shared background is kept once.
+    """
+    merged: Dict[str, Dict] = {}
+    for path, locations in reports:
+        owned = set(locations)
+        try:
+            with open(path) as f:
+                features = json.load(f)
+        except (OSError, ValueError):
+            continue
+
+        for feature in features:
+            key = feature["location"].rsplit(":", 1)[0]
+            if key not in merged:
+                merged[key] = dict(feature, elements=[])
+            target = merged[key]
+            known = {element["location"] for element in target["elements"]}
+            elements = [e for e in feature.get("elements") or []
+                        if e["location"] not in known and (e.get("type") != "scenario" or e["location"] in owned)]
+            target["elements"].extend(elements)
+
+    order = {path: i for i, path in enumerate(feature_order)}
+    results = []
+    for key in sorted(merged, key=lambda k: (order.get(k, len(order)), k)):
+        feature = merged[key]
+        statuses = {e.get("status", "untested") for e in feature["elements"] if e.get("type") == "scenario"}
+        feature["status"] = next((s for s in STATUS_PRIORITY if s in statuses), feature.get("status", "untested"))
+        feature["elements"].sort(key=lambda element: _line(element["location"]))
+        results.append(feature)
+    return results
+
+
+def write_results(path: str, features: List[Dict]) -> None:
+    """Atomically replace the results file the dashboard reads"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(features, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def summarize(features: List[Dict]) -> Dict[str, Counter]:
+    counts = {"features": Counter(), "scenarios": Counter(), "steps": Counter()}
+    for feature in features:
+        counts["features"][feature["status"]] += 1
+        for element in feature["elements"]:
+            if element.get("type") != "scenario":
+                continue
+            counts["scenarios"][element.get("status", "untested")] += 1
+            for step in element.get("steps") or []:
+                counts["steps"][(step.get("result") or {}).get("status", "untested")] += 1
+    return counts
+
+
+def print_summary(test_run_id: str, started: datetime, wall_seconds: float,
+                  workers: List[Dict], counts: Dict[str, Counter], unparsable: List[str]) -> None:
+    """Combined summary, in the format of environment.after_all"""
+    busy = sum(worker["seconds"] for worker in workers)
+
+    print(f"\n{'='*60}")
+    print(f"Dashboard Validation Test Summary")
+    print(f"{'='*60}")
+    print(f"Test Run ID: {test_run_id}")
+    print(f"Total Duration: {wall_seconds:.2f}s")
+    print(f"Workers: {len(workers)} ({busy:.2f}s busy, {busy / wall_seconds if wall_seconds else 0:.1f}x parallelism)")
+    for worker in workers:
+        icon = '✅' if worker["returncode"] == 0 else '❌'
+        print(f"   {icon} worker {worker['index']}: {worker['scenarios']} scenarios in {worker['seconds']:.2f}s")
+    for kind in ("features", "scenarios", "steps"):
+        breakdown = ", ".join(f"{count} {status}" for status, count in sorted(counts[kind].items()))
+        print(f"{kind.capitalize()}: {sum(counts[kind].values())} ({breakdown or 'none'})")
+    for path in unparsable:
+        print(f"⚠️  Unparsable feature file skipped: {path}")
+    print(f"Started at: {started}")
+    print(f"Completed at: {datetime.now()}")
+    print(f"{'='*60}\n")
+
+
+def parse_args(argv=None):
+    """Runner options; anything after `--` is passed through to behave (e.g. -- --tags=@smoke)"""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    behave_args = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, behave_args = argv[:split], argv[split + 1:]
+
+    parser = argparse.ArgumentParser(description="Run the behave suite sharded across worker processes")
+    parser.add_argument("paths", nargs="*", help="Feature files relative to the project (default: features/*.feature)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--output", default="../public/bdd-data/behave-results.json",
+                        help="Merged behave JSON report")
+    parser.add_argument("--port-base", type=int, default=None,
+                        help="Give worker N its own dashboard server on port PORT_BASE+N")
+    parser.add_argument("--stream", default="../public/bdd-data/live/step-stream.jsonl",
+                        help="Live step result stream tailed by the dashboard")
+    parser.add_argument("--no-stream", action="store_true", help="Do not write the live step stream")
+    parser.add_argument("--load", action="store_true", help="Also run the @load features (excluded by default)")
+    parser.add_argument("--keep-logs", action="store_true", help="Keep per-worker reports and logs")
+    args = parser.parse_args(argv)
+    args.behave_args = behave_args
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    paths = args.paths or sorted(os.path.relpath(path, PROJECT_DIR)
+                                 for path in glob.glob(os.path.join(PROJECT_DIR, "features", "*.feature")))
+
+    started = datetime.now()
+    test_run_id = f"dashboard-validation-{int(time.time())}"
+    scenarios, unparsable = discover_scenarios(paths, args.load)
+    if args.load:
+        # Overrides behave.ini's default_tags; any --tags passed through still narrow the run
+        args.behave_args = [f"--tags=@{LOAD_TAG} or not @{LOAD_TAG}", *args.behave_args]
+
+    if not scenarios:
+        print("❌ No scenarios found")
+        sys.exit(1)
+
+    shards = shard(scenarios, max(1, args.workers), previous_durations(args.output))
+    print(f"⏱️  {sum(len(s['reports']) for s in scenarios)} scenarios across {len(shards)} workers (run {test_run_id})")
+
+    workdir = tempfile.mkdtemp(prefix="behave-parallel-")
+    wall_started = time.perf_counter()
+    stream = None if args.no_stream else os.path.abspath(args.stream)
+    workers = run_workers(shards, workdir, test_run_id, args.port_base, args.behave_args, stream)
+    wall_seconds = time.perf_counter() - wall_started
+
+    reports = {scenario["location"]: scenario["reports"] for scenario in scenarios}
+    features = merge_reports([(worker["report"], [location for unit in shard for location in reports[unit]])
+                              for worker, shard in zip(workers, shards)], paths)
+    write_results(args.output, features)
+    counts = summarize(features)
+    print_summary(test_run_id, started, wall_seconds, workers, counts, unparsable)
+    print(f"📁 Output: {args.output}")
+
+    # Every discovered scenario (each outline row) must come back from some worker
+    expected = sum(len(scenario["reports"]) for scenario in scenarios)
+    merged = sum(counts["scenarios"].values())
+    complete = merged == expected
+    if not complete:
+        print(f"❌ Merged report has {merged} scenarios, expected {expected}")
+
+    for worker in workers:
+        if worker["returncode"] != 0 and not os.path.exists(worker["report"]):
+            print(f"❌ Worker {worker['index']} produced no report; log: {worker['log_path']}")
+            args.keep_logs = True
+    if args.keep_logs:
+        print(f"📁 Worker logs: {workdir}")
+    else:
+        for name in os.listdir(workdir):
+            os.remove(os.path.join(workdir, name))
+        os.rmdir(workdir)
+
+    sys.exit(0 if complete and all(worker["returncode"] == 0 for worker in workers) else 1)
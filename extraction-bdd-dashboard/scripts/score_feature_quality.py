@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Batch quality scorer for BDD .feature files
+Scores every scenario on the four quality layers and writes the consent-quality-report.json schema
+
+Layers mirror lintFeature in lib/skateboard-filesystem-parser.ts; weights
+are those of consent-quality-report.json:
+    functional  30  has "Then" steps
+    reliable    10  has measurable criteria (time/size units, percentages, counts)
+    usable      30  uses real user names instead of a generic "user"
+    delightful  30  has user enablement language ("can ...", "so that", ...)
+
+lintFeature scores a whole file at 25 points per layer, this scorer each
+scenario (plus the narrative and Background); the dashboard's lintScore and
+this report's score differ for the same layers. Issues are listed for the
+ERROR/WARNING layers only; missing measurable criteria just costs its 10
+points, as in consent-quality-report.json.
+
+Each file is read once and split into scenario blocks once; each block is
+lowercased once and every layer is decided with literal prefilters, only
+running a precompiled pattern to confirm a possible hit. The feature
+narrative and Background count for every scenario. Files are scored in
+batches across a process pool.
+
+Usage:
+    python score_feature_quality.py ../features
+    python score_feature_quality.py ../features ../../other/features --jobs 8 --output report.json
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+LAYERS = ("functional", "reliable", "usable", "delightful")
+
+# Layer weights as used for consent-quality-report.json (a scenario missing
+# only measurable criteria is "Mostly Complete" at 90); lintFeature gives 25 each
+LAYER_WEIGHTS = {"functional": 30, "reliable": 10, "usable": 30, "delightful": 30}
+
+# (minimum score, assessment), highest first
+ASSESSMENTS = (
+    (100, "Complete Slice (MDE)"),
+    (80, "Mostly Complete"),
+    (50, "Partial Slice"),
+    (0, "Incomplete"),
+)
+
+REAL_NAMES = ("Bella", "Maya", "Alice", "Joel", "Bob")
+
+# Confirmation patterns, run only after a cheap literal prefilter says the
+# layer can match (CPython's re walks every position, so one combined
+# pattern over the whole file measured slower than this); the reliable and
+# delightful ones run on lowercased text
+FUNCTIONAL_PATTERN = re.compile(r"^[ \t]*Then\s", re.MULTILINE)
+RELIABLE_PATTERN = re.compile(r"<\d+\s*(?:second|minute|hour|ms|mb|gb)|>\d+%|\d+\s*(?:users|scenarios|features)")
+DELIGHTFUL_PATTERN = re.compile(r"\bcan\s+\w|\bso that\b|\benables\b|\bfeels\s+confident")
+
+SCENARIO_PATTERN = re.compile(r"^[ \t]*(Scenario Outline|Scenario Template|Scenario|Example):[ \t]*(.*)$",
+                              re.MULTILINE)
+FEATURE_PATTERN = re.compile(r"^[ \t]*Feature:[ \t]*(.*)$", re.MULTILINE)
+
+# Missing layers reported as issues; "reliable" is scored but not listed
+ISSUES = {
+    "functional": ("ERROR", "Scenario has no Then step asserting an outcome"),
+    "usable": ("WARNING", "No real user name; scenario talks about a generic user"),
+    "delightful": ("WARNING", "No user enablement language (\"can ...\", \"so that\", \"enables\")"),
+}
+
+
+def assessment_for(score: int) -> str:
+    for minimum, label in ASSESSMENTS:
+        if score >= minimum:
+            return label
+    return ASSESSMENTS[-1][1]
+
+
+def score_layers(layers: Dict[str, bool]) -> Dict:
+    """quality_score, quality_layers, assessment and issues for one scenario"""
+    score = sum(LAYER_WEIGHTS[layer] for layer in LAYERS if layers[layer])
+    return {
+        "quality_score": score,
+        "quality_layers": {layer: layers[layer] for layer in LAYERS},
+        "assessment": assessment_for(score),
+        "issues": [
+            {"type": f"missing_{layer}", "severity": ISSUES[layer][0], "message": ISSUES[layer][1]}
+            for layer in LAYERS if layer in ISSUES and not layers[layer]
+        ],
+    }
+
+
+def region_layers(text: str) -> Dict[str, bool]:
+    """Which layers a block of feature text satisfies"""
+    # Case-sensitive checks (lintFeature: /^\s*Then\s+/m and content.includes(name))
+    usable = any(name in text for name in REAL_NAMES)
+    low = text.lower()
+    functional = "Then" in text and FUNCTIONAL_PATTERN.search(text) is not None
+    reliable = (("<" in low or "%" in low or "users" in low or "scenarios" in low or "features" in low)
+                and RELIABLE_PATTERN.search(low) is not None)
+    delightful = (("can" in low or "so that" in low or "enables" in low or "feels" in low)
+                  and DELIGHTFUL_PATTERN.search(low) is not None)
+    return {"functional": functional, "reliable": reliable, "usable": usable, "delightful": delightful}
+
+
+def score_content(content: str, file_label: str) -> List[Dict]:
+    """Report entries for every scenario in one feature file's content"""
+    scenarios = list(SCENARIO_PATTERN.finditer(content))
+    if not scenarios:
+        return []
+    feature_match = FEATURE_PATTERN.search(content)
+    feature_name = feature_match.group(1).strip() if feature_match else os.path.basename(file_label)
+
+    # Region 0 is everything before the first scenario (narrative, Background)
+    bounds = [0] + [match.start() for match in scenarios] + [len(content)]
+    found = [region_layers(content[start:end]) for start, end in zip(bounds, bounds[1:])]
+
+    line = 1
+    position = 0
+    entries = []
+    for index, scenario in enumerate(scenarios):
+        line += content.count("\n", position, scenario.start())
+        position = scenario.start()
+        entry = {
+            "scenario": scenario.group(2).strip(),
+            "feature": feature_name,
+            "file": file_label,
+            "line": line,
+        }
+        entry.update(score_layers({layer: found[0][layer] or found[index + 1][layer] for layer in LAYERS}))
+        entries.append(entry)
+    return entries
+
+
+def score_files(paths: List[Tuple[str, str]]) -> List[Dict]:
+    """Score a batch of (path, label) files; runs inside a pool worker"""
+    entries = []
+    for path, label in paths:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            entries.extend(score_content(f.read(), label))
+    return entries
+
+
+def find_feature_files(roots: Iterable[str], base_dir: str) -> List[Tuple[str, str]]:
+    """(path, label) for every .feature under roots, labels relative to base_dir"""
+    files = []
+    for root in roots:
+        if os.path.isfile(root):
+            files.append(root)
+            continue
+        for directory, subdirectories, names in os.walk(root):
+            subdirectories[:] = sorted(d for d in subdirectories if d not in ("node_modules", "venv", ".git"))
+            files.extend(os.path.join(directory, name) for name in sorted(names) if name.endswith(".feature"))
+    return [(path, os.path.relpath(path, base_dir)) for path in files]
+
+
+def score_paths(roots: Iterable[str], base_dir: str, jobs: Optional[int] = None, batch_size: int = 64) -> Dict:
+    """Score every feature file under roots; returns the report document"""
+    files = find_feature_files(roots, base_dir)
+    batches = [files[i:i + batch_size] for i in range(0, len(files), batch_size)]
+
+    if jobs == 1 or len(batches) <= 1:
+        results = list(map(score_files, batches))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(score_files, batches))
+
+    scenarios = [entry for batch in results for entry in batch]
+    total = len(scenarios)
+    return {
+        "total_scenarios": total,
+        "average_score": sum(entry["quality_score"] for entry in scenarios) / total if total else 0,
+        "files": len(files),
+        "scenarios": scenarios,
+    }
+
+
+def write_report(path: str, report: Dict) -> None:
+    """
+    Write atomically, keeping jtbd_validations from an existing report (they
+    come from the JTBD validator, not from this scorer).
+    """
+    if os.path.exists(path):
+        try:
+            with open(path) as f:
+                existing = json.load(f)
+            if "jtbd_validations" in existing:
+                report["jtbd_validations"] = existing["jtbd_validations"]
+        except (OSError, ValueError):
+            pass
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(report, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Score BDD scenarios on the four quality layers")
+    parser.add_argument("paths", nargs="*", default=["../features"], help="Feature files or directories")
+    parser.add_argument("--output", default="../public/bdd-data/feature-quality-report.json",
+                        help="Report path (consent-quality-report.json schema)")
+    parser.add_argument("--base-dir", default="..", help="Directory report file paths are relative to")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Worker processes (default: CPU count, 1 = serial)")
+    parser.add_argument("--min-average", type=float, default=None,
+                        help="Exit non-zero if the average score is below this")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    started = time.perf_counter()
+    report = score_paths(args.paths, args.base_dir, args.jobs)
+    elapsed = time.perf_counter() - started
+    write_report(args.output, report)
+
+    print(f"✅ Scored {report['total_scenarios']} scenarios in {report['files']} files ({elapsed:.2f}s)")
+    print(f"📊 Average score: {report['average_score']:.1f}")
+    for minimum, label in ASSESSMENTS:
+        count = sum(1 for entry in report["scenarios"] if entry["assessment"] == label)
+        print(f"   {label}: {count}")
+    print(f"📁 Output: {args.output}")
+
+    if args.min_average is not None and report["average_score"] < args.min_average:
+        print(f"❌ Average score {report['average_score']:.1f} is below {args.min_average}")
+        raise SystemExit(1)
@@ -0,0 +1,95 @@
+"""
+Equivalence Tests for the Longitudinal Data Generator
+Purpose: Keep the fast paths of generate_longitudinal_data.py identical to the reference paths
+
+- the vectorized engine produces the scalar engine's snapshots
+- write_json_stream produces the bytes json.dump would for the same dataset
+- update_dataset (append and patch) produces what a full regeneration would
+
+Usage:
+    python -m pytest scripts/test_generate_longitudinal_data.py
+"""
+
+import io
+import json
+
+import pytest
+
+from generate_longitudinal_data import (CHUNK_WEEKS, FEATURE_SCHEDULE, OUTPUT_FORMATS, dataset_header,
+                                        generate_longitudinal_dataset, iter_jsonl_snapshots,
+                                        iter_week_snapshots, np, read_jsonl_header, synthetic_schedule,
+                                        update_dataset, write_dataset, write_json_stream)
+
+SCHEDULES = {
+    "default": (24, None),
+    # Crosses a CHUNK_WEEKS boundary of the vectorized engine
+    "synthetic": (CHUNK_WEEKS + 8, synthetic_schedule(40, CHUNK_WEEKS + 8)),
+}
+
+
+def read_dataset(path, fmt):
+    """The stored dataset without its generated_at timestamp"""
+    if fmt == "jsonl":
+        dataset = read_jsonl_header(path)
+        dataset["snapshots"] = list(iter_jsonl_snapshots(path))
+    else:
+        with open(path) as f:
+            dataset = json.load(f)
+    dataset.pop("generated_at")
+    return dataset
+
+
+@pytest.mark.skipif(np is None, reason="vectorized engine needs NumPy")
+@pytest.mark.parametrize("name", SCHEDULES)
+def test_vectorized_engine_matches_scalar(name):
+    weeks, schedule = SCHEDULES[name]
+    scalar = generate_longitudinal_dataset(weeks, "scalar", schedule)
+    vectorized = generate_longitudinal_dataset(weeks, "vectorized", schedule)
+    assert vectorized["snapshots"] == scalar["snapshots"]
+
+
+@pytest.mark.parametrize("weeks", [0, 1, 24])
+@pytest.mark.parametrize("compact", [False, True])
+def test_streamed_json_matches_json_dump(weeks, compact):
+    header = dataset_header(weeks)
+    snapshots = list(iter_week_snapshots(weeks))
+
+    streamed = io.StringIO()
+    write_json_stream(streamed, header, iter(snapshots), compact=compact)
+
+    dumped = io.StringIO()
+    dataset = dict(header, snapshots=snapshots)
+    if compact:
+        json.dump(dataset, dumped, separators=(",", ":"))
+    else:
+        json.dump(dataset, dumped, indent=2)
+    assert streamed.getvalue() == dumped.getvalue()
+
+
+@pytest.mark.parametrize("fmt", OUTPUT_FORMATS)
+def test_incremental_append_matches_full(tmp_path, fmt):
+    incremental = str(tmp_path / f"incremental.{fmt}")
+    full = str(tmp_path / f"full.{fmt}")
+
+    write_dataset(incremental, 10, fmt=fmt)
+    result = update_dataset(incremental, 24, fmt=fmt)
+    write_dataset(full, 24, fmt=fmt)
+
+    assert result["mode"] == "append"
+    assert result["appended_weeks"] == 14
+    assert read_dataset(incremental, fmt) == read_dataset(full, fmt)
+
+
+@pytest.mark.parametrize("fmt", OUTPUT_FORMATS)
+def test_incremental_patch_matches_full(tmp_path, fmt):
+    incremental = str(tmp_path / f"incremental.{fmt}")
+    full = str(tmp_path / f"full.{fmt}")
+    schedule = dict(FEATURE_SCHEDULE, vault_integration=dict(FEATURE_SCHEDULE["vault_integration"], start=6))
+
+    write_dataset(incremental, 16, fmt=fmt)
+    result = update_dataset(incremental, 24, schedule=schedule, fmt=fmt)
+    write_dataset(full, 24, schedule=schedule, fmt=fmt)
+
+    assert result["mode"] == "patch"
+    assert result["recomputed_features"] == ["vault_integration"]
+    assert read_dataset(incremental, fmt) == read_dataset(full, fmt)
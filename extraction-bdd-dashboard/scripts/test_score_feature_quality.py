@@ -0,0 +1,95 @@
+"""
+Parity Tests for the Batch Quality Scorer
+Purpose: Keep region_layers in score_feature_quality.py a twin of lintFeature's layer detection
+
+The lint patterns are read from lib/skateboard-filesystem-parser.ts and run
+as Python regexes, so a pattern changed on one side fails here until the
+other side follows.
+
+Usage:
+    python -m pytest scripts/test_score_feature_quality.py
+"""
+
+import glob
+import os
+import re
+
+import pytest
+
+from score_feature_quality import SCENARIO_PATTERN, region_layers
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PARSER_PATH = os.path.join(PROJECT_DIR, "lib", "skateboard-filesystem-parser.ts")
+FEATURE_FILES = sorted(glob.glob(os.path.join(PROJECT_DIR, "features", "*.feature")))
+
+# lintFeature's pattern constant per layer
+LINT_PATTERNS = {
+    "functional": "FUNCTIONAL_PATTERN",
+    "reliable": "MEASURABLE_PATTERN",
+    "usable": "REAL_NAME_PATTERN",
+    "delightful": "DELIGHT_PATTERN",
+}
+
+JS_REGEX_CONSTANT = re.compile(r"^const (\w+_PATTERN) =\s*/(.+?)/([gimsuy]*);", re.MULTILINE)
+JS_FLAGS = {"i": re.IGNORECASE, "m": re.MULTILINE, "s": re.DOTALL}
+
+# Hits and near misses for every layer
+SAMPLES = [
+    "Then it works",
+    "  When it runs\n  Then it works",
+    "Thenceforth nothing",
+    "Given a page that loads in <2 seconds",
+    "Given a page that loads in < 2 seconds",
+    "Then >95% of specs pass",
+    "Given 12 Scenarios",
+    "Given 3 users",
+    "Given Bella opens the dashboard",
+    "Given bella opens the dashboard",
+    "Then Maya can ship on time",
+    "Then the user CAN see it",
+    "Then the user can",
+    "So that nobody waits",
+    "which enables reviews",
+    "Alice feels  confident",
+    "",
+]
+
+
+def lint_patterns():
+    with open(PARSER_PATH) as f:
+        source = f.read()
+    constants = {}
+    for name, body, flags in JS_REGEX_CONSTANT.findall(source):
+        compiled_flags = 0
+        for flag in flags:
+            compiled_flags |= JS_FLAGS.get(flag, 0)
+        constants[name] = re.compile(body, compiled_flags)
+    return {layer: constants[name] for layer, name in LINT_PATTERNS.items()}
+
+
+def lint_layers(patterns, text):
+    return {layer: pattern.search(text) is not None for layer, pattern in patterns.items()}
+
+
+def scenario_regions(content):
+    """The whole file, then the blocks score_content scores separately"""
+    bounds = [0] + [match.start() for match in SCENARIO_PATTERN.finditer(content)] + [len(content)]
+    return [content] + [content[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+def test_lint_patterns_found():
+    assert set(lint_patterns()) == set(LINT_PATTERNS)
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_region_layers_matches_lint_feature_on_samples(text):
+    assert region_layers(text) == lint_layers(lint_patterns(), text)
+
+
+@pytest.mark.parametrize("path", FEATURE_FILES, ids=os.path.basename)
+def test_region_layers_matches_lint_feature_on_features(path):
+    patterns = lint_patterns()
+    with open(path, encoding="utf-8", errors="replace") as f:
+        content = f.read()
+    for region in scenario_regions(content):
+        assert region_layers(region) == lint_layers(patterns, region)
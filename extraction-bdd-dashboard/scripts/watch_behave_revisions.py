@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Revision log of behave results for the dashboard change feed
+Watches behave-results.json and appends what changed (features, scenarios, steps) as numbered revisions
+
+Every time behave writes new results, the file is turned into the same
+features/scenarios/steps the /api/bdd/features route serves (same ids),
+diffed against the previous results, and the difference is appended to
+<output>/revisions.jsonl as one revision:
+
+    {"rev": 7, "generated_at": "...",
+     "features": [feature without scenarios, ...],
+     "scenarios": [scenario without steps, ...],
+     "steps": [step + scenario_id + feature_id, ...],
+     "removed": {"features": [id], "scenarios": [{id, feature_id}], "steps": [{id, scenario_id, feature_id}]}}
+
+Revision numbers only ever increase. head.json names the newest revision and
+the oldest one still in the log; GET /api/bdd/features/changes?since=<rev>
+merges the revisions after <rev> so a polling client only receives what
+changed. Results identical to the previous ones produce no revision. The log
+is compacted to the newest --max-revisions entries; a client further behind
+than that is told to reload the full payload.
+
+The first revision holds every feature, scenario and step (a diff against
+nothing). snapshot.json keeps the last diffed results so a restarted watcher
+carries on from the same revision; if it is lost, numbering continues but the
+log restarts with a full revision, so clients reload instead of merging.
+
+Usage:
+    python watch_behave_revisions.py --once
+    python watch_behave_revisions.py --interval 1
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from build_api_snapshots import DASHBOARD_DIR, DEFAULT_DUX_GOVERNANCE, DEFAULT_RESULTS, build_features, \
+    load_behaviors, now_iso
+
+DEFAULT_OUTPUT = os.path.join(DASHBOARD_DIR, "public", "bdd-data", "revisions")
+
+# Bump when the revision or head shape changes; must match
+# REVISIONS_SCHEMA in app/lib/behaveRevisions.ts
+REVISIONS_SCHEMA = 1
+
+LOG_FILE = "revisions.jsonl"
+HEAD_FILE = "head.json"
+SNAPSHOT_FILE = "snapshot.json"
+
+KINDS = ("features", "scenarios", "steps")
+
+
+def flatten(features: List[Dict]) -> Dict[str, Dict[str, Dict]]:
+    """{kind: {id: record}} with scenarios and steps lifted out of their parents"""
+    flat = {kind: {} for kind in KINDS}
+    for feature in features:
+        flat["features"][feature["id"]] = {k: v for k, v in feature.items() if k != "scenarios"}
+        for scenario in feature["scenarios"]:
+            flat["scenarios"][scenario["id"]] = {k: v for k, v in scenario.items() if k != "steps"}
+            for step in scenario["steps"]:
+                flat["steps"][step["id"]] = dict(step, scenario_id=scenario["id"], feature_id=feature["id"])
+    return flat
+
+
+def removed_entry(kind: str, record: Dict):
+    if kind == "features":
+        return record["id"]
+    if kind == "scenarios":
+        return {"id": record["id"], "feature_id": record["feature_id"]}
+    return {"id": record["id"], "scenario_id": record["scenario_id"], "feature_id": record["feature_id"]}
+
+
+def diff_snapshots(previous: Dict[str, Dict[str, Dict]], current: Dict[str, Dict[str, Dict]]) -> Optional[Dict]:
+    """Changed/added records and removed ids between two flattened results, None if identical"""
+    changes = {kind: [] for kind in KINDS}
+    changes["removed"] = {kind: [] for kind in KINDS}
+    for kind in KINDS:
+        before = previous.get(kind, {})
+        after = current[kind]
+        changes[kind] = [record for record_id, record in after.items() if before.get(record_id) != record]
+        changes["removed"][kind] = [removed_entry(kind, record)
+                                    for record_id, record in before.items() if record_id not in after]
+
+    if any(changes[kind] or changes["removed"][kind] for kind in KINDS):
+        return changes
+    return None
+
+
+def write_json(path: str, document: Dict) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(document, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def read_log(log_path: str) -> List[str]:
+    """Complete lines of the revision log (a torn final line is dropped)"""
+    try:
+        with open(log_path) as f:
+            return [line for line in f.read().split("\n")[:-1] if line]
+    except OSError:
+        return []
+
+
+def rewrite_log(log_path: str, lines: List[str]) -> None:
+    tmp_path = f"{log_path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write("".join(f"{line}\n" for line in lines))
+    os.replace(tmp_path, log_path)
+
+
+class RevisionLog:
+    """The revisions directory: append-only log, head pointer and last snapshot"""
+
+    def __init__(self, output_dir: str, max_revisions: int):
+        self.output_dir = output_dir
+        self.max_revisions = max_revisions
+        self.log_path = os.path.join(output_dir, LOG_FILE)
+        self.head_path = os.path.join(output_dir, HEAD_FILE)
+        self.snapshot_path = os.path.join(output_dir, SNAPSHOT_FILE)
+        os.makedirs(output_dir, exist_ok=True)
+
+        self.rev = 0
+        self.oldest = 1
+        self.snapshot = {kind: {} for kind in KINDS}
+        # Without a snapshot matching head the next revision is a full
+        # diff; it starts a fresh log so no client merges it with old ones
+        self.fresh = True
+        try:
+            with open(self.head_path) as f:
+                head = json.load(f)
+            if head.get("schema") == REVISIONS_SCHEMA:
+                self.rev = head["rev"]
+                self.oldest = head["oldest"]
+            with open(self.snapshot_path) as f:
+                snapshot = json.load(f)
+            if self.rev and snapshot.get("rev") == self.rev:
+                self.snapshot = snapshot["records"]
+                self.fresh = False
+        except (OSError, ValueError, KeyError):
+            pass
+
+        # Drop anything appended after the last published head (a crash
+        # between appending and publishing) so revision numbers stay unique
+        lines = read_log(self.log_path)
+        kept = [line for line in lines if json.loads(line)["rev"] <= self.rev]
+        if len(kept) != len(lines):
+            rewrite_log(self.log_path, kept)
+        self.count = len(kept)
+
+    def record(self, features: List[Dict]) -> Optional[int]:
+        """Append a revision for these results if anything changed; returns its number"""
+        current = flatten(features)
+        changes = diff_snapshots(self.snapshot, current)
+        if changes is None:
+            return None
+
+        rev = self.rev + 1
+        generated_at = now_iso()
+        entry = {"rev": rev, "generated_at": generated_at}
+        entry.update(changes)
+        if self.fresh:
+            rewrite_log(self.log_path, [])
+            self.count = 0
+            self.oldest = rev
+        with open(self.log_path, "a") as f:
+            f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.count += 1
+
+        if self.count > self.max_revisions:
+            lines = read_log(self.log_path)[-self.max_revisions:]
+            rewrite_log(self.log_path, lines)
+            self.count = len(lines)
+            self.oldest = json.loads(lines[0])["rev"]
+
+        # The snapshot is written before head so a restart never diffs
+        # against results older than the published revision
+        write_json(self.snapshot_path, {"rev": rev, "records": current})
+        write_json(self.head_path, {
+            "schema": REVISIONS_SCHEMA,
+            "rev": rev,
+            "oldest": self.oldest,
+            "generated_at": generated_at,
+            "log": LOG_FILE,
+        })
+        self.rev = rev
+        self.snapshot = current
+        self.fresh = False
+        return rev
+
+
+def input_signature(results_path: str, dux_governance: str) -> Tuple:
+    """mtime/size of the results and the DUX behaviors (they feed evidenceCount)"""
+    paths = [results_path]
+    behaviors_dir = os.path.join(dux_governance, "instances", "behaviors")
+    if os.path.isdir(behaviors_dir):
+        paths.extend(os.path.join(behaviors_dir, name) for name in sorted(os.listdir(behaviors_dir)))
+    signature = []
+    for path in paths:
+        try:
+            stats = os.stat(path)
+            signature.append((path, stats.st_mtime_ns, stats.st_size))
+        except OSError:
+            signature.append((path, None, None))
+    return tuple(signature)
+
+
+def update(log: RevisionLog, args) -> bool:
+    """Diff the current results into the log; False if they could not be read"""
+    started = time.perf_counter()
+    try:
+        with open(args.results) as f:
+            behave_results = json.load(f)
+        features = build_features(behave_results, load_behaviors(args.dux_governance))
+    except (OSError, ValueError) as error:
+        # behave may still be writing the file; the next poll retries
+        print(f"⚠️  Results skipped: {error}")
+        return False
+
+    rev = log.record(features)
+    if rev is None:
+        print("📊 Results unchanged")
+    else:
+        print(f"✅ Revision {rev} ({time.perf_counter() - started:.2f}s)")
+    return True
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Append behave result changes to the dashboard revision log")
+    parser.add_argument("--results", default=DEFAULT_RESULTS, help="behave-results.json")
+    parser.add_argument("--dux-governance", default=DEFAULT_DUX_GOVERNANCE, help="DUX-Governance checkout")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Revision log directory")
+    parser.add_argument("--max-revisions", type=int, default=500,
+                        help="Revisions kept in the log; older clients reload in full")
+    parser.add_argument("--interval", type=float, default=2.0, help="Seconds between results polls")
+    parser.add_argument("--once", action="store_true", help="Record the current results and exit")
+    args = parser.parse_args(argv)
+    if args.max_revisions < 1:
+        parser.error("--max-revisions must be at least 1")
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    log = RevisionLog(args.output, args.max_revisions)
+
+    signature = input_signature(args.results, args.dux_governance)
+    if not update(log, args) and args.once:
+        sys.exit(1)
+    print(f"📁 Output: {os.path.join(args.output, HEAD_FILE)} (revision {log.rev})")
+    if args.once:
+        sys.exit(0)
+
+    print(f"⏱️  Watching {args.results} every {args.interval:g}s (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(args.interval)
+            current = input_signature(args.results, args.dux_governance)
+            if current != signature:
+                # Only advance the signature once the results were read
+                if update(log, args):
+                    signature = current
+    except KeyboardInterrupt:
+        pass